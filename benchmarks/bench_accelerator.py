@@ -0,0 +1,65 @@
+"""Benchmark of compiled fast paths against the pure Python functions, which are `__wrapped__` of them.
+
+Build the extension before running: PYDANTICTYPES_BUILD_EXTENSION=1 python setup.py build_ext --inplace
+Validation by TypeAdapter is measured with the extension which is selected at import,
+so run also with environment variable PYDANTICTYPES_PURE_PYTHON=1 to compare it.
+
+Run: python -m benchmarks.bench_accelerator
+"""
+
+from __future__ import annotations
+
+from typing import Any
+from typing import Callable
+
+from pydantic import TypeAdapter
+
+from benchmarks.timer import measure_per_value
+from benchmarks.timer import report
+from pydantictypes._accelerator import IS_ACCELERATED
+from pydantictypes._east_asian_width import find_not_half_width
+from pydantictypes._validation_utils import validate_optional_string_type
+from pydantictypes.string_to_datetime import FixedFormatParser
+from pydantictypes.string_to_datetime import StringSlashToDateTime
+from pydantictypes.string_with_comma_to_int import StrictStringWithCommaToInt
+from pydantictypes.utility import Utility
+
+PARSER = FixedFormatParser(["%Y", "/", "%m", "/", "%d"])
+
+DATES = [f"20{year:02}/{month:02}/{day:02}" for year in range(25) for month in range(1, 13) for day in range(1, 29)]
+AMOUNTS = [f"{amount:,}" for amount in range(1, 3_000_000, 997)]
+CASES: dict[str, tuple[Callable[[Any], Any], list[Any]]] = {
+    "Utility.convert_string_with_comma_to_int": (Utility.convert_string_with_comma_to_int, AMOUNTS),
+    "Utility.convert_kanji_yen_string_to_int": (
+        Utility.convert_kanji_yen_string_to_int,
+        [f"{amount}円" for amount in AMOUNTS],
+    ),
+    "Utility.convert_symbol_yen_string_to_int": (
+        Utility.convert_symbol_yen_string_to_int,
+        [f"\\{amount}" for amount in AMOUNTS],
+    ),
+    "validate_optional_string_type": (validate_optional_string_type, ["Name", "", None] * 1_000),
+    "find_not_half_width, ASCII": (find_not_half_width, ["Tokyo Chiyoda 1-1"] * 3_000),
+    "FixedFormatParser.parse": (PARSER.parse, DATES),
+}
+
+
+def main() -> None:
+    for title, (function, values) in CASES.items() if IS_ACCELERATED else ():
+        report(
+            title,
+            {
+                "pure Python": measure_per_value(function.__wrapped__, values),  # type: ignore[attr-defined]
+                "compiled": measure_per_value(function, values),
+            },
+        )
+    for title, type_, values in (
+        ("StrictStringWithCommaToInt", StrictStringWithCommaToInt, AMOUNTS),
+        ("StringSlashToDateTime", StringSlashToDateTime, DATES),
+    ):
+        label = "compiled" if IS_ACCELERATED else "pure Python"
+        report(f"TypeAdapter of {title}", {label: measure_per_value(TypeAdapter(type_).validate_python, values)})
+
+
+if __name__ == "__main__":
+    main()
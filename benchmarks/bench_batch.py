@@ -0,0 +1,45 @@
+"""Benchmark of batch validation against validation of each value by TypeAdapter.
+
+Run: python -m benchmarks.bench_batch
+"""
+
+from __future__ import annotations
+
+import timeit
+from typing import Any
+
+from pydantic import TypeAdapter
+
+from benchmarks.timer import NANOSECONDS_PER_SECOND
+from benchmarks.timer import report
+from benchmarks.timer import suppress_errors
+from pydantictypes import StrictKanjiYenStringToInt
+from pydantictypes import validate_many
+
+VALUES = [f"{amount:,}円" for amount in range(1, 3_000_000, 97)]
+# 1% of rows are broken.
+VALUES_WITH_ERRORS = [value if index % 100 else "-" for index, value in enumerate(VALUES)]
+
+
+def measure_column(function: Any, values: list[str]) -> float:  # noqa: ANN401
+    best = min(timeit.repeat(lambda: function(values), number=1, repeat=5))
+    return best / len(values) * NANOSECONDS_PER_SECOND
+
+
+def main() -> None:
+    validate = suppress_errors(TypeAdapter(StrictKanjiYenStringToInt).validate_python)
+    for title, values in (("Valid column", VALUES), ("Column with 1% errors", VALUES_WITH_ERRORS)):
+        report(
+            title,
+            {
+                "TypeAdapter for each value": measure_column(lambda column: [validate(v) for v in column], values),
+                "validate_many": measure_column(
+                    lambda column: validate_many(StrictKanjiYenStringToInt, column),
+                    values,
+                ),
+            },
+        )
+
+
+if __name__ == "__main__":
+    main()
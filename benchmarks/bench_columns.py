@@ -0,0 +1,75 @@
+"""Benchmark of column adapters against applying TypeAdapter to each row of pandas Series.
+
+Columns of transactions repeat the same prices, dates and flags,
+and the column of distinct amounts is the worst case which validates every row.
+
+Run: python -m benchmarks.bench_columns
+"""
+
+from __future__ import annotations
+
+import random
+import timeit
+from typing import Any
+from typing import Callable
+
+import pandas as pd
+import pyarrow as pa
+from pydantic import TypeAdapter
+
+from benchmarks.timer import NANOSECONDS_PER_SECOND
+from benchmarks.timer import report
+from benchmarks.timer import suppress_errors
+from pydantictypes.columns import convert_arrow_array
+from pydantictypes.columns import convert_series
+from pydantictypes.kanji_yen_string_to_int import StrictKanjiYenStringToInt
+from pydantictypes.string_to_datetime import StringSlashToDateTime
+from pydantictypes.string_to_optional_bool import StringToOptionalBool
+from pydantictypes.string_with_comma_to_optional_int import StrictStringWithCommaToOptionalInt
+
+NUMBER_OF_ROWS = 300_000
+# Reason: Seeded to compare runs.
+RANDOM = random.Random(0)  # noqa: S311
+PRICES = [f"{price:,}円" for price in range(100, 1_000_000, 100)]
+DATES = [f"20{year:02}/{month:02}/{day:02}" for year in (24, 25) for month in range(1, 13) for day in range(1, 29)]
+COLUMNS: dict[str, tuple[Any, list[str]]] = {
+    "StrictKanjiYenStringToInt, 9,999 prices": (
+        StrictKanjiYenStringToInt,
+        RANDOM.choices(PRICES, k=NUMBER_OF_ROWS),
+    ),
+    "StringSlashToDateTime, 672 dates": (StringSlashToDateTime, RANDOM.choices(DATES, k=NUMBER_OF_ROWS)),
+    "StringToOptionalBool, 3 flags": (StringToOptionalBool, RANDOM.choices(["1", "0", ""], k=NUMBER_OF_ROWS)),
+    "StrictStringWithCommaToOptionalInt, distinct amounts": (
+        StrictStringWithCommaToOptionalInt,
+        [f"{amount:,}" for amount in range(NUMBER_OF_ROWS)],
+    ),
+}
+
+
+def measure_column(function: Callable[[], Any]) -> float:
+    best = min(timeit.repeat(function, number=1, repeat=3))
+    return best / NUMBER_OF_ROWS * NANOSECONDS_PER_SECOND
+
+
+# Reason: The argument of pydantic type
+def compare(title: str, type_: Any, values: list[str]) -> None:  # noqa: ANN401
+    series = pd.Series(values)
+    array = pa.array(values)
+    validate = suppress_errors(TypeAdapter(type_).validate_python)
+    report(
+        title,
+        {
+            "Series.apply": measure_column(lambda: series.apply(validate)),
+            "convert_series": measure_column(lambda: convert_series(type_, series)),
+            "convert_arrow_array": measure_column(lambda: convert_arrow_array(type_, array)),
+        },
+    )
+
+
+def main() -> None:
+    for title, (type_, values) in COLUMNS.items():
+        compare(title, type_, values)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Benchmark of failure paths on dirty data, where a quarter of values are invalid.
+
+Errors are caught and counted but not rendered, as pipelines which only count or skip invalid rows do,
+and then rendered, as pipelines which report invalid rows do.
+
+Run: python -m benchmarks.bench_errors
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from pydantic import TypeAdapter
+from pydantic import ValidationError
+
+from benchmarks.timer import measure_per_value
+from benchmarks.timer import report
+from pydantictypes.batch import validate_many
+from pydantictypes.half_width_string import HalfWidthString
+from pydantictypes.half_width_string import OptionalHalfWidthString
+from pydantictypes.kanji_yen_string_to_int import StrictKanjiYenStringToInt
+from pydantictypes.string_to_optional_str import constringtooptionalstr
+from pydantictypes.string_with_comma_to_optional_int import StrictStringWithCommaToOptionalInt
+from pydantictypes.string_with_length_constraint import constrained_optional_string
+
+NUMBER_OF_VALUES = 10_000
+# Large value which arrives where string is expected, for example, a nested record of JSON.
+LARGE_VALUE = {"items": list(range(1_000))}
+
+CASES: dict[str, tuple[Any, list[Any], Any]] = {
+    "StrictKanjiYenStringToInt": (StrictKanjiYenStringToInt, ["1,000円", "2円", "3円"], "1.0円"),
+    "OptionalHalfWidthString": (OptionalHalfWidthString, ["abc", "ｱｲｳ", ""], "あいう"),
+    "constrained_optional_string": (constrained_optional_string(max_length=4), ["abc", "a", ""], "abcde"),
+    "constringtooptionalstr": (constringtooptionalstr(regex=r"^[a-z]+$"), ["abc", "a", ""], "ABC"),
+    "StrictStringWithCommaToOptionalInt, large": (StrictStringWithCommaToOptionalInt, ["1,000", "1", ""], LARGE_VALUE),
+    "OptionalHalfWidthString, large": (OptionalHalfWidthString, ["abc", "ｱｲｳ", ""], LARGE_VALUE),
+    "StrictKanjiYenStringToInt, large": (StrictKanjiYenStringToInt, ["1,000円", "2円", "3円"], LARGE_VALUE),
+    "HalfWidthString, large": (HalfWidthString, ["abc", "ｱｲｳ", "ｺｰﾄﾞ"], LARGE_VALUE),
+}
+
+
+# Reason: The argument of pydantic type
+def dirty(valid: list[Any], invalid: Any) -> list[Any]:  # noqa: ANN401
+    """Return values where every fourth value is invalid."""
+    return [*valid, invalid] * (NUMBER_OF_VALUES // (len(valid) + 1))
+
+
+# Reason: The argument of pydantic type
+def measure(type_: Any, values: list[Any], invalid: Any) -> dict[str, float]:  # noqa: ANN401
+    adapter = TypeAdapter(type_)
+
+    # Reason: The argument of pydantic type
+    def count_errors(value: Any) -> int:  # noqa: ANN401
+        try:
+            adapter.validate_python(value)
+        except ValidationError as error:
+            return error.error_count()
+        return 0
+
+    # Reason: The argument of pydantic type
+    def render_errors(value: Any) -> str:  # noqa: ANN401
+        try:
+            adapter.validate_python(value)
+        except ValidationError as error:
+            return error.errors(include_url=False)[0]["msg"]
+        return ""
+
+    return {
+        "only valid": measure_per_value(adapter.validate_python, [value for value in values if value != invalid]),
+        "count errors": measure_per_value(count_errors, values),
+        "render errors": measure_per_value(render_errors, values),
+        "validate_many": measure_per_value(lambda column: validate_many(type_, column), [values]) / len(values),
+    }
+
+
+def main() -> None:
+    for name, (type_, valid, invalid) in CASES.items():
+        report(f"{name}, 25% invalid", measure(type_, dirty(valid, invalid), invalid))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Benchmark of HalfWidthString validation against the previous loop over unicodedata.
+
+Run: python -m benchmarks.bench_half_width
+"""
+
+from __future__ import annotations
+
+import unicodedata
+
+from benchmarks.timer import measure_per_value
+from benchmarks.timer import report
+from benchmarks.timer import suppress_errors
+from pydantictypes.half_width_string import HalfWidthValidator
+
+# Product descriptions.
+ASCII_VALUES = [f"Product {index:05}: cotton T-shirt, size M, color navy. Machine washable." for index in range(3_000)]
+KATAKANA_VALUES = [f"ｼｮｳﾋﾝ {index:05}: ﾒﾝ Tｼｬﾂ, ｻｲｽﾞ M, ｶﾗｰ ﾈｲﾋﾞｰ. ｾﾝﾀｸｷ OK." for index in range(3_000)]
+INVALID_VALUES = [f"{value}ｾﾝﾀｸｷ OK。" for value in ASCII_VALUES]
+
+
+def previous_validate(value: str) -> str:
+    """Validate by HalfWidthValidator before the precompiled pattern."""
+    if not isinstance(value, str):
+        msg = f"String required. Value is {value}. Type is {type(value)}."
+        raise TypeError(msg)
+    for char in value:
+        width = unicodedata.east_asian_width(char)
+        if width in ["W", "F", "A"]:
+            msg = "Must contain only half-width characters."
+            raise ValueError(msg)
+    return value
+
+
+def main() -> None:
+    validate = HalfWidthValidator().validate
+    for title, values in (
+        ("ASCII", ASCII_VALUES),
+        ("Half-width katakana", KATAKANA_VALUES),
+        ("Full-width at the end", INVALID_VALUES),
+    ):
+        report(
+            title,
+            {
+                "previous": measure_per_value(suppress_errors(previous_validate), values),
+                "precompiled": measure_per_value(suppress_errors(validate), values),
+            },
+        )
+
+
+if __name__ == "__main__":
+    main()
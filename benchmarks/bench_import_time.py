@@ -0,0 +1,81 @@
+"""Benchmark of import time of the package by `python -X importtime`.
+
+Run: python -m benchmarks.bench_import_time
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+from benchmarks.timer import report
+
+# Importing every module is the behavior before lazy import.
+STATEMENT_IMPORT_ALL = "import " + ", ".join(
+    f"pydantictypes.{module_name}"
+    for module_name in (
+        "empty_string_to_none",
+        "half_width_string",
+        "kanji_yen_string_to_int",
+        "string_to_datetime",
+        "string_to_optional_bool",
+        "string_to_optional_int",
+        "string_to_optional_str",
+        "string_with_comma_to_int",
+        "string_with_comma_to_optional_int",
+        "string_with_length_constraint",
+        "symbol_yen_string_to_int",
+    )
+)
+STATEMENTS = {
+    "all modules": STATEMENT_IMPORT_ALL,
+    "import pydantictypes": "import pydantictypes",
+    "HalfWidthString": "from pydantictypes import HalfWidthString",
+    "StrictKanjiYenStringToInt": "from pydantictypes import StrictKanjiYenStringToInt",
+    "StrictSymbolYenStringToInt": "from pydantictypes import StrictSymbolYenStringToInt",
+}
+REPEAT = 10
+
+
+def run_with_import_time(statement: str) -> dict[str, int]:
+    """Return cumulative microseconds of top-level imports reported by `python -X importtime`."""
+    completed = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    cumulative_microseconds = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line[len("import time:") :].split("|")
+        # Nested imports are indented and are included in cumulative time of top-level import.
+        if not module.startswith("  "):
+            cumulative_microseconds[module.strip()] = int(cumulative)
+    return cumulative_microseconds
+
+
+def measure_import_time(statement: str, startup_modules: set[str]) -> float:
+    """Return the best total microseconds of top-level imports by statement excluding startup of interpreter."""
+    return min(
+        sum(
+            cumulative
+            for module, cumulative in run_with_import_time(statement).items()
+            if module not in startup_modules
+        )
+        for _ in range(REPEAT)
+    )
+
+
+def main() -> None:
+    startup_modules = set(run_with_import_time("pass"))
+    report(
+        "Import time",
+        {label: measure_import_time(statement, startup_modules) for label, statement in STATEMENTS.items()},
+        unit="us",
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Benchmark of memoized types against the original types for realistic distributions of amounts.
+
+Amounts in business data such as prices and fees repeat heavily,
+so values are drawn from a Zipf distribution over a catalog of amounts, with invalid values mixed in.
+
+Run: python -m benchmarks.bench_memoized
+"""
+
+from __future__ import annotations
+
+import random
+from typing import Any
+from typing import Callable
+
+from pydantic import TypeAdapter
+
+from benchmarks.timer import measure_per_value
+from benchmarks.timer import report
+from benchmarks.timer import suppress_errors
+from pydantictypes.kanji_yen_string_to_int import StrictKanjiYenStringToInt
+from pydantictypes.memoized import cache_statistics
+from pydantictypes.memoized import memoize
+from pydantictypes.string_with_comma_to_int import StrictStringWithCommaToInt
+from pydantictypes.symbol_yen_string_to_int import StrictSymbolYenStringToInt
+
+NUMBER_OF_VALUES = 100_000
+RATIO_OF_INVALID = 0.01
+
+TYPES: dict[str, tuple[Any, Callable[[int], str], str]] = {
+    "StrictKanjiYenStringToInt": (StrictKanjiYenStringToInt, "{:,}円".format, "{}.5円"),
+    "StrictSymbolYenStringToInt": (StrictSymbolYenStringToInt, "\\{:,}".format, "\\{}.5"),
+    "StrictStringWithCommaToInt": (StrictStringWithCommaToInt, "{:,}".format, "{}.5"),
+}
+
+
+def zipf_values(format_: Callable[[int], str], invalid_format: str, catalog_size: int) -> list[str]:
+    """Draw values whose amounts follow a Zipf distribution over a catalog of amounts."""
+    # Reason: Reproducible values for benchmark.
+    generator = random.Random(0)  # noqa: S311
+    catalog = [generator.randrange(100, 1_000_000, 10) for _ in range(catalog_size)]
+    weights = [1 / rank for rank in range(1, catalog_size + 1)]
+    amounts = generator.choices(catalog, weights, k=NUMBER_OF_VALUES)
+    return [
+        invalid_format.format(amount) if generator.random() < RATIO_OF_INVALID else format_(amount)
+        for amount in amounts
+    ]
+
+
+def main() -> None:
+    for name, (type_, format_, invalid_format) in TYPES.items():
+        for catalog_size in (100, 10_000, 1_000_000):
+            values = zipf_values(format_, invalid_format, catalog_size)
+            memoized = memoize(type_)
+            results = {
+                "original": measure_per_value(suppress_errors(TypeAdapter(type_).validate_python), values),
+                "memoized": measure_per_value(suppress_errors(TypeAdapter(memoized).validate_python), values),
+            }
+            statistics = cache_statistics(memoized)
+            report(
+                f"{name}, {catalog_size:,} amounts, hit ratio {statistics.hits / (statistics.hits + statistics.misses):.0%}",
+                results,
+            )
+
+
+if __name__ == "__main__":
+    main()
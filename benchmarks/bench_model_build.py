@@ -0,0 +1,101 @@
+"""Benchmark of creating wide model class whose fields are pydantictypes against plain builtins.
+
+Each model has 50 fields which cycle through the types.
+The builtins model has the type which each pydantictypes type returns, such as `Optional[int]`.
+The previous model replaces `CachedBeforeValidator` with `BeforeValidator`,
+which inspects the validator for each field.
+
+Run: python -m benchmarks.bench_model_build
+"""
+
+from __future__ import annotations
+
+import timeit
+from datetime import datetime
+from typing import Any
+from typing import Optional
+
+from pydantic import BeforeValidator
+from pydantic import create_model
+
+from benchmarks.timer import report
+from pydantictypes._cached_schema import CachedBeforeValidator
+from pydantictypes.empty_string_to_none import EmptyStringToNone
+from pydantictypes.half_width_string import OptionalHalfWidthString
+from pydantictypes.kanji_yen_string_to_int import StrictKanjiYenStringToInt
+from pydantictypes.string_to_datetime import StringSlashToDateTime
+from pydantictypes.string_to_optional_bool import StringToOptionalBool
+from pydantictypes.string_to_optional_int import ConstrainedStringToOptionalInt
+from pydantictypes.string_to_optional_str import StringToOptionalStr
+from pydantictypes.string_with_comma_to_int import NativeStrictStringWithCommaToInt
+from pydantictypes.string_with_comma_to_optional_int import StrictStringWithCommaToOptionalInt
+from pydantictypes.string_with_length_constraint import ConstrainedStringWithLength
+from pydantictypes.symbol_yen_string_to_int import SymbolYenStringToInt
+
+try:
+    from typing import Annotated
+except ImportError:
+    from typing_extensions import Annotated
+
+NUMBER_OF_FIELDS = 50
+MILLISECONDS_PER_SECOND = 1_000
+
+# Pairs of pydantictypes type and the builtin type which it returns, by name.
+TYPES: dict[str, tuple[Any, Any]] = {
+    "StrictKanjiYenStringToInt": (StrictKanjiYenStringToInt, int),
+    "SymbolYenStringToInt": (SymbolYenStringToInt, int),
+    "NativeStrictStringWithCommaToInt": (NativeStrictStringWithCommaToInt, int),
+    "StrictStringWithCommaToOptionalInt": (StrictStringWithCommaToOptionalInt, Optional[int]),
+    "ConstrainedStringToOptionalInt": (ConstrainedStringToOptionalInt, Optional[int]),
+    "StringToOptionalStr": (StringToOptionalStr, Optional[str]),
+    "OptionalHalfWidthString": (OptionalHalfWidthString, Optional[str]),
+    "ConstrainedStringWithLength": (ConstrainedStringWithLength, str),
+    "StringToOptionalBool": (StringToOptionalBool, Optional[bool]),
+    "StringSlashToDateTime": (StringSlashToDateTime, datetime),
+    "EmptyStringToNone": (EmptyStringToNone, None),
+}
+
+
+# Reason: The argument of pydantic type
+def previous(type_: Any) -> Any:  # noqa: ANN401
+    """Return the type which has `BeforeValidator` instead of `CachedBeforeValidator`."""
+    metadata = getattr(type_, "__metadata__", None)
+    if metadata is None:
+        return type_
+    replaced = tuple(
+        BeforeValidator(item.func) if isinstance(item, CachedBeforeValidator) else item for item in metadata
+    )
+    return Annotated[(type_.__origin__, *replaced)]
+
+
+def measure(types: list[Any]) -> float:
+    """Measure the best milliseconds to create model class with fields of types."""
+    fields: dict[str, Any] = {f"field_{index}": (types[index % len(types)], ...) for index in range(NUMBER_OF_FIELDS)}
+    best = min(timeit.repeat(lambda: create_model("Wide", **fields), number=10, repeat=5)) / 10
+    return best * MILLISECONDS_PER_SECOND
+
+
+def main() -> None:
+    report(
+        f"create model class of {NUMBER_OF_FIELDS} fields",
+        {
+            "builtins": measure([builtin for _, builtin in TYPES.values()]),
+            "pydantictypes": measure([type_ for type_, _ in TYPES.values()]),
+            "previous": measure([previous(type_) for type_, _ in TYPES.values()]),
+        },
+        unit="ms",
+    )
+    for name, (type_, builtin) in TYPES.items():
+        report(
+            f"{NUMBER_OF_FIELDS} fields of {name}",
+            {
+                "builtins": measure([builtin]),
+                "pydantictypes": measure([type_]),
+                "previous": measure([previous(type_)]),
+            },
+            unit="ms",
+        )
+
+
+if __name__ == "__main__":
+    main()
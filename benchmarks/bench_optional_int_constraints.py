@@ -0,0 +1,86 @@
+"""Benchmark of compiled constraint checks against the previous checks of all constraints for each value.
+
+Run: python -m benchmarks.bench_optional_int_constraints
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from benchmarks.timer import measure_per_value
+from benchmarks.timer import report
+from pydantictypes._validation_utils import validate_optional_string_type
+from pydantictypes.abstract_string_to_optional_int import OptionalIntegerMustBeFromStr
+from pydantictypes.utility import Utility
+
+VALUES = [f"{amount:,}" for amount in range(0, 3_000_000, 97)]
+
+CONSTRAINTS: dict[str, dict[str, int]] = {
+    "0 constraints": {},
+    "1 constraint": {"ge": 0},
+    "5 constraints": {"gt": -1, "ge": 0, "lt": 10_000_000, "le": 9_999_999, "multiple_of": 1},
+}
+
+
+def _check_gt_constraint(value: int, gt: int | None) -> None:
+    if gt is not None and not value > gt:
+        msg = f"Input should be greater than {gt}"
+        raise ValueError(msg)
+
+
+def _check_ge_constraint(value: int, ge: int | None) -> None:
+    if ge is not None and not value >= ge:
+        msg = f"Input should be greater than or equal to {ge}"
+        raise ValueError(msg)
+
+
+def _check_lt_constraint(value: int, lt: int | None) -> None:
+    if lt is not None and not value < lt:
+        msg = f"Input should be less than {lt}"
+        raise ValueError(msg)
+
+
+def _check_le_constraint(value: int, le: int | None) -> None:
+    if le is not None and not value <= le:
+        msg = f"Input should be less than or equal to {le}"
+        raise ValueError(msg)
+
+
+def _check_multiple_of_constraint(value: int, multiple_of: int | None) -> None:
+    if multiple_of is not None and value % multiple_of != 0:
+        msg = f"Input should be a multiple of {multiple_of}"
+        raise ValueError(msg)
+
+
+class PreviousOptionalIntegerMustBeFromStr(OptionalIntegerMustBeFromStr):
+    """OptionalIntegerMustBeFromStr before constraint checks were compiled."""
+
+    # Reason: The argument of pydantic type
+    def validate(self, value: Any) -> int | None:  # noqa: ANN401
+        validated = validate_optional_string_type(value)
+        if validated is None:
+            return None
+        result = self.string_to_int(validated)
+        _check_gt_constraint(result, self.gt)
+        _check_ge_constraint(result, self.ge)
+        _check_lt_constraint(result, self.lt)
+        _check_le_constraint(result, self.le)
+        _check_multiple_of_constraint(result, self.multiple_of)
+        return result
+
+
+def main() -> None:
+    for title, constraints in CONSTRAINTS.items():
+        previous = PreviousOptionalIntegerMustBeFromStr(Utility.convert_string_with_comma_to_int, **constraints)
+        compiled = OptionalIntegerMustBeFromStr(Utility.convert_string_with_comma_to_int, **constraints)
+        report(
+            title,
+            {
+                "previous": measure_per_value(previous.validate, VALUES),
+                "compiled": measure_per_value(compiled.validate, VALUES),
+            },
+        )
+
+
+if __name__ == "__main__":
+    main()
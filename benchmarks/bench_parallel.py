@@ -0,0 +1,63 @@
+"""Benchmark of parallel validation of CSV file by 1, 2, 4 and 8 worker processes against serial validation.
+
+Speedup is bounded by the number of CPUs of the machine.
+
+Run: python -m benchmarks.bench_parallel
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import timeit
+from functools import partial
+from pathlib import Path
+from typing import Any
+from typing import Callable
+
+from benchmarks.timer import NANOSECONDS_PER_SECOND
+from benchmarks.timer import report
+from pydantictypes import HalfWidthString
+from pydantictypes import StrictKanjiYenStringToInt
+from pydantictypes import StringSlashToDateTime
+from pydantictypes.io import read_csv_batches
+from pydantictypes.io import read_csv_parallel
+
+NUMBER_OF_ROWS = 200_000
+COLUMNS = {"利用日": StringSlashToDateTime, "利用店名": HalfWidthString, "利用金額": StrictKanjiYenStringToInt}
+
+
+def write_statement(path: Path) -> None:
+    rows = (
+        f'2020/{index % 12 + 1:02}/{index % 28 + 1:02},ｺﾝﾋﾞﾆ {index % 1000},"{index * 7:,}円"\r\n'
+        for index in range(NUMBER_OF_ROWS)
+    )
+    path.write_bytes(("利用日,利用店名,利用金額\r\n" + "".join(rows)).encode("cp932"))
+
+
+def measure_file(read: Callable[[], Any]) -> float:
+    """Measure the best nanoseconds per row of reading whole file."""
+
+    def run() -> None:
+        for _ in read():
+            pass
+
+    best = min(timeit.repeat(run, number=1, repeat=3))
+    return best / NUMBER_OF_ROWS * NANOSECONDS_PER_SECOND
+
+
+def main() -> None:
+    print(f"CPUs: {os.cpu_count()}")  # noqa: T201
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "statement.csv"
+        write_statement(path)
+        results = {"serial": measure_file(partial(read_csv_batches, path, COLUMNS, encoding="cp932"))}
+        for workers in (1, 2, 4, 8):
+            results[f"{workers} workers"] = measure_file(
+                partial(read_csv_parallel, path, COLUMNS, max_workers=workers, encoding="cp932"),
+            )
+        report(f"{NUMBER_OF_ROWS:,} rows", results, unit="ns/row")
+
+
+if __name__ == "__main__":
+    main()
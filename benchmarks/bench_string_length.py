@@ -0,0 +1,115 @@
+"""Benchmark of compiled length checks against the previous checks of all constraints for each value.
+
+The previous checks created a comparison function for each constraint on every call.
+Allocation is measured as the peak of memory traced by tracemalloc during one call on the success path.
+Types are also compared via TypeAdapter with the type whose constraints are checked inside pydantic-core.
+
+Run: python -m benchmarks.bench_string_length
+"""
+
+from __future__ import annotations
+
+from typing import Any
+from typing import Callable
+
+from pydantic import TypeAdapter
+from pydantic_core import PydanticCustomError
+
+from benchmarks.timer import measure_peak_bytes
+from benchmarks.timer import measure_per_value
+from benchmarks.timer import report
+from pydantictypes.string_with_length_constraint import StringLengthValidator
+from pydantictypes.string_with_length_constraint import constrained_string
+from pydantictypes.string_with_length_constraint import native_constrained_string
+
+VALUES = ["a" * (length % 8 + 1) for length in range(100_000)]
+
+CONSTRAINTS: dict[str, dict[str, int]] = {
+    "0 constraints": {},
+    "1 constraint": {"max_length": 8},
+    "3 constraints": {"min_length": 1, "max_length": 8, "equal_to": 4},
+}
+
+_LENGTH_ERRORS = {
+    "equal_to": ("string_length_equal_to", "String length must be equal to {equal_to}"),
+    "min_length": ("string_length_too_short", "String length must be at least {min_length}"),
+    "max_length": ("string_length_too_long", "String length must be at most {max_length}"),
+}
+
+
+def _validate_length_constraint(
+    *,
+    length: int,
+    constraint_value: int | None,
+    condition: Callable[[int, int], bool],
+    constraint_name: str,
+) -> None:
+    if constraint_value is None:
+        return
+    if condition(length, constraint_value):
+        error_type, message_template = _LENGTH_ERRORS[constraint_name]
+        raise PydanticCustomError(error_type, message_template, {constraint_name: constraint_value})
+
+
+class PreviousStringLengthValidator(StringLengthValidator):
+    """StringLengthValidator before length checks were compiled."""
+
+    # Reason: The argument of pydantic type
+    def validate(self, value: Any) -> str:  # noqa: ANN401
+        if not isinstance(value, str):
+            msg = f"String required. Value is {value}. Type is {type(value)}."
+            raise TypeError(msg)
+        length = len(value)
+        _validate_length_constraint(
+            length=length,
+            constraint_value=self.equal_to,
+            condition=lambda a, b: a != b,
+            constraint_name="equal_to",
+        )
+        _validate_length_constraint(
+            length=length,
+            constraint_value=self.min_length,
+            condition=lambda a, b: a < b,
+            constraint_name="min_length",
+        )
+        _validate_length_constraint(
+            length=length,
+            constraint_value=self.max_length,
+            condition=lambda a, b: a > b,
+            constraint_name="max_length",
+        )
+        return value
+
+
+def main() -> None:
+    for title, constraints in CONSTRAINTS.items():
+        previous = PreviousStringLengthValidator(**constraints)
+        compiled = StringLengthValidator(**constraints)
+        valid = [value for value in VALUES if len(value) == constraints.get("equal_to", len(value))]
+        report(
+            title,
+            {
+                "previous": measure_per_value(previous.validate, valid),
+                "compiled": measure_per_value(compiled.validate, valid),
+            },
+        )
+        for label, validator in (("previous", previous), ("compiled", compiled)):
+            print(f"{label} peak allocation per call: {measure_peak_bytes(validator.validate, valid[0])} bytes")  # noqa: T201
+        print()  # noqa: T201
+        report(
+            f"{title} via TypeAdapter",
+            {
+                "constrained_string": measure_per_value(
+                    TypeAdapter(constrained_string(**constraints)).validate_python,
+                    valid,
+                ),
+                "native_constrained_string": measure_per_value(
+                    TypeAdapter(native_constrained_string(**constraints)).validate_python,
+                    valid,
+                ),
+            },
+        )
+
+
+if __name__ == "__main__":
+    main()
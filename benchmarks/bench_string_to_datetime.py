@@ -0,0 +1,69 @@
+"""Benchmark of StringToDateTime parsing by slicing against strptime, and with cache against without cache.
+
+Run: python -m benchmarks.bench_string_to_datetime
+"""
+
+from __future__ import annotations
+
+import datetime
+
+from benchmarks.timer import measure_per_value
+from benchmarks.timer import report
+from pydantictypes.string_to_datetime import StringNumberOnlyToDateTime
+from pydantictypes.string_to_datetime import StringSlashToDateTime
+
+DATES = [datetime.date(2020, 1, 1) + datetime.timedelta(days=days) for days in range(3_000)]
+SLASH_VALUES = [date.strftime("%Y/%m/%d") for date in DATES]
+NUMBER_ONLY_VALUES = [date.strftime("%Y%m%d") for date in DATES]
+# Ledger whose rows have fewer than 400 distinct dates.
+LEDGER_VALUES = SLASH_VALUES[:400] * 250
+
+
+class CachedStringSlashToDateTime(StringSlashToDateTime):
+    """StringSlashToDateTime with cache."""
+
+
+CachedStringSlashToDateTime.enable_cache(maxsize=1024)
+
+
+def previous_parse_slash(value: str) -> datetime.datetime:
+    """Parse by StringSlashToDateTime.validate before parsing by slicing."""
+    # Reason: Time is not used in this process.
+    return datetime.datetime.strptime(StringSlashToDateTime.datetime_must_be_from_str(value), "%Y/%m/%d")  # noqa: DTZ007
+
+
+def previous_parse_number_only(value: str) -> datetime.datetime:
+    """Parse by StringNumberOnlyToDateTime.validate before parsing by slicing."""
+    value = StringNumberOnlyToDateTime.eight_digits_required(
+        StringNumberOnlyToDateTime.datetime_must_be_from_str(value),
+    )
+    # Reason: Time is not used in this process.
+    return datetime.datetime.strptime(value, "%Y%m%d")  # noqa: DTZ007
+
+
+def main() -> None:
+    report(
+        "YYYY/MM/DD",
+        {
+            "strptime": measure_per_value(previous_parse_slash, SLASH_VALUES),
+            "slicing": measure_per_value(StringSlashToDateTime.validate, SLASH_VALUES),
+        },
+    )
+    report(
+        "YYYYMMDD",
+        {
+            "strptime": measure_per_value(previous_parse_number_only, NUMBER_ONLY_VALUES),
+            "slicing": measure_per_value(StringNumberOnlyToDateTime.validate, NUMBER_ONLY_VALUES),
+        },
+    )
+    report(
+        "YYYY/MM/DD, 400 distinct values",
+        {
+            "without cache": measure_per_value(StringSlashToDateTime.validate_with_cache, LEDGER_VALUES),
+            "with cache": measure_per_value(CachedStringSlashToDateTime.validate_with_cache, LEDGER_VALUES),
+        },
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Benchmark of compiled transformations against the previous transformations of all options for each value.
+
+The previous transformations checked each option on every call and copied the string by each active one.
+Allocation is measured as the peak of memory traced by tracemalloc during one call for long value.
+
+Run: python -m benchmarks.bench_string_to_optional_str
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from pydantic_core import PydanticCustomError
+
+from benchmarks.timer import measure_peak_bytes
+from benchmarks.timer import measure_per_value
+from benchmarks.timer import report
+from pydantictypes._validation_utils import validate_optional_string_type
+from pydantictypes.string_to_optional_str import StringToOptionalStrValidator
+
+VALUES = [f" product-{number:06d} " for number in range(100_000)]
+LONG_VALUE = " " + "Product-" * 1_000 + " "
+
+OPTIONS: dict[str, dict[str, Any]] = {
+    "no options": {},
+    "strip": {"strip_whitespace": True},
+    "strip, lower, curtail": {"strip_whitespace": True, "to_lower": True, "curtail_length": 10},
+    "strip, lower, curtail, length, regex": {
+        "strip_whitespace": True,
+        "to_lower": True,
+        "curtail_length": 10,
+        "min_length": 1,
+        "max_length": 10,
+        "regex": r"^[a-z-]+",
+    },
+}
+
+
+class PreviousStringToOptionalStrValidator(StringToOptionalStrValidator):
+    """StringToOptionalStrValidator before transformations and constraints were compiled."""
+
+    def _apply_transformations(self, value: str) -> str:
+        if self.strip_whitespace:
+            value = value.strip()
+        if self.to_lower:
+            value = value.lower()
+        if self.curtail_length is not None:
+            value = value[: self.curtail_length]
+        return value
+
+    def _validate_length(self, value: str) -> None:
+        length = len(value)
+        if self.min_length is not None and length < self.min_length:
+            error_type = "string_length_too_short"
+            msg = "String length must be at least {min_length}"
+            raise PydanticCustomError(error_type, msg, {"min_length": self.min_length})
+        if self.max_length is not None and length > self.max_length:
+            error_type = "string_length_too_long"
+            msg = "String length must be at most {max_length}"
+            raise PydanticCustomError(error_type, msg, {"max_length": self.max_length})
+
+    def _validate_pattern(self, value: str) -> None:
+        if self.regex is not None and not self.regex.match(value):
+            error_type = "string_pattern"
+            msg = "String does not match pattern {pattern}"
+            raise PydanticCustomError(error_type, msg, {"pattern": self.regex.pattern})
+
+    # Reason: The argument of pydantic type
+    def validate(self, value: Any) -> str | None:  # noqa: ANN401
+        if value is None:
+            msg = f"String required. Value is {value}. Type is {type(value)}."
+            raise TypeError(msg)
+        validated = validate_optional_string_type(value)
+        if validated is None:
+            return None
+        validated = self._apply_transformations(validated)
+        self._validate_length(validated)
+        self._validate_pattern(validated)
+        return validated
+
+
+def main() -> None:
+    for title, options in OPTIONS.items():
+        previous = PreviousStringToOptionalStrValidator(**options)
+        compiled = StringToOptionalStrValidator(**options)
+        report(
+            title,
+            {
+                "previous": measure_per_value(previous.validate, VALUES),
+                "compiled": measure_per_value(compiled.validate, VALUES),
+            },
+        )
+        for label, validator in (("previous", previous), ("compiled", compiled)):
+            peak = measure_peak_bytes(validator.validate, LONG_VALUE)
+            print(f"{label} peak allocation per call of {len(LONG_VALUE):,} characters: {peak:,} bytes")  # noqa: T201
+        print()  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""Benchmark of composed pydantic-core schema against Python callback for StrictStringWithCommaToInt.
+
+Run: python -m benchmarks.bench_string_with_comma_to_int
+"""
+
+from __future__ import annotations
+
+from pydantic import TypeAdapter
+
+from benchmarks.timer import measure_per_value
+from benchmarks.timer import report
+from pydantictypes.string_with_comma_to_int import NativeStrictStringWithCommaToInt
+from pydantictypes.string_with_comma_to_int import StrictStringWithCommaToInt
+
+# Typical CSV columns: counts and codes without comma, amounts with comma.
+VALUES_WITHOUT_COMMA = [str(number) for number in range(0, 100_000, 7)]
+VALUES_WITH_COMMA = [f"{number:,}" for number in range(1_000, 10_000_000, 701)]
+VALUES_MIXED = [value for pair in zip(VALUES_WITHOUT_COMMA, VALUES_WITH_COMMA) for value in pair]
+
+
+def main() -> None:
+    callback = TypeAdapter(StrictStringWithCommaToInt).validate_python
+    native = TypeAdapter(NativeStrictStringWithCommaToInt).validate_python
+    for title, values in (
+        ("Without comma", VALUES_WITHOUT_COMMA),
+        ("With comma", VALUES_WITH_COMMA),
+        ("Mixed", VALUES_MIXED),
+    ):
+        report(
+            title,
+            {
+                "StrictStringWithCommaToInt": measure_per_value(callback, values),
+                "NativeStrictStringWithCommaToInt": measure_per_value(native, values),
+            },
+        )
+
+
+if __name__ == "__main__":
+    main()
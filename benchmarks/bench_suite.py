@@ -0,0 +1,341 @@
+"""Benchmark suite of every name exported by the package, compared with the stored baseline.
+
+Each type is measured on success, failure and empty paths, via `TypeAdapter` and inside `BaseModel`.
+Each function is measured by calling it on the values of each path.
+The result is nanoseconds per value; throughput in values per second is its reciprocal.
+The suite is measured in several runs and each result is the median of runs.
+
+Run:
+    python -m benchmarks.bench_suite           # Compare with the baseline and exit with 1 on regression.
+    python -m benchmarks.bench_suite --save    # Store the result as the baseline.
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import platform
+import statistics
+import sys
+from collections import defaultdict
+from pathlib import Path
+from typing import Any
+from typing import Callable
+from typing import NamedTuple
+
+import pydantic
+from pydantic import TypeAdapter
+from pydantic import create_model
+
+import pydantictypes
+from benchmarks.timer import measure_per_value
+from benchmarks.timer import suppress_errors
+from pydantictypes import ConstrainedOptionalStringWithLength
+from pydantictypes import ConstrainedStringToOptionalInt
+from pydantictypes import ConstrainedStringWithLength
+from pydantictypes import EmptyStringToNone
+from pydantictypes import HalfWidthString
+from pydantictypes import MemoizedStringToInt
+from pydantictypes import NativeStrictStringWithCommaToInt
+from pydantictypes import OptionalHalfWidthString
+from pydantictypes import StrictKanjiYenStringToInt
+from pydantictypes import StrictStringWithCommaToInt
+from pydantictypes import StrictStringWithCommaToOptionalInt
+from pydantictypes import StrictSymbolYenStringToInt
+from pydantictypes import StringSlashMonthDayOnlyToDatetime
+from pydantictypes import StringSlashToDateTime
+from pydantictypes import StringToBoolean
+from pydantictypes import StringToOptionalBool
+from pydantictypes import StringToOptionalStr
+from pydantictypes import cache_statistics
+from pydantictypes import constrained_optional_string
+from pydantictypes import constrained_string
+from pydantictypes import constringtooptionalint
+from pydantictypes import constringtooptionalstr
+from pydantictypes import constringwithcommatooptionalint
+from pydantictypes import memoize
+from pydantictypes import native_constrained_string
+from pydantictypes import read_csv
+from pydantictypes import read_csv_batches
+from pydantictypes import validate_many
+from pydantictypes._accelerator import IS_ACCELERATED
+from pydantictypes.utility import Utility
+
+BASELINE = Path(__file__).with_name("baseline.json")
+REFERENCE_VALUES = [f"{amount:,}" for amount in range(1000)]
+NUMBER_OF_VALUES = 1000
+# Each value of functions which validate whole column or file is the column or file of 100 rows.
+NUMBER_OF_BULK_VALUES = 50
+# Regression is reported when the result is slower than the baseline by more than this ratio,
+# or by more than the spread of results between runs when it's larger.
+THRESHOLD = 0.25
+
+
+class Case(NamedTuple):
+    """Subject to measure and values of each path.
+
+    Attributes:
+        subject: The type to validate as, or the function to call.
+        success: The values which are valid.
+        failure: The values which are invalid.
+        empty: The values which are None or empty. Empty tuple if the subject has no such path.
+        is_type: Whether the subject is the type or the function.
+        number_of_values: The number of values to measure for each path.
+    """
+
+    subject: Any
+    success: tuple[Any, ...]
+    failure: tuple[Any, ...]
+    empty: tuple[Any, ...] = ()
+    is_type: bool = True
+    number_of_values: int = NUMBER_OF_VALUES
+
+
+class Sample(NamedTuple):
+    """Result of one run.
+
+    Attributes:
+        nanoseconds: The nanoseconds per value.
+        relative: The nanoseconds per value divided by the nanoseconds of the reference workload.
+    """
+
+    nanoseconds: float
+    relative: float
+
+
+class Measurement(NamedTuple):
+    """Result of measurement summarized over runs.
+
+    Attributes:
+        nanoseconds: The median of nanoseconds per value.
+        relative: The median of relative costs.
+        spread: The range of relative costs divided by their median, which is the noise between runs.
+    """
+
+    nanoseconds: float
+    relative: float
+    spread: float
+
+
+def csv_bytes(amounts: list[str]) -> bytes:
+    rows = "".join(f'2020/01/02,ｺﾝﾋﾞﾆ,"{amount}"\r\n' for amount in amounts)
+    return ("利用日,利用店名,利用金額\r\n" + rows).encode("cp932")
+
+
+CSV_COLUMNS = {"利用日": StringSlashToDateTime, "利用店名": HalfWidthString, "利用金額": StrictKanjiYenStringToInt}
+CSV_VALID = csv_bytes([f"{amount:,}円" for amount in range(100)])
+CSV_INVALID = csv_bytes([f"{amount:,}円" if amount % 10 else "1.0円" for amount in range(100)])
+COLUMN_VALID = [f"{amount:,}円" for amount in range(100)]
+COLUMN_INVALID = [f"{amount:,}円" if amount % 10 else "1.0円" for amount in range(100)]
+MEMOIZED_KANJI_YEN = memoize(StrictKanjiYenStringToInt)
+
+CASES: dict[str, Case] = {
+    "EmptyStringToNone": Case(EmptyStringToNone, ("",), ("a", None)),
+    "HalfWidthString": Case(HalfWidthString, ("abc", "ｱｲｳ"), ("あいう", "abcあ"), ("",)),
+    "OptionalHalfWidthString": Case(OptionalHalfWidthString, ("abc", "ｱｲｳ"), ("あいう", "abcあ"), ("", None)),
+    "StrictKanjiYenStringToInt": Case(StrictKanjiYenStringToInt, ("1,000円", "1円"), ("1.0円", "1,000")),
+    "StrictSymbolYenStringToInt": Case(StrictSymbolYenStringToInt, ("\\1,000", "\\1"), ("\\1.0", "1,000")),
+    "StrictStringWithCommaToInt": Case(StrictStringWithCommaToInt, ("1,000", "1"), ("1.0", "a")),
+    "NativeStrictStringWithCommaToInt": Case(NativeStrictStringWithCommaToInt, ("1,000", "1"), ("1.0", "a")),
+    "StrictStringWithCommaToOptionalInt": Case(
+        StrictStringWithCommaToOptionalInt,
+        ("1,000", "1"),
+        ("1.0", "a"),
+        ("", None),
+    ),
+    "constringwithcommatooptionalint": Case(
+        constringwithcommatooptionalint(ge=0, multiple_of=10),
+        ("1,000", "10"),
+        ("-10", "15"),
+        ("", None),
+    ),
+    "ConstrainedStringToOptionalInt": Case(ConstrainedStringToOptionalInt, ("1000", "1"), ("1.0", "a"), ("", None)),
+    "constringtooptionalint": Case(constringtooptionalint(ge=0, multiple_of=10), ("1000", "10"), ("-10", "15"), ("",)),
+    "StringToOptionalStr": Case(StringToOptionalStr, ("abc", " abc "), (None, 1), ("",)),
+    "constringtooptionalstr": Case(
+        constringtooptionalstr(strip_whitespace=True, max_length=4, regex=r"^[a-z]+$"),
+        ("abc", " abc "),
+        ("abcde", "ABC"),
+        ("",),
+    ),
+    "ConstrainedStringWithLength": Case(ConstrainedStringWithLength, ("abc",), (None, 1), ("",)),
+    "constrained_string": Case(constrained_string(min_length=1, max_length=4), ("abc", "a"), ("", "abcde")),
+    "native_constrained_string": Case(
+        native_constrained_string(min_length=1, max_length=4),
+        ("abc", "a"),
+        ("", "abcde"),
+    ),
+    "ConstrainedOptionalStringWithLength": Case(ConstrainedOptionalStringWithLength, ("abc",), (1,), ("", None)),
+    "constrained_optional_string": Case(
+        constrained_optional_string(min_length=1, max_length=4),
+        ("abc", "a"),
+        ("abcde",),
+        ("", None),
+    ),
+    "StringToBoolean": Case(StringToBoolean, (True, False), ("x", None)),
+    "StringToOptionalBool": Case(StringToOptionalBool, ("1", "0"), ("x", "2"), ("",)),
+    "StringSlashToDateTime": Case(StringSlashToDateTime, ("2020/01/02", "2020/1/2"), ("2020/13/01", "2020-01-02")),
+    "StringSlashMonthDayOnlyToDatetime": Case(StringSlashMonthDayOnlyToDatetime, ("01/02", "1/2"), ("13/01", "")),
+    "memoize": Case(MEMOIZED_KANJI_YEN, ("1,000円", "1円"), ("1.0円", "1,000")),
+    "MemoizedStringToInt": Case(
+        MemoizedStringToInt(Utility.convert_string_with_comma_to_int, 4096),
+        ("1,000", "1"),
+        ("1.0", "a"),
+        is_type=False,
+    ),
+    "cache_statistics": Case(cache_statistics, (MEMOIZED_KANJI_YEN,), (StrictKanjiYenStringToInt,), is_type=False),
+    "validate_many": Case(
+        lambda column: validate_many(StrictKanjiYenStringToInt, column),
+        (COLUMN_VALID,),
+        (COLUMN_INVALID,),
+        ([],),
+        is_type=False,
+        number_of_values=NUMBER_OF_BULK_VALUES,
+    ),
+    "read_csv": Case(
+        lambda data: list(read_csv(io.BytesIO(data), CSV_COLUMNS, encoding="cp932")),
+        (CSV_VALID,),
+        (CSV_INVALID,),
+        (csv_bytes([]),),
+        is_type=False,
+        number_of_values=NUMBER_OF_BULK_VALUES,
+    ),
+    "read_csv_batches": Case(
+        lambda data: list(read_csv_batches(io.BytesIO(data), CSV_COLUMNS, encoding="cp932")),
+        (CSV_VALID,),
+        (CSV_INVALID,),
+        (csv_bytes([]),),
+        is_type=False,
+        number_of_values=NUMBER_OF_BULK_VALUES,
+    ),
+}
+# Names which are not measured by this suite, with reasons.
+NOT_MEASURED = {
+    "BatchResult": "Result of validate_many.",
+    "CacheStatistics": "Result of cache_statistics.",
+    "CsvBatch": "Result of read_csv_batches and read_csv_parallel.",
+    "read_csv_parallel": "Starts worker processes. Measured by benchmarks.bench_parallel.",
+}
+
+
+def check_coverage() -> None:
+    missing = set(pydantictypes.__all__) - set(CASES) - set(NOT_MEASURED)
+    if missing:
+        msg = f"Add cases of exported names into benchmark suite. Names = {sorted(missing)}"
+        raise ValueError(msg)
+
+
+def validators(case: Case) -> dict[str, Callable[[Any], Any]]:
+    """Return the function to measure by how the subject is used."""
+    if not case.is_type:
+        return {"call": case.subject}
+    model = create_model("Model", value=(case.subject, ...))
+    return {
+        "TypeAdapter": TypeAdapter(case.subject).validate_python,
+        "BaseModel": lambda value: model.model_validate({"value": value}),
+    }
+
+
+def reference(value: str) -> int:
+    """Run the fixed workload of pure Python to measure speed of the machine at the moment."""
+    return int(value.replace(",", ""))
+
+
+def measure_case(name: str, case: Case, repeat: int) -> dict[str, Sample]:
+    """Measure each path of the case relative to the reference workload measured just before.
+
+    The relative cost is stable against drift of speed of the machine, such as frequency scaling.
+    """
+    results = {}
+    paths = {"success": case.success, "failure": case.failure, "empty": case.empty}
+    for via, function in validators(case).items():
+        for path, samples in paths.items():
+            if samples:
+                values = list(samples) * (case.number_of_values // len(samples))
+                reference_nanoseconds = measure_per_value(reference, REFERENCE_VALUES, repeat=repeat)
+                nanoseconds = measure_per_value(suppress_errors(function), values, repeat=repeat)
+                results[f"{name} / {path} / {via}"] = Sample(nanoseconds, nanoseconds / reference_nanoseconds)
+    return results
+
+
+def summarize(samples: list[Sample]) -> Measurement:
+    relatives = [sample.relative for sample in samples]
+    median = statistics.median(relatives)
+    return Measurement(
+        statistics.median(sample.nanoseconds for sample in samples),
+        median,
+        (max(relatives) - min(relatives)) / median,
+    )
+
+
+def measure(runs: int, repeat: int) -> dict[str, Measurement]:
+    """Measure every case in each run and summarize the results of each path by the median of runs.
+
+    Each run measures all cases in turn, so that temporary slowdown of the machine affects one run of many cases
+    rather than all runs of one case, and the median of runs excludes it.
+    """
+    samples: defaultdict[str, list[Sample]] = defaultdict(list)
+    for _ in range(runs):
+        for name, case in CASES.items():
+            for key, sample in measure_case(name, case, repeat).items():
+                samples[key].append(sample)
+    return {key: summarize(samples_of_key) for key, samples_of_key in samples.items()}
+
+
+def environment() -> dict[str, str]:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "pydantic": pydantic.VERSION,
+        "pydantictypes": pydantictypes.__version__,
+        "accelerated": str(IS_ACCELERATED),
+    }
+
+
+def compare(results: dict[str, Measurement], baseline: dict[str, Any], threshold: float = THRESHOLD) -> list[str]:
+    """Print results with the ratio of relative cost against the baseline and return the keys of regressions.
+
+    The result is the regression when the ratio exceeds both the threshold and the sum of spreads of the result
+    and the baseline, since the difference within the noise between runs is not distinguishable from the noise.
+    """
+    width = max(len(key) for key in results)
+    regressions = []
+    for key, (nanoseconds, relative, spread) in results.items():
+        previous = baseline.get(key)
+        text = f"{spread:6.0%} spread"
+        if previous is not None:
+            ratio = relative / previous["relative"]
+            limit = 1 + max(threshold, spread + previous["spread"])
+            text += f" {ratio:6.2f}x baseline (limit {limit:.2f}x)"
+            if ratio > limit:
+                regressions.append(key)
+        print(f"{key:<{width}} {nanoseconds:10.1f} ns/value {1e9 / nanoseconds:12,.0f} values/s {text}")  # noqa: T201
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--save", action="store_true", help="store the result as the baseline")
+    parser.add_argument("--runs", type=int, default=5, help="how many runs to take the median of")
+    parser.add_argument("--repeat", type=int, default=5, help="how many times to repeat each measurement in run")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD, help="ratio of slowdown to report")
+    parser.add_argument("--baseline", type=Path, default=BASELINE, help="path of the baseline")
+    arguments = parser.parse_args()
+    check_coverage()
+    results = measure(arguments.runs, arguments.repeat)
+    if arguments.save:
+        compare(results, {})
+        baseline = {key: result._asdict() for key, result in results.items()}
+        arguments.baseline.write_text(json.dumps({"environment": environment(), "results": baseline}, indent=2) + "\n")
+        return
+    stored = json.loads(arguments.baseline.read_text())["results"]
+    regressions = compare(results, stored, arguments.threshold)
+    if regressions:
+        print(f"Slower than baseline by more than {arguments.threshold:.0%}: {regressions}")  # noqa: T201
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Benchmark of validation of the same model from 1, 2, 4 and 8 threads.
+
+Threads scale only on free-threaded Python, for example, python3.13t or python3.14t, and up to the number of CPUs.
+
+Run: python -m benchmarks.bench_threads
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import timeit
+
+from pydantic import BaseModel
+
+from benchmarks.timer import NANOSECONDS_PER_SECOND
+from benchmarks.timer import report
+from pydantictypes import HalfWidthString
+from pydantictypes import StrictKanjiYenStringToInt
+from pydantictypes import StrictStringWithCommaToOptionalInt
+from pydantictypes import StringSlashToDateTime
+from pydantictypes import StringToOptionalStr
+from pydantictypes import constringwithcommatooptionalint
+
+NUMBER_OF_ROWS = 40_000
+Points = constringwithcommatooptionalint(ge=0)
+
+
+class Statement(BaseModel):
+    date: StringSlashToDateTime
+    shop: HalfWidthString
+    memo: StringToOptionalStr
+    amount: StrictKanjiYenStringToInt
+    balance: StrictStringWithCommaToOptionalInt
+    points: Points  # type: ignore[valid-type]
+
+
+ROWS = [
+    {
+        "date": f"2020/{index % 12 + 1:02}/{index % 28 + 1:02}",
+        "shop": f"ｺﾝﾋﾞﾆ {index % 1000}",
+        "memo": "" if index % 2 else "memo",
+        "amount": f"{index * 7:,}円",
+        "balance": f"{index * 1000:,}",
+        "points": f"{index % 100}",
+    }
+    for index in range(NUMBER_OF_ROWS)
+]
+
+
+def validate(rows: list[dict[str, str]]) -> None:
+    for row in rows:
+        Statement.model_validate(row)
+
+
+def measure_threads(number_of_threads: int) -> float:
+    """Measure the best nanoseconds per row of validating all rows split among threads."""
+    shards = [ROWS[index::number_of_threads] for index in range(number_of_threads)]
+
+    def run() -> None:
+        threads = [threading.Thread(target=validate, args=(shard,)) for shard in shards]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    best = min(timeit.repeat(run, number=1, repeat=5))
+    return best / NUMBER_OF_ROWS * NANOSECONDS_PER_SECOND
+
+
+def main() -> None:
+    # Reason: sys._is_gil_enabled() is the only way to check and is added in Python 3.13.
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"CPUs: {os.cpu_count()}, GIL enabled: {is_gil_enabled}")  # noqa: T201
+    report(
+        f"{NUMBER_OF_ROWS:,} rows",
+        {f"{number} threads": measure_threads(number) for number in (1, 2, 4, 8)},
+        unit="ns/row",
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Benchmark of building models dynamically per tenant schema with memoized type factories against unmemoized ones.
+
+Every tenant has the same schema, so memoized factories return the identical types for all tenants.
+Unmemoized factories are `__wrapped__` of memoized ones, which create new validator and type on every call.
+Memory is measured as the bytes which are kept by tracemalloc after all models are built,
+which doesn't count the memoized types since they were created by earlier repetitions.
+
+Run: python -m benchmarks.bench_type_factories
+"""
+
+from __future__ import annotations
+
+import gc
+import timeit
+import tracemalloc
+from typing import Any
+from typing import Callable
+
+from pydantic import TypeAdapter
+from pydantic import create_model
+
+from benchmarks.timer import report
+from pydantictypes.abstract_string_to_int import constringtoint
+from pydantictypes.string_to_optional_int import constringtooptionalint
+from pydantictypes.string_to_optional_str import constringtooptionalstr
+from pydantictypes.string_with_comma_to_optional_int import constringwithcommatooptionalint
+from pydantictypes.string_with_length_constraint import constrained_optional_string
+from pydantictypes.string_with_length_constraint import constrained_string
+from pydantictypes.symbol_yen_string_to_int import SymbolYenStringToInt
+
+NUMBER_OF_TENANTS = 200
+
+FIELDS: dict[str, tuple[Callable[..., Any], dict[str, Any]]] = {
+    "code": (constrained_string, {"equal_to": 8}),
+    "note": (constrained_optional_string, {"max_length": 200}),
+    "name": (constringtooptionalstr, {"strip_whitespace": True, "max_length": 50, "regex": r"^\S"}),
+    "quantity": (constringtooptionalint, {"ge": 0}),
+    "amount": (constringwithcommatooptionalint, {"ge": 0, "lt": 10_000_000}),
+    "price": (constringtoint, {"type_name": "Price", "type_class": SymbolYenStringToInt, "ge": 0}),
+}
+
+
+def build_models(*, memoized: bool) -> list[Any]:
+    """Build model for each tenant by calling the factories for each field."""
+    models = []
+    for tenant in range(NUMBER_OF_TENANTS):
+        fields: dict[str, Any] = {}
+        for name, (factory, constraints) in FIELDS.items():
+            create = factory if memoized else factory.__wrapped__  # type: ignore[attr-defined]
+            fields[name] = (create(**constraints), ...)
+        models.append(create_model(f"Tenant{tenant}", **fields))
+    return models
+
+
+def build_adapters(*, memoized: bool) -> list[Any]:
+    """Build adapter for each tenant and each field, as `validate_many()` does, which caches them by type."""
+    adapters = {}
+    for _ in range(NUMBER_OF_TENANTS):
+        for factory, constraints in FIELDS.values():
+            create = factory if memoized else factory.__wrapped__  # type: ignore[attr-defined]
+            type_ = create(**constraints)
+            if type_ not in adapters:
+                adapters[type_] = TypeAdapter(type_)
+    return list(adapters.values())
+
+
+def measure(build: Callable[..., list[Any]], *, memoized: bool) -> tuple[float, float]:
+    """Measure the best milliseconds to build and the kibibytes which are kept by the built objects."""
+    best = min(timeit.repeat(lambda: build(memoized=memoized), number=1, repeat=3))
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        built = build(memoized=memoized)
+        gc.collect()
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del built
+    return best * 1_000, (after - before) / 1_024
+
+
+def main() -> None:
+    for title, build in (("create_model", build_models), ("TypeAdapter cached by type", build_adapters)):
+        unmemoized_time, unmemoized_memory = measure(build, memoized=False)
+        memoized_time, memoized_memory = measure(build, memoized=True)
+        report(
+            f"{title}, {NUMBER_OF_TENANTS} tenants, build time",
+            {"unmemoized": unmemoized_time, "memoized": memoized_time},
+            unit="ms",
+        )
+        report(
+            f"{title}, {NUMBER_OF_TENANTS} tenants, kept memory",
+            {"unmemoized": unmemoized_memory, "memoized": memoized_memory},
+            unit="KiB",
+        )
+
+
+if __name__ == "__main__":
+    main()
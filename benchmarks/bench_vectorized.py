@@ -0,0 +1,61 @@
+"""Benchmark of NumPy-vectorized conversion and check against calling the function of the type for each element.
+
+Run: python -m benchmarks.bench_vectorized
+"""
+
+from __future__ import annotations
+
+import timeit
+from typing import Any
+from typing import Callable
+
+import numpy as np
+
+from benchmarks.timer import NANOSECONDS_PER_SECOND
+from benchmarks.timer import report
+from pydantictypes._east_asian_width import find_not_half_width
+from pydantictypes.utility import Utility
+from pydantictypes.vectorized import check_half_width
+from pydantictypes.vectorized import convert_string_with_comma_to_int64
+
+VALUES = np.array([f"{amount:,}" for amount in range(0, 100_000_000, 331)])
+# SKUs are ASCII, and product names mix ASCII, half-width katakana and kanji.
+SKUS = np.array([f"SKU-{number:08}-{size}" for number in range(100_000) for size in ("S", "M", "L")])
+NAME_PARTS = ["Blue T-shirt", "ﾌﾞﾙｰ Tｼｬﾂ", "青いTシャツ", "Tokyo Chiyoda 1-1", "ｱｲｳｴｵ"]
+NAMES = np.array([f"{NAME_PARTS[number % len(NAME_PARTS)]} {number}" for number in range(300_000)])
+
+
+def measure_column(function: Callable[[Any], Any], values: Any) -> float:  # noqa: ANN401
+    best = min(timeit.repeat(lambda: function(values), number=1, repeat=5))
+    return best / len(values) * NANOSECONDS_PER_SECOND
+
+
+def convert_each(values: Any) -> Any:  # noqa: ANN401
+    return np.array([Utility.convert_string_with_comma_to_int(value) for value in values.tolist()], dtype=np.int64)
+
+
+def check_each(values: Any) -> Any:  # noqa: ANN401
+    return np.array([find_not_half_width(value) for value in values.tolist()], dtype=np.int64)
+
+
+def main() -> None:
+    report(
+        "String with comma to int64",
+        {
+            "Utility for each element": measure_column(convert_each, VALUES),
+            "vectorized": measure_column(convert_string_with_comma_to_int64, VALUES),
+        },
+    )
+    for title, values in (("SKUs", SKUS), ("product names", NAMES)):
+        report(
+            f"Half-width check of {title}",
+            {
+                "find_not_half_width for each element": measure_column(check_each, values),
+                "vectorized": measure_column(check_half_width, values),
+                "vectorized, object array": measure_column(check_half_width, values.astype(object)),
+            },
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Benchmark of precompiled yen parser against the previous implementation of Utility.
+
+Run: python -m benchmarks.bench_yen_parser
+"""
+
+from __future__ import annotations
+
+import re
+
+from benchmarks.timer import measure_per_value
+from benchmarks.timer import report
+from pydantictypes.utility import Utility
+
+# Amounts in bank statements and credit card statements.
+KANJI_YEN_VALUES = [f"{amount:,}円" for amount in range(1, 3_000_000, 997)] + [
+    f"{amount:,} 円" for amount in range(1, 300_000, 97)
+]
+SYMBOL_YEN_VALUES = [f"\\{amount:,}" for amount in range(1, 3_000_000, 997)]
+
+
+def previous_convert_kanji_yen_string_to_int(yen_string: str) -> int:
+    """Convert yen string by Utility.convert_kanji_yen_string_to_int before precompiled parser."""
+    if "." in yen_string:
+        msg = f"Decimal is unsupported. Yen string = {yen_string}"
+        raise ValueError(msg)
+    matches = re.search(r"([\d,]+)\s*円", yen_string)
+    if matches is None:
+        msg = f"Invalid yen string. Yen string = {yen_string}"
+        raise ValueError(msg)
+    return int(matches.group(1).replace(",", ""))
+
+
+def previous_convert_symbol_yen_string_to_int(yen_string: str) -> int:
+    """Convert yen string by Utility.convert_symbol_yen_string_to_int before precompiled parser."""
+    if "." in yen_string:
+        msg = f"Decimal is unsupported. Yen string = {yen_string}"
+        raise ValueError(msg)
+    matches = re.search(r"\\([\d,]+)", yen_string)
+    if matches is None:
+        msg = f"Invalid yen string. Yen string = {yen_string}"
+        raise ValueError(msg)
+    return int(matches.group(1).replace(",", ""))
+
+
+def main() -> None:
+    report(
+        "Kanji yen",
+        {
+            "previous": measure_per_value(previous_convert_kanji_yen_string_to_int, KANJI_YEN_VALUES),
+            "YenParser": measure_per_value(Utility.convert_kanji_yen_string_to_int, KANJI_YEN_VALUES),
+        },
+    )
+    report(
+        "Symbol yen",
+        {
+            "previous": measure_per_value(previous_convert_symbol_yen_string_to_int, SYMBOL_YEN_VALUES),
+            "YenParser": measure_per_value(Utility.convert_symbol_yen_string_to_int, SYMBOL_YEN_VALUES),
+        },
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Helpers to measure and report latency of validation in benchmarks."""
+
+from __future__ import annotations
+
+import timeit
+import tracemalloc
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Callable
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+NANOSECONDS_PER_SECOND = 1_000_000_000
+
+
+def suppress_errors(function: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    """Wrap function to swallow exceptions so that failure paths can be measured."""
+
+    # Reason: The argument of pydantic type
+    def wrapper(value: Any) -> Any:  # noqa: ANN401
+        try:
+            return function(value)
+        # Reason: Failure path is the subject of measurement.
+        except Exception as error:  # noqa: BLE001 pylint: disable=broad-exception-caught
+            return error
+
+    return wrapper
+
+
+def measure_per_value(function: Callable[[Any], Any], values: Sequence[Any], *, repeat: int = 5) -> float:
+    """Measure the best nanoseconds per value of calling function for each value.
+
+    Args:
+        function: The function to measure.
+        values: The values to pass into function one by one.
+        repeat: How many times to repeat the measurement.
+
+    Returns:
+        The nanoseconds per value of the fastest repetition.
+    """
+
+    def run() -> None:
+        for value in values:
+            function(value)
+
+    best = min(timeit.repeat(run, number=1, repeat=repeat))
+    return best / len(values) * NANOSECONDS_PER_SECOND
+
+
+# Reason: The argument of pydantic type
+def measure_peak_bytes(function: Callable[[Any], Any], value: Any) -> int:  # noqa: ANN401
+    """Measure the peak of memory which is allocated by tracemalloc during one call of function.
+
+    Args:
+        function: The function to measure.
+        value: The value to pass into function.
+
+    Returns:
+        The peak bytes above the memory allocated before the call.
+    """
+    function(value)
+    tracemalloc.start()
+    try:
+        current, _ = tracemalloc.get_traced_memory()
+        function(value)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak - current
+
+
+def report(title: str, results: dict[str, float], *, unit: str = "ns/value") -> None:
+    """Print results as table with ratio against the first entry.
+
+    Args:
+        title: The title of the benchmark.
+        results: The nanoseconds per value, or the measurement in unit, for each label.
+        unit: The unit of results.
+    """
+    print(f"## {title}")  # noqa: T201
+    baseline = next(iter(results.values()))
+    width = max(len(label) for label in results)
+    for label, nanoseconds in results.items():
+        print(f"{label:<{width}} {nanoseconds:10.1f} {unit} {baseline / nanoseconds:6.2f}x")  # noqa: T201
+    print()  # noqa: T201
@@ -1,28 +1,122 @@
-"""Top-level package for Pydantic Types."""
-
-from pydantictypes.empty_string_to_none import *  # noqa: F403
-from pydantictypes.half_width_string import *  # noqa: F403
-from pydantictypes.kanji_yen_string_to_int import *  # noqa: F403
-from pydantictypes.string_to_datetime import *  # noqa: F403
-from pydantictypes.string_to_optional_bool import *  # noqa: F403
-from pydantictypes.string_to_optional_int import *  # noqa: F403
-from pydantictypes.string_to_optional_str import *  # noqa: F403
-from pydantictypes.string_with_comma_to_int import *  # noqa: F403
-from pydantictypes.string_with_comma_to_optional_int import *  # noqa: F403
-from pydantictypes.string_with_length_constraint import *  # noqa: F403
-from pydantictypes.symbol_yen_string_to_int import *  # noqa: F403
+"""Top-level package for Pydantic Types.
+
+Each type is imported lazily on first access (PEP 562),
+so that `import pydantictypes` doesn't import the modules of types which are not used.
+"""
+
+from __future__ import annotations
+
+# Reason: Importing typing costs more than this package itself.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any
+
+    from pydantictypes.batch import BatchResult as BatchResult
+    from pydantictypes.batch import validate_many as validate_many
+    from pydantictypes.empty_string_to_none import EmptyStringToNone as EmptyStringToNone
+    from pydantictypes.half_width_string import HalfWidthString as HalfWidthString
+    from pydantictypes.half_width_string import OptionalHalfWidthString as OptionalHalfWidthString
+    from pydantictypes.io import CsvBatch as CsvBatch
+    from pydantictypes.io import read_csv as read_csv
+    from pydantictypes.io import read_csv_batches as read_csv_batches
+    from pydantictypes.io import read_csv_parallel as read_csv_parallel
+    from pydantictypes.kanji_yen_string_to_int import StrictKanjiYenStringToInt as StrictKanjiYenStringToInt
+    from pydantictypes.memoized import CacheStatistics as CacheStatistics
+    from pydantictypes.memoized import MemoizedStringToInt as MemoizedStringToInt
+    from pydantictypes.memoized import cache_statistics as cache_statistics
+    from pydantictypes.memoized import memoize as memoize
+    from pydantictypes.string_to_datetime import StringSlashMonthDayOnlyToDatetime as StringSlashMonthDayOnlyToDatetime
+    from pydantictypes.string_to_datetime import StringSlashToDateTime as StringSlashToDateTime
+    from pydantictypes.string_to_optional_bool import StringToBoolean as StringToBoolean
+    from pydantictypes.string_to_optional_bool import StringToOptionalBool as StringToOptionalBool
+    from pydantictypes.string_to_optional_int import ConstrainedStringToOptionalInt as ConstrainedStringToOptionalInt
+    from pydantictypes.string_to_optional_int import constringtooptionalint as constringtooptionalint
+    from pydantictypes.string_to_optional_str import StringToOptionalStr as StringToOptionalStr
+    from pydantictypes.string_to_optional_str import constringtooptionalstr as constringtooptionalstr
+    from pydantictypes.string_with_comma_to_int import (
+        NativeStrictStringWithCommaToInt as NativeStrictStringWithCommaToInt,
+    )
+    from pydantictypes.string_with_comma_to_int import StrictStringWithCommaToInt as StrictStringWithCommaToInt
+    from pydantictypes.string_with_comma_to_optional_int import (
+        StrictStringWithCommaToOptionalInt as StrictStringWithCommaToOptionalInt,
+    )
+    from pydantictypes.string_with_comma_to_optional_int import (
+        constringwithcommatooptionalint as constringwithcommatooptionalint,
+    )
+    from pydantictypes.string_with_length_constraint import (
+        ConstrainedOptionalStringWithLength as ConstrainedOptionalStringWithLength,
+    )
+    from pydantictypes.string_with_length_constraint import ConstrainedStringWithLength as ConstrainedStringWithLength
+    from pydantictypes.string_with_length_constraint import constrained_optional_string as constrained_optional_string
+    from pydantictypes.string_with_length_constraint import constrained_string as constrained_string
+    from pydantictypes.string_with_length_constraint import native_constrained_string as native_constrained_string
+    from pydantictypes.symbol_yen_string_to_int import StrictSymbolYenStringToInt as StrictSymbolYenStringToInt
 
 __version__ = "1.3.1"
 
-__all__ = []
-__all__ += empty_string_to_none.__all__  # type:ignore[name-defined] # noqa: F405 pylint: disable=undefined-variable
-__all__ += half_width_string.__all__  # type:ignore[name-defined] # noqa: F405 pylint: disable=undefined-variable
-__all__ += kanji_yen_string_to_int.__all__  # type:ignore[name-defined] # noqa: F405 pylint: disable=undefined-variable
-__all__ += string_to_datetime.__all__  # type:ignore[name-defined] # noqa: F405 pylint: disable=undefined-variable
-__all__ += string_to_optional_bool.__all__  # type:ignore[name-defined] # noqa: F405 pylint: disable=undefined-variable
-__all__ += string_to_optional_int.__all__  # type:ignore[name-defined] # noqa: F405 pylint: disable=undefined-variable
-__all__ += string_to_optional_str.__all__  # type:ignore[name-defined] # noqa: F405 pylint: disable=undefined-variable
-__all__ += string_with_comma_to_int.__all__  # type:ignore[name-defined] # noqa: F405 pylint: disable=undefined-variable
-__all__ += string_with_comma_to_optional_int.__all__  # type:ignore[name-defined] # noqa: F405 pylint: disable=undefined-variable
-__all__ += string_with_length_constraint.__all__  # type:ignore[name-defined] # noqa: F405 pylint: disable=undefined-variable
-__all__ += symbol_yen_string_to_int.__all__  # type:ignore[name-defined] # noqa: F405 pylint: disable=undefined-variable
+# Module which defines each name. Keep in sync with `__all__` of each module.
+_MODULE_BY_NAME = {
+    "BatchResult": "batch",
+    "validate_many": "batch",
+    "EmptyStringToNone": "empty_string_to_none",
+    "HalfWidthString": "half_width_string",
+    "OptionalHalfWidthString": "half_width_string",
+    "CsvBatch": "io",
+    "read_csv": "io",
+    "read_csv_batches": "io",
+    "read_csv_parallel": "io",
+    "StrictKanjiYenStringToInt": "kanji_yen_string_to_int",
+    "CacheStatistics": "memoized",
+    "MemoizedStringToInt": "memoized",
+    "cache_statistics": "memoized",
+    "memoize": "memoized",
+    "StringSlashMonthDayOnlyToDatetime": "string_to_datetime",
+    "StringSlashToDateTime": "string_to_datetime",
+    "StringToBoolean": "string_to_optional_bool",
+    "StringToOptionalBool": "string_to_optional_bool",
+    "ConstrainedStringToOptionalInt": "string_to_optional_int",
+    "constringtooptionalint": "string_to_optional_int",
+    "StringToOptionalStr": "string_to_optional_str",
+    "constringtooptionalstr": "string_to_optional_str",
+    "NativeStrictStringWithCommaToInt": "string_with_comma_to_int",
+    "StrictStringWithCommaToInt": "string_with_comma_to_int",
+    "StrictStringWithCommaToOptionalInt": "string_with_comma_to_optional_int",
+    "constringwithcommatooptionalint": "string_with_comma_to_optional_int",
+    "ConstrainedOptionalStringWithLength": "string_with_length_constraint",
+    "ConstrainedStringWithLength": "string_with_length_constraint",
+    "constrained_optional_string": "string_with_length_constraint",
+    "constrained_string": "string_with_length_constraint",
+    "native_constrained_string": "string_with_length_constraint",
+    "StrictSymbolYenStringToInt": "symbol_yen_string_to_int",
+}
+
+__all__ = list(_MODULE_BY_NAME)
+
+
+# Reason: To follow PEP 562
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    module_name = _MODULE_BY_NAME.get(name)
+    if module_name is None:
+        return _import_submodule(name)
+    # Reason: `importlib.import_module()` is invisible to `python -X importtime`.
+    value = getattr(__import__(f"{__name__}.{module_name}", fromlist=[name]), name)
+    # Cache to skip `__getattr__` from the next access.
+    globals()[name] = value
+    return value
+
+
+def _import_submodule(name: str) -> Any:  # noqa: ANN401
+    """Import submodule as attribute of the package as same as the package which imports all modules."""
+    import importlib  # noqa: PLC0415
+
+    try:
+        return importlib.import_module(f"{__name__}.{name}")
+    except ModuleNotFoundError as error:
+        if error.name != f"{__name__}.{name}":
+            raise
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg) from None
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
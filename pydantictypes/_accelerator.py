@@ -0,0 +1,79 @@
+"""Internal selection of compiled fast paths which fall back to pure Python implementations."""
+
+from __future__ import annotations
+
+import importlib
+import os
+from typing import Any
+from typing import Callable
+from typing import TypeVar
+from typing import cast
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+try:
+    from pydantictypes import _speedups
+except ImportError:
+    _speedups = None  # type: ignore[assignment]
+
+# Reason: To run pure Python implementations, for example, to compare or to debug them.
+if os.environ.get("PYDANTICTYPES_PURE_PYTHON"):
+    _speedups = None  # type: ignore[assignment]
+
+IS_ACCELERATED = _speedups is not None
+
+
+def accelerated(function: F, *state: Any) -> F:  # noqa: ANN401
+    """Return the compiled function of the same qualified name if the extension is built, otherwise function itself.
+
+    The compiled function runs its fast path only for the values whose result is obvious,
+    and calls function for every other value, so that it behaves exactly as function.
+    The pure Python function is available as `__wrapped__` of the compiled function.
+
+    Args:
+        function: The pure Python function, whose `__qualname__` selects the fast path.
+        *state: The values which the fast path refers to, such as the template of format.
+
+    Returns:
+        The compiled function, or function itself.
+    """
+    if _speedups is None:
+        return function
+    # Reason: The compiled function has the same signature as function.
+    return _speedups.accelerate(function.__qualname__, function, state)  # type: ignore[return-value]
+
+
+def find_function(module: str, qualname: str) -> Callable[..., Any]:
+    """Return the function of the qualified name, which is the compiled function if the extension is selected.
+
+    Args:
+        module: The name of module which defines the function.
+        qualname: The qualified name of the function, for example, `Utility.convert_string_with_comma_to_int`.
+
+    Returns:
+        The function.
+    """
+    found: Any = importlib.import_module(module)
+    for name in qualname.split("."):
+        found = getattr(found, name)
+    return cast("Callable[..., Any]", found)
+
+
+def reduce(fallback: Callable[..., Any], state: tuple[Any, ...]) -> tuple[Callable[..., Any], tuple[Any, ...]]:
+    """Return how to pickle the compiled function, which is called by `__reduce__()` of it.
+
+    Since the compiled function replaces the pure Python function in its module,
+    the pure Python function can't be pickled by reference, so that the function without state is found by name.
+    The function with state, for example, the bound method, is pickled by the pure Python function and state.
+    Either way, the process which unpickles it selects the compiled function if its extension is built.
+
+    Args:
+        fallback: The pure Python function.
+        state: The values which the fast path refers to.
+
+    Returns:
+        The function to call and its arguments, to unpickle.
+    """
+    if state:
+        return accelerated, (fallback, *state)
+    return find_function, (fallback.__module__, fallback.__qualname__)
@@ -0,0 +1,100 @@
+"""Internal batch validation which is shared by validation of columns and CSV files."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Generic
+from typing import List
+from typing import TypeVar
+
+from pydantic import GetCoreSchemaHandler
+from pydantic import TypeAdapter
+from pydantic import ValidationError
+from pydantic_core import core_schema
+
+# Reason: To use raw typing imports
+try:
+    from typing import Annotated
+except ImportError:
+    from typing_extensions import Annotated
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from pydantic_core import CoreSchema
+
+T = TypeVar("T")
+# Number of types whose TypeAdapters are kept. The least recently used ones are released beyond this,
+# so that types created dynamically, for example for each tenant, don't keep their validators forever.
+TYPE_ADAPTER_CACHE_SIZE = 256
+
+INVALID = object()
+
+
+class InvalidAsSentinel:
+    """Annotation to replace invalid value with sentinel inside pydantic-core instead of failing whole list."""
+
+    # Reason: To follow Pydantic specification pylint: disable-next=line-too-long
+    def __get_pydantic_core_schema__(self, source_type: Any, handler: GetCoreSchemaHandler) -> CoreSchema:  # noqa: ANN401
+        return core_schema.with_default_schema(handler(source_type), default=INVALID, on_error="default")
+
+
+# Reason: The argument of pydantic type
+@lru_cache(maxsize=TYPE_ADAPTER_CACHE_SIZE)
+def type_adapter(type_: Any) -> TypeAdapter[Any]:  # noqa: ANN401
+    return TypeAdapter(type_)
+
+
+# Reason: The argument of pydantic type
+@lru_cache(maxsize=TYPE_ADAPTER_CACHE_SIZE)
+def list_type_adapter(type_: Any) -> TypeAdapter[list[Any]]:  # noqa: ANN401
+    return TypeAdapter(List[Annotated[type_, InvalidAsSentinel()]])
+
+
+def format_error(error: Exception) -> str:
+    if isinstance(error, ValidationError):
+        return "; ".join(detail["msg"] for detail in error.errors(include_url=False))
+    return str(error)
+
+
+class BatchValidator(Generic[T]):
+    """Validator to validate values in batch and to collect errors."""
+
+    # Reason: The argument of pydantic type
+    def __init__(self, type_: Any, values: list[Any]) -> None:  # noqa: ANN401
+        self.item_adapter: TypeAdapter[T] = type_adapter(type_)
+        self.list_adapter = list_type_adapter(type_)
+        self.values = values
+        self.validated: list[T | None] = [None] * len(values)
+        self.errors: dict[int, str] = {}
+
+    def validate(self) -> tuple[list[T | None], dict[int, str]]:
+        """Validate whole column in one call and validate only invalid values again to collect errors.
+
+        Returns:
+            The validated values, which are None at the index of error, and the error messages by index.
+        """
+        try:
+            validated = self.list_adapter.validate_python(self.values)
+        except TypeError:
+            # Some validators raise TypeError which Pydantic doesn't convert into ValidationError.
+            self.validate_one_by_one(range(len(self.values)))
+            return self.validated, self.errors
+        invalid_indexes = []
+        for index, value in enumerate(validated):
+            if value is INVALID:
+                invalid_indexes.append(index)
+            else:
+                self.validated[index] = value
+        self.validate_one_by_one(invalid_indexes)
+        return self.validated, self.errors
+
+    def validate_one_by_one(self, indexes: Iterable[int]) -> None:
+        for index in indexes:
+            try:
+                self.validated[index] = self.item_adapter.validate_python(self.values[index])
+            # Reason: Each invalid value has its own error.
+            except (ValidationError, TypeError) as error:  # noqa: PERF203
+                self.errors[index] = format_error(error)
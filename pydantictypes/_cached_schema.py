@@ -0,0 +1,59 @@
+"""Internal annotations which reuse core schema instead of generating it for each field."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from typing import Any
+from weakref import WeakKeyDictionary
+
+from pydantic import BeforeValidator
+from pydantic_core import PydanticUndefined
+
+if TYPE_CHECKING:
+    from pydantic import GetCoreSchemaHandler
+    from pydantic_core import CoreSchema
+
+
+class CachedBeforeValidator(BeforeValidator):
+    """BeforeValidator which inspects its function once instead of for each field.
+
+    `BeforeValidator` inspects the signature of function for each field,
+    which costs more than the field of plain type does.
+    Since the wrapping schema depends only on function, it is built on first use and reused after that.
+    The schema of source type is generated for each field by the handler
+    since it depends on the config of model, for example, `use_enum_values`.
+    """
+
+    # The wrapping schema is cached by weak reference to validator.
+    __slots__ = ("__weakref__",)
+
+    # Reason: To follow Pydantic specification pylint: disable-next=line-too-long
+    def __get_pydantic_core_schema__(self, source_type: Any, handler: GetCoreSchemaHandler) -> CoreSchema:  # noqa: ANN401
+        # The schema of input type for JSON schema depends on config, too.
+        if getattr(self, "json_schema_input_type", PydanticUndefined) is not PydanticUndefined:
+            return super().__get_pydantic_core_schema__(source_type, handler)
+        wrapper = _WRAPPERS.get(self)
+        if wrapper is None:
+            return copy_schema(_WRAPPERS.setdefault(self, super().__get_pydantic_core_schema__(source_type, handler)))
+        return {**wrapper, "schema": handler(source_type)}
+
+
+# Wrapping schemas by validator, which are built on first use and released with the validator,
+# for example, of constrained type which is no longer used.
+_WRAPPERS: WeakKeyDictionary[CachedBeforeValidator, CoreSchema] = WeakKeyDictionary()
+
+
+def copy_schema(schema: CoreSchema) -> CoreSchema:
+    """Copy prebuilt schema before returning it from `__get_pydantic_core_schema__`.
+
+    Pydantic updates metadata of the returned schema in place, for example, by description of `Field()`,
+    so the schema which is shared between fields must not be returned as it is.
+    Copying the top level is enough since the metadata is set to the top level.
+
+    Args:
+        schema: The prebuilt schema.
+
+    Returns:
+        The shallow copy of schema.
+    """
+    return {**schema}
@@ -0,0 +1,56 @@
+"""Internal memoization of type factories which returns the identical type for the same constraints."""
+
+from __future__ import annotations
+
+import functools
+import inspect
+from typing import Any
+from typing import Callable
+from typing import Tuple
+from typing import TypeVar
+from weakref import WeakValueDictionary
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_Key = Tuple[Tuple[str, type, Any], ...]
+
+
+def canonical(factory: F) -> F:
+    """Memoize factory of constrained type by its arguments.
+
+    Arguments are bound to the signature with defaults,
+    so that calls which differ only in order of keywords or in omitted defaults return the identical type.
+    Types of arguments are part of the key, so that `1`, `1.0` and `True` return different types.
+    Calls with unhashable arguments are not memoized.
+    Types are referenced weakly, so that types which are no longer used, for example, of dropped tenants,
+    are released instead of growing the memo with every combination of constraints ever created.
+    The unmemoized factory is available as `__wrapped__`.
+
+    Args:
+        factory: The function which creates constrained type.
+
+    Returns:
+        The memoized factory.
+    """
+    signature = inspect.signature(factory)
+
+    types: WeakValueDictionary[_Key, Any] = WeakValueDictionary()
+
+    @functools.wraps(factory)
+    # Reason: The arguments of type factory
+    def wrapper(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        key = tuple((name, type(value), value) for name, value in bound.arguments.items())
+        try:
+            hash(key)
+        except TypeError:
+            return factory(*args, **kwargs)
+        type_ = types.get(key)
+        if type_ is None:
+            # Concurrent first calls may create the type more than once, but every caller gets the type stored first.
+            type_ = types.setdefault(key, factory(*args, **kwargs))
+        return type_
+
+    # Reason: functools.wraps keeps the signature of factory.
+    return wrapper  # type: ignore[return-value]
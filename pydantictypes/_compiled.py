@@ -0,0 +1,29 @@
+"""Internal base of validators whose constraints are compiled into closures."""
+
+from __future__ import annotations
+
+from typing import Any
+from typing import ClassVar
+
+
+class Compiled:
+    """Mixin of validator which compiles its constraints into closures by `_compile()` when it's created.
+
+    Closures can't be pickled to send the validator into other processes,
+    so that the attributes named in `COMPILED` are dropped on pickling and compiled again on unpickling.
+    """
+
+    COMPILED: ClassVar[tuple[str, ...]] = ()
+
+    def _compile(self) -> None:
+        raise NotImplementedError
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        for name in self.COMPILED:
+            del state[name]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._compile()
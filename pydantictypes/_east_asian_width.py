@@ -0,0 +1,69 @@
+"""Internal scanner to find characters which are not half-width by East Asian Width."""
+
+from __future__ import annotations
+
+import re
+import unicodedata
+from typing import Iterable
+from typing import Pattern
+
+from pydantictypes._accelerator import accelerated
+from pydantictypes._lock_free_cache import LockFreeCache
+
+# Wide, Fullwidth and Ambiguous. No ASCII character has these widths.
+NOT_HALF_WIDTH = frozenset(("W", "F", "A"))
+MAX_BMP = 0xFFFF
+
+
+def to_ranges(code_points: Iterable[int]) -> list[tuple[int, int]]:
+    """Merge ascending code points into ranges of consecutive code points."""
+    ranges: list[tuple[int, int]] = []
+    for code_point in code_points:
+        if ranges and ranges[-1][1] == code_point - 1:
+            ranges[-1] = (ranges[-1][0], code_point)
+        else:
+            ranges.append((code_point, code_point))
+    return ranges
+
+
+def build_candidate_pattern(_unidata_version: str) -> Pattern[str]:
+    """Return the pattern which matches a character which may not be half-width.
+
+    The character class is built from the Unicode database of running Python.
+    It includes the exact characters in the Basic Multilingual Plane
+    so that `re` looks up each character by bitmap,
+    and includes every character out of the Basic Multilingual Plane
+    since ranges out of it make `re` look up each character by linear search of ranges.
+    """
+    code_points = (
+        code_point
+        for code_point in range(MAX_BMP + 1)
+        if unicodedata.east_asian_width(chr(code_point)) in NOT_HALF_WIDTH
+    )
+    character_class = "".join(rf"\u{start:04x}-\u{end:04x}" for start, end in to_ranges(code_points))
+    return re.compile(rf"[{character_class}\U00010000-\U0010ffff]")
+
+
+# Patterns by version of the Unicode database, which are built on first use.
+CANDIDATE_PATTERNS: LockFreeCache[str, Pattern[str]] = LockFreeCache(build_candidate_pattern)
+
+
+@accelerated
+def find_not_half_width(value: str) -> int:
+    """Return the index of the first character which is not half-width, or -1 if there is no such character.
+
+    The string is scanned in C by precompiled pattern,
+    and only characters out of the Basic Multilingual Plane are checked again by the Unicode database.
+    """
+    # Reason: Any ASCII character is half-width.
+    if value.isascii():
+        return -1
+    pattern = CANDIDATE_PATTERNS[unicodedata.unidata_version]
+    matches = pattern.search(value)
+    while matches is not None:
+        index = matches.start()
+        character = value[index]
+        if ord(character) <= MAX_BMP or unicodedata.east_asian_width(character) in NOT_HALF_WIDTH:
+            return index
+        matches = pattern.search(value, index + 1)
+    return -1
@@ -0,0 +1,28 @@
+"""Internal memoization which doesn't serialize threads on lookup."""
+
+from __future__ import annotations
+
+from typing import Callable
+from typing import Dict
+from typing import TypeVar
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class LockFreeCache(Dict[K, V]):
+    """Dictionary which computes the value of missing key by function and keeps it without limit of size.
+
+    `functools.lru_cache` locks the cache for each call on free-threaded Python,
+    so threads which call the same cached function contend for the lock.
+    Lookup of dict doesn't block other threads, and a hit costs only subscription in C.
+    Concurrent first lookups may call function more than once, but every caller gets the value stored first.
+    Use only for few distinct keys, such as formats, classes or versions.
+    """
+
+    def __init__(self, function: Callable[[K], V]) -> None:
+        super().__init__()
+        self.function = function
+
+    def __missing__(self, key: K) -> V:
+        return self.setdefault(key, self.function(key))
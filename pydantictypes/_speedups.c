@@ -0,0 +1,463 @@
+/*
+ * Optional compiled fast paths of hot functions of pydantictypes.
+ *
+ * Each accelerated function handles only the values whose result is obvious, for example,
+ * a string of ASCII digits and commas, and defers every other value to the pure Python function,
+ * so that errors and unusual values, such as non-ASCII digits, behave exactly as the pure Python function.
+ * See pydantictypes/_accelerator.py for how the functions are selected.
+ */
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+#include <datetime.h>
+#include <structmember.h>
+
+/* Strings are always ready since Python 3.12, which deprecates PyUnicode_READY(). */
+#if PY_VERSION_HEX >= 0x030C0000
+#define READY(value) 0
+#else
+#define READY(value) PyUnicode_READY(value)
+#endif
+
+/* Digits which fit into long long without overflow. */
+#define MAX_FAST_DIGITS 18
+#define YEN_SIGN 0x5186
+
+/*
+ * Fast path of one function.
+ * Returns new reference of the result, or NULL without exception to defer to the pure Python function,
+ * or NULL with exception.
+ */
+typedef PyObject *(*fast_path)(PyObject *state, PyObject *value);
+
+typedef struct {
+    PyObject_HEAD
+    fast_path fast;
+    PyObject *fallback;
+    PyObject *state;
+#if PY_VERSION_HEX >= 0x03090000
+    vectorcallfunc vectorcall;
+#endif
+} AcceleratedObject;
+
+static PyObject *
+call_fallback(AcceleratedObject *self, PyObject *value)
+{
+    return PyObject_CallFunctionObjArgs(self->fallback, value, NULL);
+}
+
+static PyObject *
+accelerated_call_one(AcceleratedObject *self, PyObject *value)
+{
+    PyObject *result = self->fast(self->state, value);
+    if (result != NULL || PyErr_Occurred()) {
+        return result;
+    }
+    return call_fallback(self, value);
+}
+
+static PyObject *
+accelerated_call(PyObject *self, PyObject *args, PyObject *kwargs)
+{
+    if (kwargs != NULL && PyDict_GET_SIZE(kwargs) != 0) {
+        return PyObject_Call(((AcceleratedObject *)self)->fallback, args, kwargs);
+    }
+    if (PyTuple_GET_SIZE(args) != 1) {
+        return PyObject_Call(((AcceleratedObject *)self)->fallback, args, NULL);
+    }
+    return accelerated_call_one((AcceleratedObject *)self, PyTuple_GET_ITEM(args, 0));
+}
+
+#if PY_VERSION_HEX >= 0x03090000
+static PyObject *
+accelerated_vectorcall(PyObject *self, PyObject *const *args, size_t nargsf, PyObject *kwnames)
+{
+    if (PyVectorcall_NARGS(nargsf) != 1 || kwnames != NULL) {
+        return PyObject_Vectorcall(((AcceleratedObject *)self)->fallback, args, nargsf, kwnames);
+    }
+    return accelerated_call_one((AcceleratedObject *)self, args[0]);
+}
+#endif
+
+static int
+accelerated_traverse(AcceleratedObject *self, visitproc visit, void *arg)
+{
+    Py_VISIT(self->fallback);
+    Py_VISIT(self->state);
+    return 0;
+}
+
+static int
+accelerated_clear(AcceleratedObject *self)
+{
+    Py_CLEAR(self->fallback);
+    Py_CLEAR(self->state);
+    return 0;
+}
+
+static void
+accelerated_dealloc(AcceleratedObject *self)
+{
+    PyObject_GC_UnTrack(self);
+    accelerated_clear(self);
+    Py_TYPE(self)->tp_free((PyObject *)self);
+}
+
+static PyObject *
+accelerated_repr(AcceleratedObject *self)
+{
+    return PyUnicode_FromFormat("<accelerated %R>", self->fallback);
+}
+
+/* Pickle by the pure Python function, so that unpickling selects the compiled function again, if any. */
+static PyObject *
+accelerated_reduce(AcceleratedObject *self, PyObject *Py_UNUSED(ignored))
+{
+    PyObject *accelerator = PyImport_ImportModule("pydantictypes._accelerator");
+    if (accelerator == NULL) {
+        return NULL;
+    }
+    PyObject *reduced = PyObject_CallMethod(accelerator, "reduce", "OO", self->fallback, self->state);
+    Py_DECREF(accelerator);
+    return reduced;
+}
+
+static PyMethodDef accelerated_methods[] = {
+    {"__reduce__", (PyCFunction)accelerated_reduce, METH_NOARGS, "Return how to pickle the function."},
+    {NULL, NULL, 0, NULL},
+};
+
+static PyMemberDef accelerated_members[] = {
+    {"__wrapped__", T_OBJECT, offsetof(AcceleratedObject, fallback), READONLY, "The pure Python function."},
+    {NULL},
+};
+
+static PyTypeObject AcceleratedType = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+    .tp_name = "pydantictypes._speedups.Accelerated",
+    .tp_doc = "Function which runs compiled fast path and defers the other values to the pure Python function.",
+    .tp_basicsize = sizeof(AcceleratedObject),
+    .tp_dealloc = (destructor)accelerated_dealloc,
+    .tp_free = PyObject_GC_Del,
+    .tp_repr = (reprfunc)accelerated_repr,
+    .tp_call = accelerated_call,
+    .tp_traverse = (traverseproc)accelerated_traverse,
+    .tp_clear = (inquiry)accelerated_clear,
+    .tp_methods = accelerated_methods,
+    .tp_members = accelerated_members,
+#if PY_VERSION_HEX >= 0x03090000
+    .tp_vectorcall_offset = offsetof(AcceleratedObject, vectorcall),
+    .tp_flags = Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC | Py_TPFLAGS_HAVE_VECTORCALL,
+#else
+    .tp_flags = Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC,
+#endif
+};
+
+static int
+is_ascii_digit(Py_UCS4 character)
+{
+    return '0' <= character && character <= '9';
+}
+
+/*
+ * Convert ASCII digits and commas in [start, end) into int, as `int(digits.replace(",", ""))` does.
+ * Defers when there is no digit, too many digits or any other character.
+ */
+static PyObject *
+digits_with_comma_to_int(int kind, const void *data, Py_ssize_t start, Py_ssize_t end, int negative)
+{
+    long long number = 0;
+    int digits = 0;
+    for (Py_ssize_t index = start; index < end; index++) {
+        Py_UCS4 character = PyUnicode_READ(kind, data, index);
+        if (character == ',') {
+            continue;
+        }
+        if (!is_ascii_digit(character) || ++digits > MAX_FAST_DIGITS) {
+            return NULL;
+        }
+        number = number * 10 + (character - '0');
+    }
+    if (digits == 0) {
+        return NULL;
+    }
+    return PyLong_FromLongLong(negative ? -number : number);
+}
+
+/* `validate_optional_string_type()`. Defers the values other than None and exact string, such as invalid values. */
+static PyObject *
+fast_validate_optional_string_type(PyObject *state, PyObject *value)
+{
+    if (value == Py_None) {
+        Py_RETURN_NONE;
+    }
+    if (!PyUnicode_CheckExact(value) || READY(value) < 0) {
+        PyErr_Clear();
+        return NULL;
+    }
+    if (PyUnicode_GET_LENGTH(value) == 0) {
+        Py_RETURN_NONE;
+    }
+    Py_INCREF(value);
+    return value;
+}
+
+/* `Utility.convert_string_with_comma_to_int()` for an optional sign followed by ASCII digits and commas. */
+static PyObject *
+fast_convert_string_with_comma_to_int(PyObject *state, PyObject *value)
+{
+    if (!PyUnicode_CheckExact(value) || READY(value) < 0 || !PyUnicode_IS_ASCII(value)) {
+        PyErr_Clear();
+        return NULL;
+    }
+    Py_ssize_t length = PyUnicode_GET_LENGTH(value);
+    int kind = PyUnicode_KIND(value);
+    const void *data = PyUnicode_DATA(value);
+    Py_UCS4 first = length > 0 ? PyUnicode_READ(kind, data, 0) : 0;
+    int has_sign = first == '-' || first == '+';
+    return digits_with_comma_to_int(kind, data, has_sign, length, first == '-');
+}
+
+/* `Utility.convert_string_to_int_or_none()`. */
+static PyObject *
+fast_convert_string_to_int_or_none(PyObject *state, PyObject *value)
+{
+    if (PyUnicode_CheckExact(value) && READY(value) == 0 && PyUnicode_GET_LENGTH(value) == 0) {
+        Py_RETURN_NONE;
+    }
+    PyErr_Clear();
+    return fast_convert_string_with_comma_to_int(state, value);
+}
+
+static int
+is_digit_or_comma(Py_UCS4 character)
+{
+    return character == ',' || Py_UNICODE_ISDECIMAL(character);
+}
+
+/* Return the end of the run of `[\d,]` from start as the pattern of `YenParser` does. */
+static Py_ssize_t
+end_of_amount(int kind, const void *data, Py_ssize_t start, Py_ssize_t length)
+{
+    Py_ssize_t end = start;
+    while (end < length && is_digit_or_comma(PyUnicode_READ(kind, data, end))) {
+        end++;
+    }
+    return end;
+}
+
+/* Return whether exact string which contains no decimal point, so that the pattern of `YenParser` may match. */
+static int
+may_be_yen_string(PyObject *value)
+{
+    if (!PyUnicode_CheckExact(value) || READY(value) < 0) {
+        PyErr_Clear();
+        return 0;
+    }
+    return PyUnicode_FindChar(value, '.', 0, PyUnicode_GET_LENGTH(value), 1) == -1;
+}
+
+/*
+ * `Utility.convert_kanji_yen_string_to_int()`.
+ * The pattern `[^.]*?([\d,]+)\s*円[^.]*\Z` matches the first run of `[\d,]` which is followed by `\s*円`.
+ */
+static PyObject *
+fast_convert_kanji_yen_string_to_int(PyObject *state, PyObject *value)
+{
+    if (!may_be_yen_string(value)) {
+        return NULL;
+    }
+    Py_ssize_t length = PyUnicode_GET_LENGTH(value);
+    int kind = PyUnicode_KIND(value);
+    const void *data = PyUnicode_DATA(value);
+    Py_ssize_t start = 0;
+    while (start < length) {
+        if (!is_digit_or_comma(PyUnicode_READ(kind, data, start))) {
+            start++;
+            continue;
+        }
+        Py_ssize_t end = end_of_amount(kind, data, start, length);
+        Py_ssize_t suffix = end;
+        while (suffix < length && Py_UNICODE_ISSPACE(PyUnicode_READ(kind, data, suffix))) {
+            suffix++;
+        }
+        if (suffix < length && PyUnicode_READ(kind, data, suffix) == YEN_SIGN) {
+            return digits_with_comma_to_int(kind, data, start, end, 0);
+        }
+        start = end;
+    }
+    return NULL;
+}
+
+/*
+ * `Utility.convert_symbol_yen_string_to_int()`.
+ * The pattern `[^.]*?\\([\d,]+)[^.]*\Z` matches the run of `[\d,]` after the first backslash which is followed by it.
+ */
+static PyObject *
+fast_convert_symbol_yen_string_to_int(PyObject *state, PyObject *value)
+{
+    if (!may_be_yen_string(value)) {
+        return NULL;
+    }
+    Py_ssize_t length = PyUnicode_GET_LENGTH(value);
+    int kind = PyUnicode_KIND(value);
+    const void *data = PyUnicode_DATA(value);
+    for (Py_ssize_t index = 0; index + 1 < length; index++) {
+        if (PyUnicode_READ(kind, data, index) == '\\' && is_digit_or_comma(PyUnicode_READ(kind, data, index + 1))) {
+            return digits_with_comma_to_int(kind, data, index + 1, end_of_amount(kind, data, index + 1, length), 0);
+        }
+    }
+    return NULL;
+}
+
+/* `find_not_half_width()` for ASCII string, whose characters are all half-width. */
+static PyObject *
+fast_find_not_half_width(PyObject *state, PyObject *value)
+{
+    if (!PyUnicode_CheckExact(value) || READY(value) < 0 || !PyUnicode_IS_ASCII(value)) {
+        PyErr_Clear();
+        return NULL;
+    }
+    return PyLong_FromLong(-1);
+}
+
+/* Read the ASCII digits of the slice, which the template has already checked. */
+static int
+read_number(int kind, const void *data, PyObject *state, Py_ssize_t index)
+{
+    Py_ssize_t start = PyLong_AsSsize_t(PyTuple_GET_ITEM(state, index));
+    Py_ssize_t stop = PyLong_AsSsize_t(PyTuple_GET_ITEM(state, index + 1));
+    int number = 0;
+    for (Py_ssize_t position = start; position < stop; position++) {
+        number = number * 10 + (int)(PyUnicode_READ(kind, data, position) - '0');
+    }
+    return number;
+}
+
+/*
+ * `FixedFormatParser.parse()`. The state is the template and the start and stop of year, month and day.
+ * Defers the strings which don't conform to the template and invalid dates, for which the method returns None.
+ */
+static PyObject *
+fast_parse_fixed_format(PyObject *state, PyObject *value)
+{
+    PyObject *template = PyTuple_GET_ITEM(state, 0);
+    if (!PyUnicode_CheckExact(value) || READY(value) < 0 ||
+        PyUnicode_GET_LENGTH(value) != PyUnicode_GET_LENGTH(template)) {
+        PyErr_Clear();
+        return NULL;
+    }
+    int kind = PyUnicode_KIND(value);
+    const void *data = PyUnicode_DATA(value);
+    int template_kind = PyUnicode_KIND(template);
+    const void *template_data = PyUnicode_DATA(template);
+    for (Py_ssize_t index = 0; index < PyUnicode_GET_LENGTH(value); index++) {
+        Py_UCS4 character = PyUnicode_READ(kind, data, index);
+        Py_UCS4 expected = PyUnicode_READ(template_kind, template_data, index);
+        if (is_ascii_digit(character) ? expected != '0' : character != expected) {
+            return NULL;
+        }
+    }
+    PyObject *parsed = PyDateTime_FromDateAndTime(
+        read_number(kind, data, state, 1), read_number(kind, data, state, 3), read_number(kind, data, state, 5), 0, 0,
+        0, 0);
+    if (parsed == NULL && PyErr_ExceptionMatches(PyExc_ValueError)) {
+        PyErr_Clear();
+    }
+    return parsed;
+}
+
+typedef struct {
+    const char *qualname;
+    fast_path fast;
+} FastPathEntry;
+
+static const FastPathEntry FAST_PATHS[] = {
+    {"validate_optional_string_type", fast_validate_optional_string_type},
+    {"Utility.convert_string_with_comma_to_int", fast_convert_string_with_comma_to_int},
+    {"Utility.convert_string_to_int_or_none", fast_convert_string_to_int_or_none},
+    {"Utility.convert_kanji_yen_string_to_int", fast_convert_kanji_yen_string_to_int},
+    {"Utility.convert_symbol_yen_string_to_int", fast_convert_symbol_yen_string_to_int},
+    {"find_not_half_width", fast_find_not_half_width},
+    {"FixedFormatParser.parse_by_slicing", fast_parse_fixed_format},
+    {NULL, NULL},
+};
+
+static PyObject *
+accelerate(PyObject *module, PyObject *args)
+{
+    const char *qualname;
+    PyObject *fallback;
+    PyObject *state;
+    if (!PyArg_ParseTuple(args, "sOO!:accelerate", &qualname, &fallback, &PyTuple_Type, &state)) {
+        return NULL;
+    }
+    for (const FastPathEntry *entry = FAST_PATHS; entry->qualname != NULL; entry++) {
+        if (strcmp(entry->qualname, qualname) != 0) {
+            continue;
+        }
+        AcceleratedObject *self = PyObject_GC_New(AcceleratedObject, &AcceleratedType);
+        if (self == NULL) {
+            return NULL;
+        }
+        self->fast = entry->fast;
+        Py_INCREF(fallback);
+        self->fallback = fallback;
+        Py_INCREF(state);
+        self->state = state;
+#if PY_VERSION_HEX >= 0x03090000
+        self->vectorcall = accelerated_vectorcall;
+#endif
+        PyObject_GC_Track(self);
+        return (PyObject *)self;
+    }
+    PyErr_Format(PyExc_ValueError, "No fast path of %s", qualname);
+    return NULL;
+}
+
+static PyMethodDef speedups_methods[] = {
+    {"accelerate", accelerate, METH_VARARGS,
+     "accelerate(qualname, fallback, state)\n--\n\n"
+     "Return the function which runs the fast path of qualname and defers the other values to fallback."},
+    {NULL, NULL, 0, NULL},
+};
+
+static int
+speedups_exec(PyObject *module)
+{
+    PyDateTime_IMPORT;
+    if (PyDateTimeAPI == NULL) {
+        return -1;
+    }
+    if (PyType_Ready(&AcceleratedType) < 0) {
+        return -1;
+    }
+    Py_INCREF(&AcceleratedType);
+    if (PyModule_AddObject(module, "Accelerated", (PyObject *)&AcceleratedType) < 0) {
+        Py_DECREF(&AcceleratedType);
+        return -1;
+    }
+    return 0;
+}
+
+static PyModuleDef_Slot speedups_slots[] = {
+    {Py_mod_exec, speedups_exec},
+#ifdef Py_GIL_DISABLED
+    {Py_mod_gil, Py_MOD_GIL_NOT_USED},
+#endif
+    {0, NULL},
+};
+
+static struct PyModuleDef speedups_module = {
+    PyModuleDef_HEAD_INIT,
+    .m_name = "pydantictypes._speedups",
+    .m_doc = "Optional compiled fast paths of hot functions of pydantictypes.",
+    .m_size = 0,
+    .m_methods = speedups_methods,
+    .m_slots = speedups_slots,
+};
+
+PyMODINIT_FUNC
+PyInit__speedups(void)
+{
+    return PyModuleDef_Init(&speedups_module);
+}
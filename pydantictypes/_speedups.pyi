@@ -0,0 +1,9 @@
+from typing import Any
+from typing import Callable
+
+class Accelerated:
+    __wrapped__: Callable[..., Any]
+    def __call__(self, value: Any) -> Any: ...  # noqa: ANN401
+    def __reduce__(self) -> tuple[Callable[..., Any], tuple[Any, ...]]: ...
+
+def accelerate(qualname: str, fallback: Callable[..., Any], state: tuple[Any, ...]) -> Accelerated: ...
@@ -3,8 +3,28 @@
 from __future__ import annotations
 
 from typing import Any
+from typing import Callable
 
+from pydantic_core import PydanticCustomError
 
+from pydantictypes._accelerator import accelerated
+
+
+# Reason: The argument of pydantic type
+def string_required_error(value: Any) -> PydanticCustomError:  # noqa: ANN401
+    """Create the error for the value which is not a string.
+
+    The message is formatted only when it is rendered,
+    so that invalid values don't pay for the string conversion of arbitrarily large inputs.
+    """
+    error_type = "string_required"
+    msg = "String required. Value is {value}. Type is {type}."
+    # Reason: pydantic-core renders bool in context as int.
+    rendered = str(value) if isinstance(value, bool) else value
+    return PydanticCustomError(error_type, msg, {"value": rendered, "type": type(value)})
+
+
+@accelerated
 # Reason: The argument of pydantic type
 def validate_optional_string_type(value: Any) -> str | None:  # noqa: ANN401
     """Validate and normalize optional string values.
@@ -19,18 +39,34 @@ def validate_optional_string_type(value: Any) -> str | None:  # noqa: ANN401
         The validated string or None if the value is None or empty string.
 
     Raises:
-        ValueError: If value is not None or a string.
+        PydanticCustomError: If value is not None or a string.
     """
     # Handle None before type check
     if value is None:
         return None
 
     if not isinstance(value, str):
-        msg = f"String required. Value is {value}. Type is {type(value)}."
-        # Reason: must be ValueError: Pydantic v2 only wraps ValueError into ValidationError; otherwise TypeError propagates to the caller uncaught by Pydantic
-        raise ValueError(msg)  # noqa: TRY004
+        # Reason: must not be TypeError: Pydantic v2 only wraps ValueError and PydanticCustomError into ValidationError; otherwise TypeError propagates to the caller uncaught by Pydantic
+        raise string_required_error(value)
 
     if value == "":
         return None
 
     return value
+
+
+class IntegerMustBeFromStr:
+    """Validator to convert string to int."""
+
+    def __init__(self, string_to_int: Callable[[str], int]) -> None:
+        self.string_to_int = string_to_int
+
+    # Reason: The argument of pydantic type
+    def validate(self, value: Any) -> int:  # noqa: ANN401
+        self.raise_if_not_str(value)
+        return self.string_to_int(value)
+
+    # Reason: The argument of pydantic type
+    def raise_if_not_str(self, value: Any) -> None:  # noqa: ANN401
+        if not isinstance(value, str):
+            raise string_required_error(value)
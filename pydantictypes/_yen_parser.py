@@ -0,0 +1,60 @@
+"""Internal parser to convert yen string to int."""
+
+from __future__ import annotations
+
+import re
+from typing import NoReturn
+from typing import Pattern
+
+from pydantic_core import PydanticCustomError
+
+
+class YenParser:
+    """Parser to convert yen string to int.
+
+    The pattern is compiled once, and its prefix and suffix reject decimal point,
+    so that one scan both checks decimal point and finds amount.
+    The string is scanned again to decide the error message only when the scan fails.
+    """
+
+    def __init__(self, amount_pattern: str) -> None:
+        """Compile the pattern.
+
+        Args:
+            amount_pattern: Regular expression which captures digits and commas of amount as group 1.
+        """
+        # Lazy prefix finds the leftmost amount as same as `re.search()`.
+        self.pattern: Pattern[str] = re.compile(rf"[^.]*?{amount_pattern}[^.]*\Z")
+
+    def parse(self, yen_string: str) -> int:
+        """Convert yen string to int.
+
+        Args:
+            yen_string: The yen string to convert.
+
+        Returns:
+            The amount of yen.
+
+        Raises:
+            PydanticCustomError: If yen string includes decimal point or doesn't include amount.
+        """
+        matches = self.pattern.match(yen_string)
+        if matches is None:
+            self.raise_error(yen_string)
+        digits = matches.group(1)
+        return int(digits.replace(",", "") if "," in digits else digits)
+
+    @staticmethod
+    def raise_error(yen_string: str) -> NoReturn:
+        context = {"yen_string": yen_string}
+        if "." in yen_string:
+            error_type = "yen_string_decimal"
+            msg = "Decimal is unsupported. Yen string = {yen_string}"
+            raise PydanticCustomError(error_type, msg, context)
+        error_type = "yen_string"
+        msg = "Invalid yen string. Yen string = {yen_string}"
+        raise PydanticCustomError(error_type, msg, context)
+
+
+KANJI_YEN_PARSER = YenParser(r"([\d,]+)\s*円")
+SYMBOL_YEN_PARSER = YenParser(r"\\([\d,]+)")
@@ -5,105 +5,92 @@ from __future__ import annotations
 from abc import abstractmethod
 from typing import TYPE_CHECKING
 from typing import Any
-from typing import Callable
+from typing import ClassVar
 
 from pydantic import ConfigDict
 from pydantic import GetCoreSchemaHandler
-from pydantic.v1 import errors
+from pydantic_core import SchemaValidator
+from pydantic_core import core_schema
 
-# Reason: Pylint's bug. pylint: disable-next=no-name-in-module
-from pydantic.v1.types import ConstrainedNumberMeta
-from pydantic.v1.types import OptionalInt
-from pydantic.v1.types import int_validator  # type: ignore[attr-defined]
-from pydantic.v1.types import strict_int_validator  # type: ignore[attr-defined]
-from pydantic.v1.types import update_not_none  # type: ignore[attr-defined]
-from pydantic.v1.utils import almost_equal_floats
-from pydantic_core.core_schema import no_info_after_validator_function
+from pydantictypes._cached_schema import copy_schema
+from pydantictypes._canonical import canonical
+
+# Reason: Kept for backward compatibility. pylint: disable-next=unused-import
+from pydantictypes._validation_utils import IntegerMustBeFromStr
 
 if TYPE_CHECKING:
-    from pydantic.v1.validators import Number
     from pydantic_core import CoreSchema
 
+__all__ = [
+    "ConstrainedInt",
+    "ConstrainedStringToInt",
+    "IntegerMustBeFromStr",
+    "constringtoint",
+]
 
-class IntegerMustBeFromStr:
-    """Validator to convert string to int."""
 
-    def __init__(self, string_to_int: Callable[[str], int]) -> None:
-        self.string_to_int = string_to_int
+class ConstrainedInt(int):
+    """Type that represents a constrained integer.
 
-    # Reason: The argument of pydantic type
-    def validate(self, value: Any) -> int:  # noqa: ANN401
-        self.raise_if_not_str(value)
-        return self.string_to_int(value)
-
-    # Reason: The argument of pydantic type
-    def raise_if_not_str(self, value: Any) -> None:  # noqa: ANN401
-        if not isinstance(value, str):
-            msg = f"String required. Value is {value}. Type is {type(value)}."
-            raise TypeError(msg)
-
-
-class ConstrainedInt(int, metaclass=ConstrainedNumberMeta):
-    """Type that represents a constrained integer."""
+    The constraints are compiled into `int_schema` of pydantic-core,
+    so that they are checked in Rust with exact integer arithmetic.
+    """
 
     strict: bool = False
-    gt: OptionalInt = None
-    ge: OptionalInt = None
-    lt: OptionalInt = None
-    le: OptionalInt = None
-    multiple_of: OptionalInt = None
+    gt: int | None = None
+    ge: int | None = None
+    lt: int | None = None
+    le: int | None = None
+    multiple_of: int | None = None
+    # Core schema and validator of each class, which are built on first use and released with the class,
+    # for example, created by `constringtoint()` for constraints which are no longer used.
+    _core_schema: ClassVar[CoreSchema | None] = None
+    _schema_validator: ClassVar[SchemaValidator | None] = None
 
     @classmethod
     # Reason: To follow Pydantic specification.
     # Reason: The argument of pydantic type pylint: disable-next=line-too-long
-    def __get_pydantic_core_schema__(cls, _source_type: Any, handler: GetCoreSchemaHandler) -> CoreSchema:  # noqa: ANN401
-        return no_info_after_validator_function(cls.validate, handler.generate_schema(str))
+    def __get_pydantic_core_schema__(cls, _source_type: Any, _handler: GetCoreSchemaHandler) -> CoreSchema:  # noqa: ANN401
+        return copy_schema(cls.cached_core_schema())
 
     @classmethod
-    def __get_pydantic_json_schema__(cls, field_schema: dict[str, Any]) -> None:
-        update_not_none(
-            field_schema,
-            exclusiveMinimum=cls.gt,
-            exclusiveMaximum=cls.lt,
-            minimum=cls.ge,
-            maximum=cls.le,
-            multipleOf=cls.multiple_of,
-        )
+    def cached_core_schema(cls) -> CoreSchema:
+        """Return the core schema, which is built once for each class."""
+        # Not inherited from base class, whose schema has other constraints.
+        schema = cls.__dict__.get("_core_schema")
+        if schema is None:
+            schema = cls._core_schema = cls.build_core_schema()
+        return schema
 
     @classmethod
-    # Reason: The argument of pydantic type
-    def validate(cls, value: Any) -> Number:  # noqa: ANN401
-        value = strict_int_validator(value) if cls.strict else int_validator(value)
-        value = cls.number_size_validator(value)
-        return cls.number_multiple_validator(value)
-
-    @classmethod
-    def number_size_validator(cls, v: Number) -> Number:
-        cls.number_size_validator_greater(v)
-        cls.number_size_validator_less(v)
-        return v
+    def build_core_schema(cls) -> CoreSchema:
+        return core_schema.int_schema(
+            strict=cls.strict,
+            gt=cls.gt,
+            ge=cls.ge,
+            lt=cls.lt,
+            le=cls.le,
+            multiple_of=cls.multiple_of,
+        )
 
     @classmethod
-    def number_size_validator_greater(cls, v: Number) -> None:
-        if cls.gt is not None and not v > cls.gt:
-            raise errors.NumberNotGtError(limit_value=cls.gt)
-        if cls.ge is not None and not v >= cls.ge:
-            raise errors.NumberNotGeError(limit_value=cls.ge)
+    def schema_validator(cls) -> SchemaValidator:
+        """Return the validator of core schema, which is built once for each class."""
+        validator = cls.__dict__.get("_schema_validator")
+        if validator is None:
+            validator = cls._schema_validator = SchemaValidator(cls.cached_core_schema())
+        return validator
 
     @classmethod
-    def number_size_validator_less(cls, v: Number) -> None:
-        if cls.lt is not None and not v < cls.lt:
-            raise errors.NumberNotLtError(limit_value=cls.lt)
-        if cls.le is not None and not v <= cls.le:
-            raise errors.NumberNotLeError(limit_value=cls.le)
+    # Reason: The argument of pydantic type
+    def validate(cls, value: Any) -> int:  # noqa: ANN401
+        """Validate value outside of Pydantic model.
 
-    @classmethod
-    def number_multiple_validator(cls, v: Number) -> Number:
-        if cls.multiple_of is not None:
-            mod = float(v) / float(cls.multiple_of) % 1
-            if not almost_equal_floats(mod, 0.0) and not almost_equal_floats(mod, 1.0):
-                raise errors.NumberNotMultipleError(multiple_of=cls.multiple_of)
-        return v
+        Raises:
+            ValidationError: If value is invalid or violates the constraints.
+        """
+        # Reason: pydantic-core returns int for int_schema.
+        return cls.schema_validator().validate_python(value)  # type: ignore[no-any-return]
 
 
 class ConstrainedStringToInt(ConstrainedInt):
@@ -112,10 +99,14 @@ class ConstrainedStringToInt(ConstrainedInt):
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
     @classmethod
-    # Reason: The argument of pydantic type
-    def validate(cls, value: Any) -> Number:  # noqa: ANN401
-        value = cls.integer_must_be_from_str(value)
-        return super().validate(value)
+    def build_core_schema(cls) -> CoreSchema:
+        return core_schema.chain_schema(
+            [
+                core_schema.str_schema(),
+                core_schema.no_info_plain_validator_function(cls.integer_must_be_from_str),
+                super().build_core_schema(),
+            ],
+        )
 
     @classmethod
     # Reason: The argument of pydantic type
@@ -131,6 +122,7 @@ class ConstrainedStringToInt(ConstrainedInt):
         raise NotImplementedError
 
 
+@canonical
 # Reason: Followed pydantic specification.
 def constringtoint(  # noqa: PLR0913 pylint: disable=too-many-arguments
     type_name: str,
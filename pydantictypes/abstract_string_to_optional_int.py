@@ -2,80 +2,132 @@
 
 from __future__ import annotations
 
+import math
+import operator
 from typing import TYPE_CHECKING
 from typing import Any
 
 import annotated_types
 
+from pydantictypes._compiled import Compiled
 from pydantictypes._validation_utils import validate_optional_string_type
 
 if TYPE_CHECKING:
     from collections.abc import Callable
+    from typing import Tuple
 
+    _Check = Tuple[Callable[[int, int], bool], int, str]
 
-def _check_gt_constraint(value: int, gt: int | None) -> None:
-    if gt is not None and not value > gt:
-        msg = f"Input should be greater than {gt}"
-        raise ValueError(msg)
 
+def _is_multiple_of(value: int, multiple_of: int) -> bool:
+    return value % multiple_of == 0
 
-def _check_ge_constraint(value: int, ge: int | None) -> None:
-    if ge is not None and not value >= ge:
-        msg = f"Input should be greater than or equal to {ge}"
-        raise ValueError(msg)
 
+# Reason: Constraint parameters follow Pydantic specification (gt, ge, lt, le, multiple_of)
+def _build_checks(
+    *,
+    gt: int | None,
+    ge: int | None,
+    lt: int | None,
+    le: int | None,
+    multiple_of: int | None,
+) -> tuple[_Check, ...]:
+    """Build predicate, limit and error message of each active constraint in the order to report."""
+    return tuple(
+        (predicate, limit, message.format(limit))
+        for predicate, limit, message in (
+            (operator.gt, gt, "Input should be greater than {}"),
+            (operator.ge, ge, "Input should be greater than or equal to {}"),
+            (operator.lt, lt, "Input should be less than {}"),
+            (operator.le, le, "Input should be less than or equal to {}"),
+            (_is_multiple_of, multiple_of, "Input should be a multiple of {}"),
+        )
+        if limit is not None
+    )
+
+
+def _raise_first_violation(value: int, checks: tuple[_Check, ...]) -> None:
+    for predicate, limit, message in checks:
+        if not predicate(value, limit):
+            raise ValueError(message)
+
+
+def _bounds(checks: tuple[_Check, ...]) -> tuple[float, float, float, float]:
+    """Return exclusive lower, inclusive lower, exclusive upper and inclusive upper bounds.
 
-def _check_lt_constraint(value: int, lt: int | None) -> None:
-    if lt is not None and not value < lt:
-        msg = f"Input should be less than {lt}"
-        raise ValueError(msg)
+    Absent bounds are infinities, so that all bounds are checked in one expression without any call.
+    """
+    limits = {predicate: limit for predicate, limit, _ in checks}
+    return (
+        limits.get(operator.gt, -math.inf),
+        limits.get(operator.ge, -math.inf),
+        limits.get(operator.lt, math.inf),
+        limits.get(operator.le, math.inf),
+    )
+
+
+def _compile_interval(checks: tuple[_Check, ...]) -> Callable[[int], None]:
+    lower_exclusive, lower_inclusive, upper_exclusive, upper_inclusive = _bounds(checks)
+
+    def check_numeric_constraints(value: int) -> None:
+        if not (lower_exclusive < value < upper_exclusive and lower_inclusive <= value <= upper_inclusive):
+            _raise_first_violation(value, checks)
 
+    return check_numeric_constraints
 
-def _check_le_constraint(value: int, le: int | None) -> None:
-    if le is not None and not value <= le:
-        msg = f"Input should be less than or equal to {le}"
-        raise ValueError(msg)
 
+def _compile_interval_and_multiple_of(checks: tuple[_Check, ...], multiple_of: int) -> Callable[[int], None]:
+    lower_exclusive, lower_inclusive, upper_exclusive, upper_inclusive = _bounds(checks)
 
-def _check_multiple_of_constraint(value: int, multiple_of: int | None) -> None:
-    if multiple_of is not None and value % multiple_of != 0:
-        msg = f"Input should be a multiple of {multiple_of}"
-        raise ValueError(msg)
+    def check_numeric_constraints(value: int) -> None:
+        if not (
+            lower_exclusive < value < upper_exclusive
+            and lower_inclusive <= value <= upper_inclusive
+            and value % multiple_of == 0
+        ):
+            _raise_first_violation(value, checks)
+
+    return check_numeric_constraints
 
 
 # Reason: Constraint parameters follow Pydantic specification (gt, ge, lt, le, multiple_of)
-def _check_numeric_constraints(  # noqa: PLR0913 pylint: disable=too-many-arguments
-    value: int,
+def _compile_numeric_constraints(
     *,
     gt: int | None = None,
     ge: int | None = None,
     lt: int | None = None,
     le: int | None = None,
     multiple_of: int | None = None,
-) -> None:
-    """Check if integer meets numeric constraints.
+) -> Callable[[int], None] | None:
+    """Compile numeric constraints into checker which contains only the active constraints.
+
+    The checker checks all constraints in one expression,
+    and checks each constraint again to decide the error message only when the value violates any constraint.
 
     Args:
-        value: The integer to check.
         gt: The value must be greater than this.
         ge: The value must be greater than or equal to this.
         lt: The value must be less than this.
         le: The value must be less than or equal to this.
         multiple_of: The value must be a multiple of this.
 
-    Raises:
-        ValueError: If the value does not meet the constraints.
+    Returns:
+        The checker which raises ValueError if the value does not meet the constraints,
+        or None if there is no constraint.
     """
-    _check_gt_constraint(value, gt)
-    _check_ge_constraint(value, ge)
-    _check_lt_constraint(value, lt)
-    _check_le_constraint(value, le)
-    _check_multiple_of_constraint(value, multiple_of)
+    checks = _build_checks(gt=gt, ge=ge, lt=lt, le=le, multiple_of=multiple_of)
+    if not checks:
+        return None
+    if multiple_of is None:
+        return _compile_interval(checks)
+    return _compile_interval_and_multiple_of(checks, multiple_of)
 
 
-class OptionalIntegerMustBeFromStr:
+class OptionalIntegerMustBeFromStr(Compiled):
     """Validator to convert string to optional int with numeric constraints."""
 
+    COMPILED = ("check_numeric_constraints",)
+
     # Reason: Constraint parameters follow Pydantic specification
     def __init__(  # noqa: PLR0913 pylint: disable=too-many-arguments
         self,
@@ -93,6 +145,16 @@ class OptionalIntegerMustBeFromStr:
         self.lt = lt
         self.le = le
         self.multiple_of = multiple_of
+        self._compile()
+
+    def _compile(self) -> None:
+        self.check_numeric_constraints = _compile_numeric_constraints(
+            gt=self.gt,
+            ge=self.ge,
+            lt=self.lt,
+            le=self.le,
+            multiple_of=self.multiple_of,
+        )
 
     # Reason: The argument of pydantic type
     def validate(self, value: Any) -> int | None:  # noqa: ANN401
@@ -105,21 +167,15 @@ class OptionalIntegerMustBeFromStr:
             The converted integer or None if value is None or empty string.
 
         Raises:
-            TypeError: If value is not None or a string.
+            PydanticCustomError: If value is not None or a string.
             ValueError: If the value does not meet the constraints.
         """
         validated = validate_optional_string_type(value)
         if validated is None:
             return None
         result = self.string_to_int(validated)
-        _check_numeric_constraints(
-            result,
-            gt=self.gt,
-            ge=self.ge,
-            lt=self.lt,
-            le=self.le,
-            multiple_of=self.multiple_of,
-        )
+        if self.check_numeric_constraints is not None:
+            self.check_numeric_constraints(result)
         return result
 
 
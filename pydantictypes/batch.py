@@ -0,0 +1,56 @@
+"""Batch validation of whole columns."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from dataclasses import field
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Generic
+from typing import TypeVar
+
+from pydantictypes._batch_core import BatchValidator
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+__all__ = [
+    "BatchResult",
+    "validate_many",
+]
+
+T = TypeVar("T")
+
+
+@dataclass
+class BatchResult(Generic[T]):
+    """Result of batch validation.
+
+    Attributes:
+        values: The validated values. The value at the index of error is None.
+        errors: The error messages by index of invalid values.
+    """
+
+    values: list[T | None]
+    errors: dict[int, str] = field(default_factory=dict)
+
+    @property
+    def is_valid(self) -> bool:
+        return not self.errors
+
+
+def validate_many(type_: type[T], values: Iterable[Any]) -> BatchResult[T]:
+    """Validate whole column of values as the type.
+
+    The column is validated in one call of pydantic-core instead of one call for each value,
+    and invalid values are reported by index instead of raising on the first invalid value.
+
+    Args:
+        type_: The type to validate as, for example, `StrictKanjiYenStringToInt`.
+        values: The values to validate.
+
+    Returns:
+        The validated values and the error messages by index.
+    """
+    validator: BatchValidator[T] = BatchValidator(type_, list(values))
+    return BatchResult(*validator.validate())
@@ -0,0 +1,201 @@
+"""Conversions of Apache Arrow arrays and pandas Series into typed columns.
+
+This module requires pyarrow and NumPy: pip install pydantictypes[arrow]
+Conversion of pandas Series requires also pandas: pip install pydantictypes[pandas]
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import NamedTuple
+from typing import Union
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from pydantictypes.batch import validate_many
+from pydantictypes.string_to_optional_bool import StringToBoolean
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+__all__ = [
+    "ArrowColumn",
+    "PandasColumn",
+    "convert_arrow_array",
+    "convert_series",
+]
+
+# Arrow types by the type which the validator returns. Subclasses are looked up in this order.
+ARROW_TYPES: list[tuple[type, pa.DataType]] = [
+    (StringToBoolean, pa.bool_()),
+    (bool, pa.bool_()),
+    (int, pa.int64()),
+    (datetime, pa.timestamp("us")),
+    (str, pa.string()),
+    (type(None), pa.null()),
+]
+INT64_MIN = int(np.iinfo(np.int64).min)
+INT64_MAX = int(np.iinfo(np.int64).max)
+
+
+class ArrowColumn(NamedTuple):
+    """Result of conversion of Arrow array.
+
+    Attributes:
+        values: The converted values. The value is null where it was null, None or invalid.
+        null: True where the element was converted into None, for example, empty string of optional type.
+        errors: The table of invalid elements, whose columns are "index", "value" and "error".
+    """
+
+    values: pa.Array
+    null: pa.BooleanArray
+    errors: pa.Table
+
+    @property
+    def invalid(self) -> pa.BooleanArray:
+        """True where the element was rejected."""
+        return pc.and_not(self.values.is_null(), self.null)
+
+
+class PandasColumn(NamedTuple):
+    """Result of conversion of pandas Series.
+
+    Attributes:
+        values: The converted values of nullable dtype, with the same index as the Series.
+            The value is missing where it was missing, None or invalid.
+        null: True where the element was converted into None, for example, empty string of optional type.
+        errors: The data frame of invalid elements by the index of the Series, whose columns are "value" and "error".
+    """
+
+    values: pd.Series[Any]
+    null: pd.Series[bool]
+    errors: pd.DataFrame
+
+    @property
+    def invalid(self) -> pd.Series[bool]:
+        """True where the element was rejected."""
+        return self.values.isna() & ~self.null
+
+
+class _Converted(NamedTuple):
+    """Converted column whose errors are not tabulated yet."""
+
+    array: pa.Array
+    null: np.ndarray[Any, np.dtype[np.bool_]]
+    invalid_rows: np.ndarray[Any, np.dtype[np.intp]]
+    messages: list[str]
+
+
+# Reason: The argument of pydantic type
+def arrow_type_of(type_: Any) -> pa.DataType | None:  # noqa: ANN401
+    """Return the Arrow type of values which the type returns, or None to let Arrow infer it.
+
+    Annotated types are unwrapped to the type which they annotate, and Optional types to the type inside them.
+    """
+    while hasattr(type_, "__metadata__") or getattr(type_, "__origin__", None) is Union:
+        if hasattr(type_, "__metadata__"):
+            type_ = type_.__origin__
+            continue
+        arguments = [argument for argument in type_.__args__ if argument is not type(None)]
+        type_ = arguments[0] if len(arguments) == 1 else object
+    for validated_type, arrow_type in ARROW_TYPES:
+        if isinstance(type_, type) and issubclass(type_, validated_type):
+            return arrow_type
+    return None
+
+
+def _to_arrow(values: list[Any], arrow_type: pa.DataType | None, errors: dict[int, str]) -> pa.Array:
+    """Convert validated values into Arrow array, and values which don't fit into int64 into errors."""
+    if arrow_type == pa.bool_():
+        values = [None if value is None else bool(value) for value in values]
+    elif arrow_type == pa.int64():
+        for index, value in enumerate(values):
+            if value is not None and not INT64_MIN <= value <= INT64_MAX:
+                errors[index] = f"Value doesn't fit into int64. Value = {value}"
+                values[index] = None
+    return pa.array(values, type=arrow_type)
+
+
+# Reason: The argument of pydantic type
+def _convert(type_: Any, codes: np.ndarray[Any, Any], uniques: list[Any]) -> _Converted:  # noqa: ANN401
+    """Validate each distinct value once, and spread results to rows by the codes of distinct values.
+
+    Args:
+        type_: The type to validate as.
+        codes: The index of distinct value for each row, or -1 for missing value, which is validated as None.
+        uniques: The distinct values.
+    """
+    distinct = [*uniques, None]
+    result = validate_many(type_, distinct)
+    errors = result.errors
+    converted = _to_arrow(result.values, arrow_type_of(type_), errors)
+    is_invalid = np.zeros(len(distinct), dtype=np.bool_)
+    is_invalid[list(errors)] = True
+    codes = np.where(codes < 0, len(uniques), codes)
+    values = converted.take(pa.array(codes))
+    null = values.is_null().to_numpy(zero_copy_only=False) & ~is_invalid[codes]
+    invalid_rows = np.flatnonzero(is_invalid[codes])
+    return _Converted(values, null, invalid_rows, [errors[code] for code in codes[invalid_rows].tolist()])
+
+
+# Reason: The argument of Arrow array
+def convert_arrow_array(type_: Any, array: Any) -> ArrowColumn:  # noqa: ANN401
+    """Convert Arrow array of raw strings into typed array with the rules of the type.
+
+    Each distinct value is validated once by `validate_many()`,
+    so that the column costs by the number of distinct values rather than the number of rows.
+    The Arrow type is int64 for integer types, timestamp for date types, bool for boolean types
+    and string for string types. Integers which don't fit into int64 are invalid.
+
+    Args:
+        type_: The type to validate as, for example, `StrictKanjiYenStringToInt`.
+        array: The Arrow array or chunked array, or sequence. Null is validated as None.
+
+    Returns:
+        The converted values, the mask of elements converted into None and the table of errors.
+    """
+    if isinstance(array, pa.ChunkedArray):
+        array = array.combine_chunks()
+    elif not isinstance(array, pa.Array):
+        array = pa.array(array)
+    encoded = array.dictionary_encode()
+    codes = encoded.indices.fill_null(-1).to_numpy(zero_copy_only=False)
+    converted = _convert(type_, codes, encoded.dictionary.to_pylist())
+    rows = pa.array(converted.invalid_rows, type=pa.int64())
+    errors = pa.table(
+        {"index": rows, "value": array.take(rows), "error": pa.array(converted.messages, type=pa.string())},
+    )
+    return ArrowColumn(converted.array, pa.array(converted.null, type=pa.bool_()), errors)
+
+
+# Reason: The argument of pydantic type
+def convert_series(type_: Any, series: pd.Series[Any]) -> PandasColumn:  # noqa: ANN401
+    """Convert pandas Series of raw strings into Series of nullable dtype with the rules of the type.
+
+    Each distinct value is validated once as same as `convert_arrow_array()`.
+    The dtype is `Int64` for integer types, `datetime64` for date types, `boolean` for boolean types
+    and `string` for string types.
+
+    Args:
+        type_: The type to validate as, for example, `StrictKanjiYenStringToInt`.
+        series: The Series. Missing value such as None, NaN and `pd.NA` is validated as None.
+
+    Returns:
+        The converted values, the mask of elements converted into None and the data frame of errors.
+    """
+    import pandas as pd  # noqa: PLC0415
+
+    codes, uniques = pd.factorize(series)
+    converted = _convert(type_, codes, uniques.tolist())
+    dtypes = {pa.int64(): pd.Int64Dtype(), pa.bool_(): pd.BooleanDtype(), pa.string(): pd.StringDtype()}
+    values = converted.array.to_pandas(types_mapper=dtypes.get)
+    values.index = series.index
+    errors = pd.DataFrame(
+        {"value": series.iloc[converted.invalid_rows].array, "error": converted.messages},
+        index=series.index[converted.invalid_rows],
+    )
+    return PandasColumn(values.rename(series.name), pd.Series(converted.null, index=series.index), errors)
@@ -4,7 +4,8 @@ from __future__ import annotations
 
 from typing import Any
 
-from pydantic import BeforeValidator
+from pydantictypes._cached_schema import CachedBeforeValidator
+from pydantictypes._validation_utils import string_required_error
 
 # Reason: To use raw typing imports
 try:
@@ -31,12 +32,11 @@ class EmptyStringToNoneValidator:
             None if value is an empty string.
 
         Raises:
-            TypeError: If value is not a string.
+            PydanticCustomError: If value is not a string.
             ValueError: If value is not an empty string.
         """
         if not isinstance(value, str):
-            msg = f"String required. Value is {value}. Type is {type(value)}."
-            raise TypeError(msg)
+            raise string_required_error(value)
         if value == "":
             return
         msg = "Value must be an empty string ''"
@@ -45,5 +45,5 @@ class EmptyStringToNoneValidator:
 
 EmptyStringToNone = Annotated[
     None,
-    BeforeValidator(EmptyStringToNoneValidator().validate),
+    CachedBeforeValidator(EmptyStringToNoneValidator().validate),
 ]
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
-import unicodedata
 from typing import Any
 from typing import Optional
 
-from pydantic import BeforeValidator
+from pydantic_core import PydanticCustomError
 
+from pydantictypes._cached_schema import CachedBeforeValidator
+from pydantictypes._east_asian_width import find_not_half_width
+from pydantictypes._validation_utils import string_required_error
 from pydantictypes._validation_utils import validate_optional_string_type
 
 # Reason: To use raw typing imports
@@ -29,14 +31,16 @@ def _check_half_width_characters(value: str) -> None:
         value: The string to check.
 
     Raises:
-        ValueError: If string contains full-width or ambiguous characters.
+        PydanticCustomError: If string contains full-width or ambiguous characters.
+            The context has the index and the character of the first one,
+            which are found in the same scan as the check.
     """
-    for char in value:
-        width = unicodedata.east_asian_width(char)
-        # Reject Wide, Fullwidth, and Ambiguous character widths
-        if width in ["W", "F", "A"]:
-            msg = "Must contain only half-width characters."
-            raise ValueError(msg)
+    # Reject Wide, Fullwidth, and Ambiguous character widths
+    index = find_not_half_width(value)
+    if index != -1:
+        error_type = "half_width_characters"
+        msg = "Must contain only half-width characters. Index = {index}, character = {character}"
+        raise PydanticCustomError(error_type, msg, {"index": index, "character": value[index]})
 
 
 class HalfWidthValidator:
@@ -53,12 +57,11 @@ class HalfWidthValidator:
             The validated string.
 
         Raises:
-            TypeError: If value is not a string.
+            PydanticCustomError: If value is not a string.
             ValueError: If string contains full-width or ambiguous characters.
         """
         if not isinstance(value, str):
-            msg = f"String required. Value is {value}. Type is {type(value)}."
-            raise TypeError(msg)
+            raise string_required_error(value)
 
         _check_half_width_characters(value)
 
@@ -79,7 +82,7 @@ class OptionalHalfWidthValidator:
             The validated string or None.
 
         Raises:
-            TypeError: If value is not a string.
+            PydanticCustomError: If value is not a string.
             ValueError: If string contains full-width or ambiguous characters.
         """
         validated = validate_optional_string_type(value)
@@ -93,10 +96,10 @@ class OptionalHalfWidthValidator:
 
 HalfWidthString = Annotated[
     str,
-    BeforeValidator(HalfWidthValidator().validate),
+    CachedBeforeValidator(HalfWidthValidator().validate),
 ]
 
 OptionalHalfWidthString = Annotated[
     Optional[str],
-    BeforeValidator(OptionalHalfWidthValidator().validate),
+    CachedBeforeValidator(OptionalHalfWidthValidator().validate),
 ]
@@ -0,0 +1,457 @@
+"""Streaming reader of CSV files which validates each row.
+
+Rows are read one by one from the file, so that memory doesn't grow with the size of the file.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from dataclasses import field
+from functools import lru_cache
+from itertools import islice
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Generic
+from typing import Mapping
+from typing import NamedTuple
+from typing import TypeVar
+from typing import overload
+
+from pydantic import BaseModel
+from pydantic import TypeAdapter
+from pydantic import ValidationError
+
+from pydantictypes._batch_core import TYPE_ADAPTER_CACHE_SIZE
+from pydantictypes._batch_core import BatchValidator
+from pydantictypes._batch_core import format_error
+from pydantictypes._batch_core import type_adapter
+
+# Reason: Pydantic requires typing_extensions.TypedDict before Python 3.12.
+if sys.version_info >= (3, 12):
+    from typing import TypedDict
+else:
+    from typing_extensions import TypedDict
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from collections.abc import Sequence
+    from concurrent.futures import Future
+    from typing import BinaryIO
+    from typing import TextIO
+
+__all__ = [
+    "CsvBatch",
+    "read_csv",
+    "read_csv_batches",
+    "read_csv_parallel",
+]
+
+TModel = TypeVar("TModel", bound=BaseModel)
+T = TypeVar("T")
+
+
+@dataclass
+class CsvBatch(Generic[T]):
+    """Batch of validated rows.
+
+    Attributes:
+        line_numbers: The line number where each row ends in the file.
+        values: The validated rows. The row at the index of error is None.
+        errors: The error messages by line number of invalid rows.
+    """
+
+    line_numbers: list[int]
+    values: list[T | None]
+    errors: dict[int, str] = field(default_factory=dict)
+
+    @property
+    def is_valid(self) -> bool:
+        return not self.errors
+
+
+@contextmanager
+def _open_text(source: str | os.PathLike[str] | BinaryIO, encoding: str) -> Iterator[TextIO]:
+    """Open file path or binary stream as text without closing the binary stream."""
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, encoding=encoding, newline="") as file:  # noqa: PTH123
+            yield file
+        return
+    text = io.TextIOWrapper(source, encoding=encoding, newline="")
+    try:
+        yield text
+    finally:
+        # Reason: Closing wrapper closes the binary stream of caller.
+        text.detach()
+
+
+# Reason: The argument of pydantic type
+def _typed_dict(schema: Mapping[str, Any]) -> Any:  # noqa: ANN401
+    # Reason: Column names may not be identifiers, and mypy doesn't support dynamic TypedDict.
+    return TypedDict("CsvRow", dict(schema))  # type: ignore[operator]
+
+
+# Reason: The argument of pydantic type
+@lru_cache(maxsize=TYPE_ADAPTER_CACHE_SIZE)
+def _cached_typed_dict(items: tuple[tuple[str, Any], ...]) -> Any:  # noqa: ANN401
+    return _typed_dict(dict(items))
+
+
+# Reason: The argument of pydantic type
+def _row_type(schema: type[BaseModel] | Mapping[str, Any]) -> Any:  # noqa: ANN401
+    """Return the type of row, which is the same for equal mappings so that its adapters are cached."""
+    if not isinstance(schema, Mapping):
+        return schema
+    try:
+        return _cached_typed_dict(tuple(schema.items()))
+    except TypeError:
+        # Some annotations, for example, with unhashable metadata, can't be the key of cache.
+        return _typed_dict(schema)
+
+
+def _columns(schema: type[BaseModel] | Mapping[str, Any]) -> list[str]:
+    """Return the column names of the file which has no header."""
+    if isinstance(schema, Mapping):
+        return list(schema)
+    return [field_info.alias or name for name, field_info in schema.model_fields.items()]
+
+
+class _CsvReader:
+    """Reader to read rows of CSV file as dictionaries by column name."""
+
+    def __init__(self, text: TextIO, columns: Sequence[str] | None, skip_rows: int, dialect: str) -> None:
+        self.reader = csv.reader(text, dialect)
+        for _ in islice(self.reader, skip_rows):
+            pass
+        self.columns = next(self.reader, []) if columns is None else columns
+
+    def __iter__(self) -> Iterator[tuple[int, dict[str, str]]]:
+        for row in self.reader:
+            yield self.reader.line_num, dict(zip(self.columns, row))
+
+
+@contextmanager
+# Reason: Options of csv module. pylint: disable-next=too-many-arguments
+def _read(  # noqa: PLR0913
+    source: str | os.PathLike[str] | BinaryIO,
+    schema: type[BaseModel] | Mapping[str, Any],
+    *,
+    encoding: str,
+    header: bool,
+    skip_rows: int,
+    dialect: str,
+) -> Iterator[_CsvReader]:
+    with _open_text(source, encoding) as text:
+        yield _CsvReader(text, None if header else _columns(schema), skip_rows, dialect)
+
+
+def _validate_row(adapter: TypeAdapter[T], line_number: int, row: dict[str, str]) -> T:
+    try:
+        return adapter.validate_python(row)
+    except ValidationError as error:
+        msg = f"Invalid row. Line number = {line_number}. {format_error(error)}"
+        raise ValueError(msg) from error
+
+
+@overload
+def read_csv(
+    source: str | os.PathLike[str] | BinaryIO,
+    schema: type[TModel],
+    *,
+    encoding: str = ...,
+    header: bool = ...,
+    skip_rows: int = ...,
+    dialect: str = ...,
+) -> Iterator[TModel]: ...
+
+
+@overload
+def read_csv(
+    source: str | os.PathLike[str] | BinaryIO,
+    schema: Mapping[str, Any],
+    *,
+    encoding: str = ...,
+    header: bool = ...,
+    skip_rows: int = ...,
+    dialect: str = ...,
+) -> Iterator[dict[str, Any]]: ...
+
+
+# Reason: Options of csv module. pylint: disable-next=too-many-arguments
+def read_csv(  # noqa: PLR0913
+    source: str | os.PathLike[str] | BinaryIO,
+    schema: type[BaseModel] | Mapping[str, Any],
+    *,
+    encoding: str = "utf-8-sig",
+    header: bool = True,
+    skip_rows: int = 0,
+    dialect: str = "excel",
+) -> Iterator[Any]:
+    """Read CSV file and validate each row.
+
+    Args:
+        source: The file path or the binary stream. The binary stream is not closed.
+        schema: The model, or the type by column name, to validate each row as.
+            Columns which are not in the schema are ignored.
+        encoding: The encoding of the file, for example, `"cp932"` for Shift_JIS with Windows extensions.
+        header: Whether the first row is the column names.
+            If False, the columns are in the order of fields of the model or keys of the mapping.
+        skip_rows: The number of rows to skip before the header, for example, the summary of statement.
+        dialect: The dialect of `csv` module.
+
+    Yields:
+        The model, or the dictionary of validated values by column name, for each row.
+
+    Raises:
+        ValueError: If the row is invalid. The message includes the line number.
+    """
+    adapter = type_adapter(_row_type(schema))
+    with _read(source, schema, encoding=encoding, header=header, skip_rows=skip_rows, dialect=dialect) as reader:
+        for line_number, row in reader:
+            yield _validate_row(adapter, line_number, row)
+
+
+@overload
+def read_csv_batches(
+    source: str | os.PathLike[str] | BinaryIO,
+    schema: type[TModel],
+    *,
+    batch_size: int = ...,
+    encoding: str = ...,
+    header: bool = ...,
+    skip_rows: int = ...,
+    dialect: str = ...,
+) -> Iterator[CsvBatch[TModel]]: ...
+
+
+@overload
+def read_csv_batches(
+    source: str | os.PathLike[str] | BinaryIO,
+    schema: Mapping[str, Any],
+    *,
+    batch_size: int = ...,
+    encoding: str = ...,
+    header: bool = ...,
+    skip_rows: int = ...,
+    dialect: str = ...,
+) -> Iterator[CsvBatch[dict[str, Any]]]: ...
+
+
+# Reason: Options of csv module. pylint: disable-next=too-many-arguments
+def read_csv_batches(  # noqa: PLR0913
+    source: str | os.PathLike[str] | BinaryIO,
+    schema: type[BaseModel] | Mapping[str, Any],
+    *,
+    batch_size: int = 10_000,
+    encoding: str = "utf-8-sig",
+    header: bool = True,
+    skip_rows: int = 0,
+    dialect: str = "excel",
+) -> Iterator[CsvBatch[Any]]:
+    """Read CSV file and validate rows in batches.
+
+    Each batch is validated in one call of pydantic-core as `validate_many()`,
+    and invalid rows are reported by line number instead of raising.
+    Only one batch is held in memory at a time.
+
+    Args:
+        source: The file path or the binary stream. The binary stream is not closed.
+        schema: The model, or the type by column name, to validate each row as.
+            Columns which are not in the schema are ignored.
+        batch_size: The maximum number of rows in each batch.
+        encoding: The encoding of the file, for example, `"cp932"` for Shift_JIS with Windows extensions.
+        header: Whether the first row is the column names.
+            If False, the columns are in the order of fields of the model or keys of the mapping.
+        skip_rows: The number of rows to skip before the header, for example, the summary of statement.
+        dialect: The dialect of `csv` module.
+
+    Yields:
+        The validated rows and the error messages by line number for each batch.
+    """
+    row_type = _row_type(schema)
+    with _read(source, schema, encoding=encoding, header=header, skip_rows=skip_rows, dialect=dialect) as reader:
+        rows = iter(reader)
+        batch = list(islice(rows, batch_size))
+        while batch:
+            line_numbers = [line_number for line_number, _ in batch]
+            values, errors = BatchValidator[Any](row_type, [row for _, row in batch]).validate()
+            yield CsvBatch(line_numbers, values, {line_numbers[index]: message for index, message in errors.items()})
+            batch = list(islice(rows, batch_size))
+
+
+class _Shard(NamedTuple):
+    """Byte range of file which starts and ends at line boundaries."""
+
+    path: str
+    start: int
+    end: int
+    encoding: str
+    dialect: str
+    columns: list[str]
+
+
+class _ShardResult(NamedTuple):
+    """Validated rows of shard whose line numbers are relative to the start of shard."""
+
+    line_numbers: list[int]
+    values: list[Any]
+    errors: dict[int, str]
+    number_of_lines: int
+
+    def to_batch(self, line_offset: int) -> CsvBatch[Any]:
+        return CsvBatch(
+            [line_offset + line_number for line_number in self.line_numbers],
+            self.values,
+            {line_offset + line_number: message for line_number, message in self.errors.items()},
+        )
+
+
+# Row type of each worker process, which is built once by initializer of the process.
+_WORKER_ROW_TYPES: dict[str, Any] = {}
+
+
+def _initialize_worker(schema: type[BaseModel] | Mapping[str, Any]) -> None:
+    _WORKER_ROW_TYPES["row"] = _row_type(schema)
+
+
+def _validate_shard(shard: _Shard) -> _ShardResult:
+    """Validate rows of shard in worker process."""
+    with open(shard.path, "rb") as file:  # noqa: PTH123
+        file.seek(shard.start)
+        data = file.read(shard.end - shard.start)
+    reader = csv.reader(io.StringIO(data.decode(shard.encoding), newline=""), shard.dialect)
+    line_numbers = []
+    rows = []
+    for row in reader:
+        line_numbers.append(reader.line_num)
+        rows.append(dict(zip(shard.columns, row)))
+    values, errors = BatchValidator[Any](_WORKER_ROW_TYPES["row"], rows).validate()
+    relative_errors = {line_numbers[index]: message for index, message in errors.items()}
+    return _ShardResult(line_numbers, values, relative_errors, data.count(b"\n"))
+
+
+# Reason: Options of csv module. pylint: disable-next=too-many-arguments
+def _read_columns(  # noqa: PLR0913
+    file: BinaryIO,
+    schema: type[BaseModel] | Mapping[str, Any],
+    *,
+    encoding: str,
+    header: bool,
+    skip_rows: int,
+    dialect: str,
+) -> list[str]:
+    """Read rows before data and return the column names."""
+    for _ in range(skip_rows):
+        file.readline()
+    if not header:
+        return _columns(schema)
+    return next(csv.reader([file.readline().decode(encoding)], dialect), [])
+
+
+def _shard_boundaries(file: BinaryIO, start: int, shard_size: int) -> list[int]:
+    """Split the rest of file into byte ranges of about shard_size which end at line boundaries."""
+    size = file.seek(0, os.SEEK_END)
+    boundaries = [start]
+    while boundaries[-1] < size:
+        file.seek(boundaries[-1] + shard_size)
+        file.readline()
+        boundaries.append(min(file.tell(), size))
+    return boundaries
+
+
+def _map_in_order(executor: ProcessPoolExecutor, shards: Iterator[_Shard], window: int) -> Iterator[_ShardResult]:
+    """Validate shards in parallel and yield results in order, keeping at most window shards in flight."""
+    futures: deque[Future[_ShardResult]] = deque(
+        executor.submit(_validate_shard, shard) for shard in islice(shards, window)
+    )
+    while futures:
+        result = futures.popleft().result()
+        futures.extend(executor.submit(_validate_shard, shard) for shard in islice(shards, 1))
+        yield result
+
+
+@overload
+def read_csv_parallel(
+    path: str | os.PathLike[str],
+    schema: type[TModel],
+    *,
+    max_workers: int | None = ...,
+    shard_size: int = ...,
+    encoding: str = ...,
+    header: bool = ...,
+    skip_rows: int = ...,
+    dialect: str = ...,
+) -> Iterator[CsvBatch[TModel]]: ...
+
+
+@overload
+def read_csv_parallel(
+    path: str | os.PathLike[str],
+    schema: Mapping[str, Any],
+    *,
+    max_workers: int | None = ...,
+    shard_size: int = ...,
+    encoding: str = ...,
+    header: bool = ...,
+    skip_rows: int = ...,
+    dialect: str = ...,
+) -> Iterator[CsvBatch[dict[str, Any]]]: ...
+
+
+# Reason: Options of csv module. pylint: disable-next=too-many-arguments
+def read_csv_parallel(  # noqa: PLR0913
+    path: str | os.PathLike[str],
+    schema: type[BaseModel] | Mapping[str, Any],
+    *,
+    max_workers: int | None = None,
+    shard_size: int = 4 * 1024 * 1024,
+    encoding: str = "utf-8-sig",
+    header: bool = True,
+    skip_rows: int = 0,
+    dialect: str = "excel",
+) -> Iterator[CsvBatch[Any]]:
+    """Read CSV file and validate rows in batches by worker processes.
+
+    The file is split into shards by byte ranges which end at line boundaries,
+    and each worker process reads and validates its shards as `read_csv_batches()`.
+    Batches are yielded in the order of the file.
+    At most twice as many shards as workers are in flight, so that memory doesn't grow with the size of the file.
+
+    Fields must not contain line breaks since shards are split at any line break.
+    Shift_JIS, CP932 and UTF-8 can be split at line breaks
+    since no byte of multibyte character is the same as line feed.
+
+    Args:
+        path: The file path.
+        schema: The model, or the type by column name, to validate each row as.
+            It must be picklable to be sent into worker processes, for example, the model defined at module level.
+        max_workers: The number of worker processes. Defaults to the number of CPUs.
+        shard_size: The approximate number of bytes of each shard.
+        encoding: The encoding of the file, for example, `"cp932"` for Shift_JIS with Windows extensions.
+        header: Whether the first row is the column names.
+            If False, the columns are in the order of fields of the model or keys of the mapping.
+        skip_rows: The number of rows to skip before the header, for example, the summary of statement.
+        dialect: The dialect of `csv` module.
+
+    Yields:
+        The validated rows and the error messages by line number for each shard.
+    """
+    with open(path, "rb") as file:  # noqa: PTH123
+        columns = _read_columns(file, schema, encoding=encoding, header=header, skip_rows=skip_rows, dialect=dialect)
+        boundaries = _shard_boundaries(file, file.tell(), shard_size)
+    shards = (
+        _Shard(os.fspath(path), start, end, encoding, dialect, columns)
+        for start, end in zip(boundaries, boundaries[1:])
+    )
+    workers = max_workers or os.cpu_count() or 1
+    line_offset = skip_rows + header
+    with ProcessPoolExecutor(workers, initializer=_initialize_worker, initargs=(schema,)) as executor:
+        for result in _map_in_order(executor, shards, 2 * workers):
+            yield result.to_batch(line_offset)
+            line_offset += result.number_of_lines
@@ -3,10 +3,10 @@
 from __future__ import annotations
 
 import annotated_types
-from pydantic import BeforeValidator
 
-# Reason: Pylint's bug. pylint: disable=no-name-in-module
-from pydantictypes.abstract_string_to_int import IntegerMustBeFromStr
+from pydantictypes._cached_schema import CachedBeforeValidator
+from pydantictypes._canonical import canonical
+from pydantictypes._validation_utils import IntegerMustBeFromStr
 from pydantictypes.utility import Utility
 
 try:
@@ -19,6 +19,7 @@ __all__ = [
 ]
 
 
+@canonical
 # Reason: Followed Pydantic specification.
 def constringtoint(  # noqa: PLR0913  # pylint: disable=too-many-arguments
     *,
@@ -44,7 +45,7 @@ def constringtoint(  # noqa: PLR0913  # pylint: disable=too-many-arguments
     """
     return Annotated[  # type: ignore[return-value]
         int,
-        BeforeValidator(IntegerMustBeFromStr(Utility.convert_kanji_yen_string_to_int).validate),
+        CachedBeforeValidator(IntegerMustBeFromStr(Utility.convert_kanji_yen_string_to_int).validate),
         annotated_types.Interval(gt=gt, ge=ge, lt=lt, le=le),
         annotated_types.MultipleOf(multiple_of) if multiple_of is not None else None,
     ]
@@ -52,5 +53,5 @@ def constringtoint(  # noqa: PLR0913  # pylint: disable=too-many-arguments
 
 StrictKanjiYenStringToInt = Annotated[
     int,
-    BeforeValidator(IntegerMustBeFromStr(Utility.convert_kanji_yen_string_to_int).validate),
+    CachedBeforeValidator(IntegerMustBeFromStr(Utility.convert_kanji_yen_string_to_int).validate),
 ]
@@ -0,0 +1,141 @@
+"""Memoization of string to int conversion for repeated values."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import NamedTuple
+from typing import NoReturn
+
+from pydantic import BeforeValidator
+
+from pydantictypes._validation_utils import IntegerMustBeFromStr
+
+# Reason: To use raw typing imports
+try:
+    from typing import Annotated
+except ImportError:
+    from typing_extensions import Annotated
+
+if TYPE_CHECKING:
+    from typing import Callable
+
+__all__ = [
+    "CacheStatistics",
+    "MemoizedStringToInt",
+    "cache_statistics",
+    "memoize",
+]
+
+
+class CacheStatistics(NamedTuple):
+    """Statistics of the cache.
+
+    Attributes:
+        hits: The number of conversions which were skipped, including cached failures.
+        misses: The number of conversions which were executed.
+        maxsize: The maximum number of entries.
+        currsize: The current number of entries.
+    """
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class _Failure(NamedTuple):
+    """Cached failure of conversion.
+
+    Only the type and the arguments of the error are kept,
+    since the error itself would keep its traceback, and with it the frames and locals of the conversion.
+    The arguments of `PydanticCustomError` are its type, message template and context.
+    """
+
+    error_type: type[ValueError]
+    args: tuple[Any, ...]
+
+    @classmethod
+    def of(cls, error: ValueError) -> _Failure:
+        return cls(type(error), error.args)
+
+    def raise_error(self) -> NoReturn:
+        # Reason: Raising the same error each time would accumulate the traceback of every raise.
+        raise self.error_type(*self.args)
+
+
+class MemoizedStringToInt:
+    """Function to convert string to int, which memoizes results and failures by string.
+
+    The cache is `functools.lru_cache`,
+    which discards the least recently used entry when it is full and is safe under threads.
+    """
+
+    def __init__(self, string_to_int: Callable[[str], int], maxsize: int) -> None:
+        self.string_to_int = string_to_int
+        self.maxsize = maxsize
+        self.cached_convert = lru_cache(maxsize=maxsize)(self.convert)
+
+    def __call__(self, value: str) -> int:
+        result = self.cached_convert(value)
+        if isinstance(result, _Failure):
+            result.raise_error()
+        return result
+
+    def convert(self, value: str) -> int | _Failure:
+        try:
+            return self.string_to_int(value)
+        except ValueError as error:
+            return _Failure.of(error)
+
+    def statistics(self) -> CacheStatistics:
+        hits, misses, _maxsize, currsize = self.cached_convert.cache_info()
+        return CacheStatistics(hits, misses, self.maxsize, currsize)
+
+    def clear(self) -> None:
+        self.cached_convert.cache_clear()
+
+
+# Reason: The argument of pydantic type
+def _find_validator(type_: Any) -> IntegerMustBeFromStr:  # noqa: ANN401
+    for metadata in getattr(type_, "__metadata__", ()):
+        validator = getattr(getattr(metadata, "func", None), "__self__", None)
+        if isinstance(metadata, BeforeValidator) and isinstance(validator, IntegerMustBeFromStr):
+            return validator
+    msg = f"Type which converts string to int by IntegerMustBeFromStr required. Type is {type_}."
+    raise TypeError(msg)
+
+
+# Reason: The argument and the return value of pydantic type
+def memoize(type_: Any, *, maxsize: int = 4096) -> Any:  # noqa: ANN401
+    """Create the type which memoizes conversion of the type.
+
+    Repeated strings skip parsing, and repeated invalid strings raise the cached error.
+    Constraints of the type are still validated for each value.
+
+    Args:
+        type_: The type to memoize, for example, `StrictKanjiYenStringToInt`,
+            `StrictSymbolYenStringToInt`, `StrictStringWithCommaToInt` or the type created by `constringtoint()`.
+        maxsize: The maximum number of cached strings.
+
+    Returns:
+        The memoized type. Its cache is independent of other memoized types.
+    """
+    validator = _find_validator(type_)
+    memoized = IntegerMustBeFromStr(MemoizedStringToInt(validator.string_to_int, maxsize))
+    metadata = [
+        BeforeValidator(memoized.validate) if getattr(item, "func", None) == validator.validate else item
+        for item in type_.__metadata__
+    ]
+    return Annotated[(type_.__origin__, *metadata)]
+
+
+# Reason: The argument of pydantic type
+def cache_statistics(type_: Any) -> CacheStatistics:  # noqa: ANN401
+    """Return the statistics of the cache of the type created by `memoize()`."""
+    string_to_int = _find_validator(type_).string_to_int
+    if not isinstance(string_to_int, MemoizedStringToInt):
+        msg = f"Type created by memoize() required. Type is {type_}."
+        raise TypeError(msg)
+    return string_to_int.statistics()
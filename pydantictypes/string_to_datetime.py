@@ -1,12 +1,29 @@
 """Custom data type to convert string to datetime."""
 
+from __future__ import annotations
+
+import re
 from abc import abstractmethod
 from datetime import datetime
+from functools import lru_cache
+from typing import TYPE_CHECKING
 from typing import Any
+from typing import ClassVar
 
-from pydantic import GetCoreSchemaHandler
-from pydantic_core import CoreSchema
 from pydantic_core.core_schema import no_info_after_validator_function
+from pydantic_core.core_schema import str_schema
+
+from pydantictypes._accelerator import accelerated
+from pydantictypes._cached_schema import copy_schema
+from pydantictypes._lock_free_cache import LockFreeCache
+
+if TYPE_CHECKING:
+    from functools import _CacheInfo
+    from functools import _lru_cache_wrapper
+    from typing import Callable
+
+    from pydantic import GetCoreSchemaHandler
+    from pydantic_core import CoreSchema
 
 __all__ = [
     "StringSlashMonthDayOnlyToDatetime",
@@ -14,13 +31,108 @@ __all__ = [
 ]
 
 
+# Widths of directives which the fixed format parser supports.
+FIXED_WIDTH_DIRECTIVES = {"%Y": 4, "%m": 2, "%d": 2}
+ASCII_DIGITS_TO_ZERO = str.maketrans("0123456789", "0" * 10)
+
+
+class FixedFormatParser:
+    """Parser which parses date string by slicing instead of `datetime.strptime()`.
+
+    The parser accepts only string which conforms to the format exactly,
+    that is, zero-padded ASCII digits and the same separators.
+    It returns None for any other string, including invalid date,
+    so that `datetime.strptime()` parses it or raises the error as before.
+    """
+
+    def __init__(self, tokens: list[str]) -> None:
+        template = ""
+        slices = {}
+        for token in tokens:
+            piece = "0" * FIXED_WIDTH_DIRECTIVES[token] if token in FIXED_WIDTH_DIRECTIVES else token
+            slices[token] = slice(len(template), len(template) + len(piece))
+            template += piece
+        # Digits and separators are checked at once by comparing with string whose digits are all "0".
+        self.template = template
+        self.year = slices["%Y"]
+        self.month = slices["%m"]
+        self.day = slices["%d"]
+        self.parse: Callable[[str], datetime | None] = accelerated(
+            self.parse_by_slicing,
+            template,
+            *(bound for part in (self.year, self.month, self.day) for bound in (part.start, part.stop)),
+        )
+
+    def parse_by_slicing(self, value: str) -> datetime | None:
+        if value.translate(ASCII_DIGITS_TO_ZERO) != self.template:
+            return None
+        try:
+            # Reason: Time is not used in this process.
+            return datetime(int(value[self.year]), int(value[self.month]), int(value[self.day]))  # noqa: DTZ001
+        except ValueError:
+            return None
+
+
+def compile_fixed_format(format_: str) -> FixedFormatParser | None:
+    """Compile format into parser which parses string by slicing.
+
+    Args:
+        format_: The format of `datetime.strptime()`.
+
+    Returns:
+        The parser, or None if the format is not %Y, %m and %d once for each with separators other than digit.
+    """
+    tokens = re.findall(r"%.|[^%]", format_)
+    directives = sorted(token for token in tokens if token.startswith("%"))
+    if directives != sorted(FIXED_WIDTH_DIRECTIVES) or any(token.isdigit() for token in tokens):
+        return None
+    return FixedFormatParser(tokens)
+
+
+# Parsers by format, which are compiled on first use.
+FIXED_FORMAT_PARSERS: LockFreeCache[str, FixedFormatParser | None] = LockFreeCache(compile_fixed_format)
+
+
 class StringToDateTime(datetime):
     """Type that converts string to datetime."""
 
+    _cached_validate: ClassVar[_lru_cache_wrapper[datetime]]
+
     @classmethod
     # Reason: To follow Pydantic specification pylint: disable-next=line-too-long
-    def __get_pydantic_core_schema__(cls, _source_type: Any, handler: GetCoreSchemaHandler) -> CoreSchema:  # noqa: ANN401
-        return no_info_after_validator_function(cls.validate, handler.generate_schema(str))
+    def __get_pydantic_core_schema__(cls, _source_type: Any, _handler: GetCoreSchemaHandler) -> CoreSchema:  # noqa: ANN401
+        return copy_schema(_CORE_SCHEMAS[cls])
+
+    @classmethod
+    def enable_cache(cls, maxsize: int = 1024) -> None:
+        """Memoize parsed datetime by raw string for this class only.
+
+        Date columns usually have few distinct values, so repeated values are parsed once.
+        The cache is bounded and discards the least recently used entry.
+        Since datetime is immutable, the same instance is returned for the same string.
+
+        Args:
+            maxsize: The maximum number of entries.
+        """
+        cls._cached_validate = lru_cache(maxsize=maxsize)(cls.validate)
+
+    @classmethod
+    def disable_cache(cls) -> None:
+        if "_cached_validate" in cls.__dict__:
+            del cls._cached_validate
+
+    @classmethod
+    def cache_info(cls) -> _CacheInfo | None:
+        """Return hits, misses, maximum size and current size of the cache, or None if the cache is disabled."""
+        cached_validate = cls.__dict__.get("_cached_validate")
+        return None if cached_validate is None else cached_validate.cache_info()
+
+    @classmethod
+    # Reason: The argument of pydantic type
+    def validate_with_cache(cls, value: Any) -> datetime:  # noqa: ANN401
+        # Reason: Subclass doesn't share the cache of superclass.
+        cached_validate = cls.__dict__.get("_cached_validate")
+        return cls.validate(value) if cached_validate is None else cached_validate(value)
 
     @classmethod
     # Reason: The argument of pydantic type
@@ -39,8 +151,18 @@ class StringToDateTime(datetime):
     @classmethod
     # Reason: The argument of pydantic type
     def parse_date(cls, value: Any) -> datetime:  # noqa: ANN401
+        return cls.parse_date_by_format(value)
+
+    @classmethod
+    def parse_date_by_format(cls, value: str) -> datetime:
+        """Parse by slicing if value conforms to the format exactly, otherwise by `datetime.strptime()`."""
+        format_ = cls.get_format()
+        fixed_format_parser = FIXED_FORMAT_PARSERS[format_]
+        parsed = None if fixed_format_parser is None else fixed_format_parser.parse(value)
+        if parsed is not None:
+            return parsed
         # Reason: Time is not used in this process.
-        return datetime.strptime(value, cls.get_format())  # noqa: DTZ007
+        return datetime.strptime(value, format_)  # noqa: DTZ007
 
     @classmethod
     @abstractmethod
@@ -48,6 +170,12 @@ class StringToDateTime(datetime):
         raise NotImplementedError
 
 
+# Core schemas by class, which are built on first use and shared by the fields of the class.
+_CORE_SCHEMAS: LockFreeCache[type[StringToDateTime], CoreSchema] = LockFreeCache(
+    lambda cls: no_info_after_validator_function(cls.validate_with_cache, str_schema()),
+)
+
+
 class StringSlashToDateTime(StringToDateTime):
     """Type that converts string to datetime."""
 
@@ -88,8 +216,7 @@ class StringSlashMonthDayOnlyToDatetime(StringToDateTime):
         if not isinstance(value, str):
             msg = "string required"
             raise TypeError(msg)
-        # Reason: Time is not used in this process.
-        return datetime.strptime(f"1904/{value}", cls.get_format())  # noqa: DTZ007
+        return cls.parse_date_by_format(f"1904/{value}")
 
     @classmethod
     def get_format(cls) -> str:
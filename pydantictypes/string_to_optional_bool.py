@@ -7,7 +7,8 @@ from typing import Any
 from typing import ClassVar
 from typing import Optional
 
-from pydantic import BeforeValidator
+from pydantictypes._cached_schema import CachedBeforeValidator
+from pydantictypes._validation_utils import string_required_error
 
 # Reason: To use raw typing imports
 try:
@@ -62,12 +63,11 @@ class StringToOptionalBoolValidator:
             None if value is "".
 
         Raises:
-            TypeError: If value is not a string.
+            PydanticCustomError: If value is not a string.
             ValueError: If value is not "1", "0", or "".
         """
         if not isinstance(value, str):
-            msg = f"String required. Value is {value}. Type is {type(value)}."
-            raise TypeError(msg)
+            raise string_required_error(value)
 
         if value not in self._VALUE_MAP:
             msg = "Value must be '1', '0', or ''"
@@ -78,5 +78,5 @@ class StringToOptionalBoolValidator:
 
 StringToOptionalBool = Annotated[
     Optional[StringToBoolean],
-    BeforeValidator(StringToOptionalBoolValidator().validate),
+    CachedBeforeValidator(StringToOptionalBoolValidator().validate),
 ]
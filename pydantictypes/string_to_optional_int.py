@@ -4,8 +4,8 @@ from __future__ import annotations
 
 from typing import Optional
 
-from pydantic import BeforeValidator
-
+from pydantictypes._cached_schema import CachedBeforeValidator
+from pydantictypes._canonical import canonical
 from pydantictypes.abstract_string_to_optional_int import OptionalIntegerMustBeFromStr
 
 # Reason: To use raw typing imports pylint: disable=duplicate-code
@@ -20,6 +20,7 @@ __all__ = [
 ]
 
 
+@canonical
 # Reason: Constraint parameters follow Pydantic specification (gt, ge, lt, le, multiple_of)
 def constringtooptionalint(  # noqa: PLR0913 pylint: disable=too-many-arguments
     *,
@@ -56,11 +57,11 @@ def constringtooptionalint(  # noqa: PLR0913 pylint: disable=too-many-arguments
         le=le,
         multiple_of=multiple_of,
     )
-    return Annotated[Optional[int], BeforeValidator(validator.validate)]  # type: ignore[return-value]
+    return Annotated[Optional[int], CachedBeforeValidator(validator.validate)]  # type: ignore[return-value]
 
 
 # Basic type without constraints (for simple string to optional int conversion)
 ConstrainedStringToOptionalInt = Annotated[
     Optional[int],
-    BeforeValidator(OptionalIntegerMustBeFromStr(int).validate),
+    CachedBeforeValidator(OptionalIntegerMustBeFromStr(int).validate),
 ]
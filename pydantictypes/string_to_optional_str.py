@@ -3,13 +3,21 @@
 from __future__ import annotations
 
 import re
+import sys
 from typing import Any
+from typing import Callable
+from typing import NoReturn
 from typing import Optional
 from typing import Pattern
 
-from pydantic import BeforeValidator
+from pydantic_core import PydanticCustomError
 
+from pydantictypes._cached_schema import CachedBeforeValidator
+from pydantictypes._canonical import canonical
+from pydantictypes._compiled import Compiled
+from pydantictypes._validation_utils import string_required_error
 from pydantictypes._validation_utils import validate_optional_string_type
+from pydantictypes.string_with_length_constraint import _compile_length_constraints
 
 # Reason: To use raw typing imports
 try:
@@ -23,8 +31,133 @@ __all__ = [
 ]
 
 
-class StringToOptionalStrValidator:
-    """Validator for optional string with constraints."""
+def _compile_lower(*, strip_whitespace: bool, curtail_length: int | None) -> Callable[[str], str]:
+    # Negative length counts from the end, which moves when lowering changes the length of non-ASCII string.
+    curtails_early = curtail_length is not None and curtail_length >= 0
+
+    def lower(value: str) -> str:
+        if strip_whitespace:
+            value = value.strip()
+        if curtails_early and value.isascii():
+            value = value[:curtail_length]
+        # Reason: lower() returns the new string even if the string is already lowercase.
+        if not value.islower():
+            value = value.lower()
+        # Slicing by None returns the string itself.
+        return value[:curtail_length]
+
+    return lower
+
+
+def _compile_curtail(*, strip_whitespace: bool, curtail_length: int) -> Callable[[str], str]:
+    def curtail(value: str) -> str:
+        if strip_whitespace:
+            value = value.strip()
+        return value[:curtail_length]
+
+    return curtail
+
+
+def _compile_transformations(
+    *,
+    strip_whitespace: bool,
+    to_lower: bool,
+    curtail_length: int | None,
+) -> Callable[[str], str] | None:
+    """Compile transformations into function which skips the inactive transformations.
+
+    The result is the same as stripping, lowering and curtailing in this order.
+    ASCII string is curtailed by non-negative length before lowering since lowering keeps its length,
+    so that fewer characters are copied.
+    Each transformation returns the string itself instead of its copy when it doesn't change the string.
+
+    Args:
+        strip_whitespace: Whether to strip leading and trailing whitespace.
+        to_lower: Whether to convert the string to lowercase.
+        curtail_length: The maximum length to truncate the string to.
+
+    Returns:
+        The function which transforms the string, or None if there is no transformation.
+    """
+    if to_lower:
+        return _compile_lower(strip_whitespace=strip_whitespace, curtail_length=curtail_length)
+    if curtail_length is not None:
+        return _compile_curtail(strip_whitespace=strip_whitespace, curtail_length=curtail_length)
+    return str.strip if strip_whitespace else None
+
+
+def _raise_pattern_error(regex: Pattern[str]) -> NoReturn:
+    error_type = "string_pattern"
+    msg = "String does not match pattern {pattern}"
+    raise PydanticCustomError(error_type, msg, {"pattern": regex.pattern})
+
+
+def _compile_pattern_check(regex: Pattern[str]) -> Callable[[str], None]:
+    match = regex.match
+
+    def check_pattern(value: str) -> None:
+        if match(value) is None:
+            _raise_pattern_error(regex)
+
+    return check_pattern
+
+
+def _compile_length_and_pattern_check(
+    check_length: Callable[[str], None],
+    *,
+    min_length: int | None,
+    max_length: int | None,
+    regex: Pattern[str],
+) -> Callable[[str], None]:
+    lower = 0 if min_length is None else min_length
+    upper = sys.maxsize if max_length is None else max_length
+    match = regex.match
+
+    def check(value: str) -> None:
+        if not lower <= len(value) <= upper:
+            check_length(value)
+        if match(value) is None:
+            _raise_pattern_error(regex)
+
+    return check
+
+
+def _compile_checks(
+    *,
+    min_length: int | None,
+    max_length: int | None,
+    regex: Pattern[str] | None,
+) -> Callable[[str], None] | None:
+    """Compile constraints into checker which contains only the active constraints.
+
+    The checker checks the length and the pattern by one call,
+    and checks each length constraint again to decide the error only when the length violates any constraint.
+
+    Args:
+        min_length: The minimum length of the string.
+        max_length: The maximum length of the string.
+        regex: The pattern which the string must match.
+
+    Returns:
+        The checker which raises PydanticCustomError if the string does not meet the constraints,
+        or None if there is no constraint.
+    """
+    check_length = _compile_length_constraints(min_length=min_length, max_length=max_length)
+    if regex is None:
+        return check_length
+    if check_length is None:
+        return _compile_pattern_check(regex)
+    return _compile_length_and_pattern_check(check_length, min_length=min_length, max_length=max_length, regex=regex)
+
+
+class StringToOptionalStrValidator(Compiled):
+    """Validator for optional string with constraints.
+
+    Transformations and constraints are compiled when the validator is created,
+    so that each value runs only the active ones.
+    """
+
+    COMPILED = ("transform", "check")
 
     # Reason: Following Pydantic specification.
     def __init__(  # noqa: PLR0913 pylint: disable=too-many-arguments
@@ -45,58 +178,15 @@ class StringToOptionalStrValidator:
         self.max_length = max_length
         self.curtail_length = curtail_length
         self.regex = re.compile(regex) if isinstance(regex, str) else regex
+        self._compile()
 
-    def _apply_transformations(self, value: str) -> str:
-        """Apply transformations to the string.
-
-        Args:
-            value: The string to transform.
-
-        Returns:
-            The transformed string.
-        """
-        if self.strip_whitespace:
-            value = value.strip()
-
-        if self.to_lower:
-            value = value.lower()
-
-        if self.curtail_length is not None:
-            value = value[: self.curtail_length]
-
-        return value
-
-    def _validate_length(self, value: str) -> None:
-        """Validate string length constraints.
-
-        Args:
-            value: The string to validate.
-
-        Raises:
-            ValueError: If the string does not meet length constraints.
-        """
-        length = len(value)
-
-        if self.min_length is not None and length < self.min_length:
-            msg = f"String length must be at least {self.min_length}"
-            raise ValueError(msg)
-
-        if self.max_length is not None and length > self.max_length:
-            msg = f"String length must be at most {self.max_length}"
-            raise ValueError(msg)
-
-    def _validate_pattern(self, value: str) -> None:
-        """Validate string against regex pattern.
-
-        Args:
-            value: The string to validate.
-
-        Raises:
-            ValueError: If the string does not match the pattern.
-        """
-        if self.regex is not None and not self.regex.match(value):
-            msg = f"String does not match pattern {self.regex.pattern}"
-            raise ValueError(msg)
+    def _compile(self) -> None:
+        self.transform = _compile_transformations(
+            strip_whitespace=self.strip_whitespace,
+            to_lower=self.to_lower,
+            curtail_length=self.curtail_length,
+        )
+        self.check = _compile_checks(min_length=self.min_length, max_length=self.max_length, regex=self.regex)
 
     # Reason: The argument of pydantic type
     def validate(self, value: Any) -> str | None:  # noqa: ANN401
@@ -109,30 +199,31 @@ class StringToOptionalStrValidator:
             The validated and processed string or None if empty.
 
         Raises:
-            TypeError: If value is not a string.
+            PydanticCustomError: If value is not a string.
             ValueError: If value does not meet the constraints.
         """
         if value is None:
-            msg = f"String required. Value is {value}. Type is {type(value)}."
-            raise TypeError(msg)
+            raise string_required_error(value)
 
         validated = validate_optional_string_type(value)
         if validated is None:
             return None
 
-        validated = self._apply_transformations(validated)
-        self._validate_length(validated)
-        self._validate_pattern(validated)
+        if self.transform is not None:
+            validated = self.transform(validated)
+        if self.check is not None:
+            self.check(validated)
 
         return validated
 
 
 StringToOptionalStr = Annotated[
     Optional[str],
-    BeforeValidator(StringToOptionalStrValidator().validate),
+    CachedBeforeValidator(StringToOptionalStrValidator().validate),
 ]
 
 
+@canonical
 # Reason: Followed Pydantic specification.
 def constringtooptionalstr(  # noqa: PLR0913 pylint: disable=too-many-arguments
     *,
@@ -167,5 +258,5 @@ def constringtooptionalstr(  # noqa: PLR0913 pylint: disable=too-many-arguments
         curtail_length=curtail_length,
         regex=regex,
     )
-    before_validator = BeforeValidator(validator.validate)
+    before_validator = CachedBeforeValidator(validator.validate)
     return Annotated[Optional[str], before_validator]  # type: ignore[return-value]
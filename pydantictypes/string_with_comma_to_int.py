@@ -2,22 +2,47 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import ClassVar
+
 import annotated_types
-from pydantic import BeforeValidator
+from pydantic_core import CoreSchema
+from pydantic_core import core_schema
 
-from pydantictypes.abstract_string_to_int import IntegerMustBeFromStr
+from pydantictypes._cached_schema import CachedBeforeValidator
+from pydantictypes._cached_schema import copy_schema
+from pydantictypes._canonical import canonical
+from pydantictypes._validation_utils import IntegerMustBeFromStr
 from pydantictypes.utility import Utility
 
+if TYPE_CHECKING:
+    from pydantic import GetCoreSchemaHandler
+
 try:
     from typing import Annotated
 except ImportError:
     from typing_extensions import Annotated
 
 __all__ = [
+    "NativeStrictStringWithCommaToInt",
     "StrictStringWithCommaToInt",
 ]
 
 
+def union_left_to_right(choices: list[CoreSchema | tuple[CoreSchema, str]], *, custom_error_type: str) -> CoreSchema:
+    """Build union schema which tries the choices in order and returns the first success.
+
+    Older pydantic-core has no mode of union, and its union tries strict validation of each choice first.
+    That results in the same value here since every choice accepts only strings, so fall back to it.
+    """
+    try:
+        return core_schema.union_schema(choices, mode="left_to_right", custom_error_type=custom_error_type)
+    except TypeError:
+        return core_schema.union_schema(choices, custom_error_type=custom_error_type)
+
+
+@canonical
 # Reason: Followed Pydantic specification.
 def constringtoint(  # noqa: PLR0913  # pylint: disable=too-many-arguments
     *,
@@ -43,7 +68,7 @@ def constringtoint(  # noqa: PLR0913  # pylint: disable=too-many-arguments
     """
     return Annotated[  # type: ignore[return-value]
         int,
-        BeforeValidator(IntegerMustBeFromStr(Utility.convert_string_with_comma_to_int).validate),
+        CachedBeforeValidator(IntegerMustBeFromStr(Utility.convert_string_with_comma_to_int).validate),
         annotated_types.Interval(gt=gt, ge=ge, lt=lt, le=le),
         annotated_types.MultipleOf(multiple_of) if multiple_of is not None else None,
     ]
@@ -51,5 +76,41 @@ def constringtoint(  # noqa: PLR0913  # pylint: disable=too-many-arguments
 
 StrictStringWithCommaToInt = Annotated[
     int,
-    BeforeValidator(IntegerMustBeFromStr(Utility.convert_string_with_comma_to_int).validate),
+    CachedBeforeValidator(IntegerMustBeFromStr(Utility.convert_string_with_comma_to_int).validate),
 ]
+
+
+class StringWithCommaToIntSchema:
+    """Annotation to convert string with comma to int by composed pydantic-core schema.
+
+    The strings which consist of only digits are converted inside pydantic-core without any Python call. Since
+    pydantic-core has no step to remove comma, only the strings which don't match fall back to
+    `Utility.convert_string_with_comma_to_int`, so the accepted values are the same as `StrictStringWithCommaToInt`.
+    Unlike `StrictStringWithCommaToInt`, non-string value raises ValidationError of type `string_type`
+    instead of `string_required`.
+    """
+
+    SCHEMA: ClassVar[CoreSchema] = core_schema.chain_schema(
+        [
+            core_schema.str_schema(strict=True),
+            union_left_to_right(
+                [
+                    core_schema.chain_schema(
+                        [
+                            core_schema.str_schema(pattern=r"^[+-]?[0-9]+$"),
+                            core_schema.int_schema(strict=False),
+                        ],
+                    ),
+                    core_schema.no_info_plain_validator_function(Utility.convert_string_with_comma_to_int),
+                ],
+                custom_error_type="int_parsing",
+            ),
+        ],
+    )
+
+    # Reason: To follow Pydantic specification pylint: disable-next=line-too-long
+    def __get_pydantic_core_schema__(self, _source_type: Any, _handler: GetCoreSchemaHandler) -> CoreSchema:  # noqa: ANN401
+        return copy_schema(self.SCHEMA)
+
+
+NativeStrictStringWithCommaToInt = Annotated[int, StringWithCommaToIntSchema()]
@@ -4,8 +4,8 @@ from __future__ import annotations
 
 from typing import Optional
 
-from pydantic import BeforeValidator
-
+from pydantictypes._cached_schema import CachedBeforeValidator
+from pydantictypes._canonical import canonical
 from pydantictypes.abstract_string_to_optional_int import OptionalIntegerMustBeFromStr
 from pydantictypes.utility import Utility
 
@@ -21,6 +21,7 @@ __all__ = [
 ]
 
 
+@canonical
 # Reason: Constraint parameters follow Pydantic specification (gt, ge, lt, le, multiple_of)
 def constringwithcommatooptionalint(  # noqa: PLR0913 pylint: disable=too-many-arguments
     *,
@@ -58,11 +59,11 @@ def constringwithcommatooptionalint(  # noqa: PLR0913 pylint: disable=too-many-a
         le=le,
         multiple_of=multiple_of,
     )
-    return Annotated[Optional[int], BeforeValidator(validator.validate)]  # type: ignore[return-value]
+    return Annotated[Optional[int], CachedBeforeValidator(validator.validate)]  # type: ignore[return-value]
 
 
 # Basic type without constraints (for simple string with comma to optional int conversion)
 StrictStringWithCommaToOptionalInt = Annotated[
     Optional[int],
-    BeforeValidator(OptionalIntegerMustBeFromStr(Utility.convert_string_with_comma_to_int).validate),
+    CachedBeforeValidator(OptionalIntegerMustBeFromStr(Utility.convert_string_with_comma_to_int).validate),
 ]
@@ -2,14 +2,27 @@
 
 from __future__ import annotations
 
+import operator
+import sys
+from typing import TYPE_CHECKING
 from typing import Any
 from typing import Callable
 from typing import Optional
 
-from pydantic import BeforeValidator
+from pydantic_core import CoreSchema
+from pydantic_core import PydanticCustomError
+from pydantic_core import core_schema
 
+from pydantictypes._cached_schema import CachedBeforeValidator
+from pydantictypes._cached_schema import copy_schema
+from pydantictypes._canonical import canonical
+from pydantictypes._compiled import Compiled
+from pydantictypes._validation_utils import string_required_error
 from pydantictypes._validation_utils import validate_optional_string_type
 
+if TYPE_CHECKING:
+    from pydantic import GetCoreSchemaHandler
+
 # Reason: To use raw typing imports
 try:
     from typing import Annotated
@@ -21,79 +34,64 @@ __all__ = [
     "ConstrainedStringWithLength",
     "constrained_optional_string",
     "constrained_string",
+    "native_constrained_string",
 ]
 
+# Predicate of violation, type and message template of the error for each constraint in the order to report.
+# The message is formatted only when it is rendered.
+_LENGTH_ERRORS: dict[str, tuple[Callable[[int, int], bool], str, str]] = {
+    "equal_to": (operator.ne, "string_length_equal_to", "String length must be equal to {equal_to}"),
+    "min_length": (operator.lt, "string_length_too_short", "String length must be at least {min_length}"),
+    "max_length": (operator.gt, "string_length_too_long", "String length must be at most {max_length}"),
+}
 
-def _validate_length_constraint(
-    *,
-    length: int,
-    constraint_value: int | None,
-    condition: Callable[[int, int], bool],
-    error_message: str,
-) -> None:
-    """Validate a single length constraint.
-
-    Args:
-        length: The actual string length.
-        constraint_value: The constraint value to check against (None to skip validation).
-        condition: How to compare length and constraint_value.
-        error_message: The error message to raise if validation fails.
-
-    Raises:
-        ValueError: If the constraint is violated.
-    """
-    if constraint_value is None:
-        return
 
-    if condition(length, constraint_value):
-        msg = f"String length must be {error_message}"
-        raise ValueError(msg)
+def _raise_first_violation(length: int, checks: tuple[tuple[str, int], ...]) -> None:
+    for name, limit in checks:
+        violates, error_type, message_template = _LENGTH_ERRORS[name]
+        if violates(length, limit):
+            raise PydanticCustomError(error_type, message_template, {name: limit})
 
 
-def _check_string_length(
-    value: str,
+def _compile_length_constraints(
     *,
     min_length: int | None = None,
     max_length: int | None = None,
     equal_to: int | None = None,
-) -> None:
-    """Check if string meets length constraints.
+) -> Callable[[str], None] | None:
+    """Compile length constraints into checker which contains only the active constraints.
+
+    The checker compares the length with the bounds of all constraints in one expression,
+    and checks each constraint again to decide the error only when the length violates any constraint.
 
     Args:
-        value: The string to check.
         min_length: The minimum length allowed.
         max_length: The maximum length allowed.
         equal_to: The exact length required.
 
-    Raises:
-        ValueError: If string does not meet length constraints.
+    Returns:
+        The checker which raises PydanticCustomError if the string does not meet the constraints,
+        or None if there is no constraint.
     """
-    length = len(value)
+    constraints = {"equal_to": equal_to, "min_length": min_length, "max_length": max_length}
+    checks = tuple((name, limit) for name, limit in constraints.items() if limit is not None)
+    if not checks:
+        return None
+    lower = max((limit for name, limit in checks if name != "max_length"), default=0)
+    upper = min((limit for name, limit in checks if name != "min_length"), default=sys.maxsize)
 
-    _validate_length_constraint(
-        length=length,
-        constraint_value=equal_to,
-        condition=lambda a, b: a != b,
-        error_message=f"equal to {equal_to}",
-    )
+    def check_length(value: str) -> None:
+        length = len(value)
+        if not lower <= length <= upper:
+            _raise_first_violation(length, checks)
 
-    _validate_length_constraint(
-        length=length,
-        constraint_value=min_length,
-        condition=lambda a, b: a < b,
-        error_message=f"at least {min_length}",
-    )
+    return check_length
 
-    _validate_length_constraint(
-        length=length,
-        constraint_value=max_length,
-        condition=lambda a, b: a > b,
-        error_message=f"at most {max_length}",
-    )
 
+class _LengthConstraints(Compiled):
+    """Length constraints which are compiled into checker when the validator is created."""
 
-class StringLengthValidator:
-    """Validator for string length constraints."""
+    COMPILED = ("check_length",)
 
     def __init__(
         self,
@@ -105,38 +103,34 @@ class StringLengthValidator:
         self.min_length = min_length
         self.max_length = max_length
         self.equal_to = equal_to
+        self._compile()
+
+    def _compile(self) -> None:
+        self.check_length = _compile_length_constraints(
+            min_length=self.min_length,
+            max_length=self.max_length,
+            equal_to=self.equal_to,
+        )
+
+
+class StringLengthValidator(_LengthConstraints):
+    """Validator for string length constraints."""
 
     # Reason: The argument of pydantic type
     def validate(self, value: Any) -> str:  # noqa: ANN401
         """Validate string length."""
         if not isinstance(value, str):
-            msg = f"String required. Value is {value}. Type is {type(value)}."
-            raise TypeError(msg)
+            raise string_required_error(value)
 
-        _check_string_length(
-            value,
-            min_length=self.min_length,
-            max_length=self.max_length,
-            equal_to=self.equal_to,
-        )
+        if self.check_length is not None:
+            self.check_length(value)
 
         return value
 
 
-class OptionalStringLengthValidator:
+class OptionalStringLengthValidator(_LengthConstraints):
     """Validator for optional string length constraints."""
 
-    def __init__(
-        self,
-        *,
-        min_length: int | None = None,
-        max_length: int | None = None,
-        equal_to: int | None = None,
-    ) -> None:
-        self.min_length = min_length
-        self.max_length = max_length
-        self.equal_to = equal_to
-
     # Reason: The argument of pydantic type
     def validate(self, value: Any) -> str | None:  # noqa: ANN401
         """Validate optional string length."""
@@ -144,29 +138,95 @@ class OptionalStringLengthValidator:
         if validated is None:
             return None
 
-        _check_string_length(
-            validated,
-            min_length=self.min_length,
-            max_length=self.max_length,
-            equal_to=self.equal_to,
-        )
+        if self.check_length is not None:
+            self.check_length(validated)
 
         return validated
 
 
+# Reason: Constraint parameters follow Pydantic specification.
+def _exact_str_schema(
+    *,
+    strict: bool | None = None,
+    min_length: int = 0,
+    max_length: int = sys.maxsize,
+) -> CoreSchema:
+    """Create `str_schema` which ignores string settings of the model config, such as `str_max_length`."""
+    return core_schema.str_schema(
+        strict=strict,
+        min_length=min_length,
+        max_length=max_length,
+        strip_whitespace=False,
+        to_lower=False,
+        to_upper=False,
+    )
+
+
+def _length_step(name: str, limit: int) -> CoreSchema:
+    """Create the step which checks the constraint and reports the same error as `StringLengthValidator`."""
+    _violates, error_type, message_template = _LENGTH_ERRORS[name]
+    return core_schema.custom_error_schema(
+        _exact_str_schema(
+            min_length=0 if name == "max_length" else limit,
+            max_length=sys.maxsize if name == "min_length" else limit,
+        ),
+        error_type,
+        custom_error_message=message_template,
+        custom_error_context={name: limit},
+    )
+
+
+class StringLengthSchema:
+    """Annotation to check string length by composed pydantic-core schema.
+
+    Each constraint is a step of `chain_schema` which checks the length by `str_schema` inside pydantic-core,
+    and whose error is replaced with the same type, message and context as `StringLengthValidator`,
+    so that valid strings are validated without any Python call.
+    String settings of the model config are applied after the constraints as same as `constrained_string()`.
+    Unlike `constrained_string()`, the message of the error of non-string value doesn't include the value
+    and the type, which are in the input of the error.
+    """
+
+    def __init__(
+        self,
+        *,
+        min_length: int | None = None,
+        max_length: int | None = None,
+        equal_to: int | None = None,
+    ) -> None:
+        constraints = {"equal_to": equal_to, "min_length": min_length, "max_length": max_length}
+        string_required = core_schema.custom_error_schema(
+            _exact_str_schema(strict=True),
+            "string_required",
+            custom_error_message="String required",
+        )
+        self.schema = core_schema.chain_schema(
+            [
+                string_required,
+                *(_length_step(name, limit) for name, limit in constraints.items() if limit is not None),
+                core_schema.str_schema(),
+            ],
+        )
+
+    # Reason: To follow Pydantic specification pylint: disable-next=line-too-long
+    def __get_pydantic_core_schema__(self, _source_type: Any, _handler: GetCoreSchemaHandler) -> CoreSchema:  # noqa: ANN401
+        return copy_schema(self.schema)
+
+
 # Basic constrained type without parameters
 ConstrainedStringWithLength = Annotated[
     str,
-    BeforeValidator(StringLengthValidator().validate),
+    CachedBeforeValidator(StringLengthValidator().validate),
 ]
 
 # Optional variant
 ConstrainedOptionalStringWithLength = Annotated[
     Optional[str],
-    BeforeValidator(OptionalStringLengthValidator().validate),
+    CachedBeforeValidator(OptionalStringLengthValidator().validate),
 ]
 
 
+@canonical
 # Reason: Followed Pydantic specification.
 def constrained_string(
     *,
@@ -185,10 +245,11 @@ def constrained_string(
         The wrapped string type.
     """
     validator = StringLengthValidator(min_length=min_length, max_length=max_length, equal_to=equal_to)
-    before_validator = BeforeValidator(validator.validate)
+    before_validator = CachedBeforeValidator(validator.validate)
     return Annotated[str, before_validator]  # type: ignore[return-value]
 
 
+@canonical
 # Reason: Followed Pydantic specification.
 def constrained_optional_string(
     *,
@@ -207,5 +268,30 @@ def constrained_optional_string(
         The wrapped optional string type.
     """
     validator = OptionalStringLengthValidator(min_length=min_length, max_length=max_length, equal_to=equal_to)
-    before_validator = BeforeValidator(validator.validate)
+    before_validator = CachedBeforeValidator(validator.validate)
     return Annotated[Optional[str], before_validator]  # type: ignore[return-value]
+
+
+@canonical
+# Reason: Followed Pydantic specification.
+def native_constrained_string(
+    *,
+    min_length: int | None = None,
+    max_length: int | None = None,
+    equal_to: int | None = None,
+) -> type[str]:
+    """Create an annotated `str` type with length constraints which are checked inside pydantic-core.
+
+    Valid strings are accepted and invalid lengths are reported as same as `constrained_string()`
+    without any Python call. See `StringLengthSchema` for the difference about non-string values.
+
+    Args:
+        min_length: The minimum length of the string.
+        max_length: The maximum length of the string.
+        equal_to: The exact length the string must be.
+
+    Returns:
+        The wrapped string type.
+    """
+    annotation = StringLengthSchema(min_length=min_length, max_length=max_length, equal_to=equal_to)
+    return Annotated[str, annotation]  # type: ignore[return-value]
@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 import annotated_types
-from pydantic import BeforeValidator
+
+from pydantictypes._cached_schema import CachedBeforeValidator
+from pydantictypes._canonical import canonical
+from pydantictypes._validation_utils import IntegerMustBeFromStr
 
 # Reason: Pylint's bug. pylint: disable=no-name-in-module
 from pydantictypes.abstract_string_to_int import ConstrainedStringToInt
-from pydantictypes.abstract_string_to_int import IntegerMustBeFromStr
 from pydantictypes.utility import Utility
 
 try:
@@ -28,6 +30,7 @@ class SymbolYenStringToInt(ConstrainedStringToInt):
         return Utility.convert_symbol_yen_string_to_int(value)
 
 
+@canonical
 # Reason: Followed Pydantic specification.
 def constringtoint(  # noqa: PLR0913  # pylint: disable=too-many-arguments
     *,
@@ -53,7 +56,7 @@ def constringtoint(  # noqa: PLR0913  # pylint: disable=too-many-arguments
     """
     return Annotated[  # type: ignore[return-value]
         int,
-        BeforeValidator(IntegerMustBeFromStr(Utility.convert_symbol_yen_string_to_int).validate),
+        CachedBeforeValidator(IntegerMustBeFromStr(Utility.convert_symbol_yen_string_to_int).validate),
         annotated_types.Interval(gt=gt, ge=ge, lt=lt, le=le),
         annotated_types.MultipleOf(multiple_of) if multiple_of is not None else None,
     ]
@@ -61,5 +64,5 @@ def constringtoint(  # noqa: PLR0913  # pylint: disable=too-many-arguments
 
 StrictSymbolYenStringToInt = Annotated[
     int,
-    BeforeValidator(IntegerMustBeFromStr(Utility.convert_symbol_yen_string_to_int).validate),
+    CachedBeforeValidator(IntegerMustBeFromStr(Utility.convert_symbol_yen_string_to_int).validate),
 ]
@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
-import re
+from pydantictypes._accelerator import accelerated
+from pydantictypes._yen_parser import KANJI_YEN_PARSER
+from pydantictypes._yen_parser import SYMBOL_YEN_PARSER
 
 
 class Utility:
     """This class implements utility."""
 
     @staticmethod
+    @accelerated
     def convert_string_to_int_or_none(string: str) -> int | None:
         """Convert string to int or None."""
         if not string:
@@ -16,29 +19,18 @@ class Utility:
         return int(string.replace(",", ""))
 
     @staticmethod
+    @accelerated
     def convert_kanji_yen_string_to_int(yen_string: str) -> int:
         """Convert YEN string to int."""
-        if "." in yen_string:
-            msg = f"Decimal is unsupported. Yen string = {yen_string}"
-            raise ValueError(msg)
-        matches = re.search(r"([\d,]+)\s*円", yen_string)
-        if matches is None:
-            msg = f"Invalid yen string. Yen string = {yen_string}"
-            raise ValueError(msg)
-        return int(matches.group(1).replace(",", ""))
+        return KANJI_YEN_PARSER.parse(yen_string)
 
     @staticmethod
+    @accelerated
     def convert_symbol_yen_string_to_int(yen_string: str) -> int:
         """Convert YEN string to int."""
-        if "." in yen_string:
-            msg = f"Decimal is unsupported. Yen string = {yen_string}"
-            raise ValueError(msg)
-        matches = re.search(r"\\([\d,]+)", yen_string)
-        if matches is None:
-            msg = f"Invalid yen string. Yen string = {yen_string}"
-            raise ValueError(msg)
-        return int(matches.group(1).replace(",", ""))
+        return SYMBOL_YEN_PARSER.parse(yen_string)
 
     @staticmethod
+    @accelerated
     def convert_string_with_comma_to_int(string_with_comma: str) -> int:
         return int(string_with_comma.replace(",", ""))
@@ -0,0 +1,326 @@
+"""Vectorized conversions for NumPy arrays.
+
+This module requires NumPy: pip install pydantictypes[numpy]
+"""
+
+from __future__ import annotations
+
+import unicodedata
+from itertools import repeat
+from operator import is_
+from typing import Any
+from typing import NamedTuple
+
+import numpy as np
+
+from pydantictypes._east_asian_width import MAX_BMP
+from pydantictypes._east_asian_width import NOT_HALF_WIDTH
+from pydantictypes._lock_free_cache import LockFreeCache
+from pydantictypes.utility import Utility
+
+__all__ = [
+    "HalfWidthMask",
+    "Int64Array",
+    "check_half_width",
+    "check_optional_half_width",
+    "convert_string_with_comma_to_int64",
+    "convert_string_with_comma_to_optional_int64",
+]
+
+# Any integer of 18 digits fits into int64.
+MAX_DIGITS_FOR_INT64 = 18
+CODE_POINT_SIZE = 4
+ORD_ZERO = ord("0")
+ORD_PLUS = ord("+")
+ORD_MINUS = ord("-")
+ORD_COMMA = ord(",")
+INT64_MIN = int(np.iinfo(np.int64).min)
+INT64_MAX = int(np.iinfo(np.int64).max)
+
+
+class Int64Array(NamedTuple):
+    """Result of vectorized conversion.
+
+    Attributes:
+        values: The converted values. The value is 0 where it is not valid or null.
+        valid: True where the element was converted into int.
+        null: True where the element was None or empty string and the type is optional.
+    """
+
+    values: np.ndarray[Any, np.dtype[np.int64]]
+    valid: np.ndarray[Any, np.dtype[np.bool_]]
+    null: np.ndarray[Any, np.dtype[np.bool_]]
+
+    @property
+    def invalid(self) -> np.ndarray[Any, np.dtype[np.bool_]]:
+        """True where the element was rejected."""
+        return ~(self.valid | self.null)
+
+
+class _Strings(NamedTuple):
+    """Unicode array and masks of elements by type.
+
+    Attributes:
+        strings: The unicode array whose non-string elements are replaced by empty string.
+        is_str: True where the element is string.
+        is_none: True where the element is None.
+        elements: The elements as they are, since unicode array drops trailing NUL of strings.
+    """
+
+    strings: np.ndarray[Any, Any]
+    is_str: np.ndarray[Any, np.dtype[np.bool_]]
+    is_none: np.ndarray[Any, np.dtype[np.bool_]]
+    elements: np.ndarray[Any, Any]
+
+    @property
+    def is_truncated(self) -> np.ndarray[Any, np.dtype[np.bool_]]:
+        """True where the string ends with NUL, which unicode array drops."""
+        if self.elements.dtype.kind == "U":
+            return np.zeros(self.strings.shape, dtype=np.bool_)
+        objects = np.where(self.is_str, self.elements, "")
+        lengths = np.fromiter(map(len, objects), dtype=np.int64, count=len(objects))
+        return np.not_equal(np.char.str_len(self.strings), lengths)
+
+    @property
+    def is_empty(self) -> np.ndarray[Any, np.dtype[np.bool_]]:
+        """True where the element is empty string."""
+        is_empty = self.is_str & np.equal(np.char.str_len(self.strings), 0)
+        # Only strings which look empty may be NULs which unicode array drops.
+        candidates = np.flatnonzero(is_empty)
+        is_empty[candidates] = self.elements[candidates] == ""
+        return is_empty
+
+
+# Reason: The argument of NumPy array
+def _split_strings(array: Any) -> _Strings:  # noqa: ANN401
+    """Return unicode array of strings and masks of elements by type.
+
+    Args:
+        array: The one-dimensional array or sequence to convert.
+    """
+    # Sequence is not inferred as unicode array, which drops trailing NUL of strings.
+    array = array if isinstance(array, np.ndarray) else np.array(array, dtype=object)
+    if array.dtype.kind == "U":
+        return _Strings(array, np.ones(array.shape, dtype=np.bool_), np.zeros(array.shape, dtype=np.bool_), array)
+    array = array.astype(object)
+    is_str = np.fromiter(map(isinstance, array, repeat(str)), dtype=np.bool_, count=len(array))
+    is_none = np.fromiter(map(is_, array, repeat(None)), dtype=np.bool_, count=len(array))
+    return _Strings(np.where(is_str, array, "").astype(str), is_str, is_none, array)
+
+
+def _parse_ascii_digits_with_comma(
+    strings: np.ndarray[Any, Any],
+) -> tuple[np.ndarray[Any, np.dtype[np.int64]], np.ndarray[Any, np.dtype[np.bool_]]]:
+    """Parse strings of optional sign, ASCII digits and commas in bulk by Horner's method over code points.
+
+    Returns:
+        The parsed values and the mask of strings which were parsed.
+        The other strings, for example which include whitespace or more than 18 digits, are not parsed.
+    """
+    size = len(strings)
+    code_points = (
+        np.ascontiguousarray(strings).view(np.uint32).reshape(size, strings.dtype.itemsize // CODE_POINT_SIZE)
+    )
+    first = code_points[:, 0]
+    is_negative = first == ORD_MINUS
+    is_sign = is_negative | (first == ORD_PLUS)
+    values = np.zeros(size, dtype=np.int64)
+    count_digits = np.zeros(size, dtype=np.int32)
+    rejected = np.zeros(size, dtype=np.bool_)
+    ended = np.zeros(size, dtype=np.bool_)
+    for column in range(code_points.shape[1]):
+        code_point = code_points[:, column]
+        # Code points less than "0" wrap around to large numbers.
+        digit = code_point - np.uint32(ORD_ZERO)
+        is_digit = digit < 10  # noqa: PLR2004
+        values = np.where(is_digit, values * 10 + digit, values)
+        count_digits += is_digit
+        is_padding = code_point == 0
+        is_other = ~(is_digit | is_padding | (code_point == ORD_COMMA))
+        if column == 0:
+            is_other &= ~is_sign
+        # NumPy pads string by NUL, so NUL followed by any character is a part of string.
+        rejected |= is_other | (ended & ~is_padding)
+        ended |= is_padding
+    values[is_negative] *= -1
+    return values, ~rejected & (count_digits > 0) & (count_digits <= MAX_DIGITS_FOR_INT64)
+
+
+def _convert_string_with_comma(
+    strings: _Strings,
+    targets: np.ndarray[Any, np.dtype[np.bool_]],
+) -> tuple[np.ndarray[Any, np.dtype[np.int64]], np.ndarray[Any, np.dtype[np.bool_]]]:
+    """Convert strings with comma into int64 as same as `Utility.convert_string_with_comma_to_int`.
+
+    Strings of optional sign, ASCII digits and commas are converted in bulk,
+    and only the other strings are converted one by one to follow the rules of `int()` exactly.
+
+    Args:
+        strings: The strings to convert.
+        targets: True where the element is converted. The others are invalid.
+    """
+    if not strings.strings.size:
+        return np.zeros(strings.strings.shape, dtype=np.int64), np.zeros(strings.strings.shape, dtype=np.bool_)
+    values, valid = _parse_ascii_digits_with_comma(strings.strings)
+    valid &= targets & ~strings.is_truncated
+    for index in np.flatnonzero(targets & ~valid):
+        try:
+            value = Utility.convert_string_with_comma_to_int(str(strings.elements[index]))
+        except ValueError:
+            continue
+        if INT64_MIN <= value <= INT64_MAX:
+            values[index] = value
+            valid[index] = True
+    values[~valid] = 0
+    return values, valid
+
+
+# Reason: The argument of NumPy array
+def convert_string_with_comma_to_int64(array: Any) -> Int64Array:  # noqa: ANN401
+    """Convert array of strings with comma into int64 array with the rules of `StrictStringWithCommaToInt`.
+
+    Args:
+        array: The one-dimensional NumPy string or object array, or sequence.
+
+    Returns:
+        The converted values and the mask of valid elements. Values which don't fit into int64 are invalid.
+    """
+    strings = _split_strings(array)
+    values, valid = _convert_string_with_comma(strings, strings.is_str)
+    return Int64Array(values, valid, np.zeros(values.shape, dtype=np.bool_))
+
+
+# Reason: The argument of NumPy array
+def convert_string_with_comma_to_optional_int64(array: Any) -> Int64Array:  # noqa: ANN401
+    """Convert array of strings with comma into int64 array with the rules of `StrictStringWithCommaToOptionalInt`.
+
+    Args:
+        array: The one-dimensional NumPy string or object array, or sequence.
+
+    Returns:
+        The converted values, the mask of valid elements and the mask of None or empty string.
+    """
+    strings = _split_strings(array)
+    null = strings.is_none | strings.is_empty
+    values, valid = _convert_string_with_comma(strings, strings.is_str & ~null)
+    return Int64Array(values, valid, null)
+
+
+class HalfWidthMask(NamedTuple):
+    """Result of vectorized half-width check.
+
+    Attributes:
+        valid: True where the element is string which contains only half-width characters.
+        null: True where the element was None or empty string and the type is optional.
+        first_not_half_width: The index of the first character which is not half-width,
+            which is the same as the index in the context of error.
+            The index is -1 where there is no such character or the element is not string.
+    """
+
+    valid: np.ndarray[Any, np.dtype[np.bool_]]
+    null: np.ndarray[Any, np.dtype[np.bool_]]
+    first_not_half_width: np.ndarray[Any, np.dtype[np.int64]]
+
+    @property
+    def invalid(self) -> np.ndarray[Any, np.dtype[np.bool_]]:
+        """True where the element was rejected."""
+        return ~(self.valid | self.null)
+
+
+def build_not_half_width_table(_unidata_version: str) -> np.ndarray[Any, np.dtype[np.bool_]]:
+    """Return the table which is True at code point which may not be half-width.
+
+    The table has the exact widths in the Basic Multilingual Plane from the Unicode database of running Python,
+    and its last entry stands for every code point out of it, which is checked again by the Unicode database.
+    """
+    table = np.ones(MAX_BMP + 2, dtype=np.bool_)
+    table[: MAX_BMP + 1] = np.fromiter(
+        (unicodedata.east_asian_width(chr(code_point)) in NOT_HALF_WIDTH for code_point in range(MAX_BMP + 1)),
+        dtype=np.bool_,
+        count=MAX_BMP + 1,
+    )
+    return table
+
+
+# Tables by version of the Unicode database, which are built on first use.
+NOT_HALF_WIDTH_TABLES: LockFreeCache[str, np.ndarray[Any, np.dtype[np.bool_]]] = LockFreeCache(
+    build_not_half_width_table,
+)
+
+
+def _find_not_half_width(strings: np.ndarray[Any, Any]) -> np.ndarray[Any, np.dtype[np.int64]]:
+    """Find the first character which is not half-width in each string as same as `find_not_half_width()`.
+
+    Every code point of strings which may include such character is looked up in the table at once,
+    and only distinct code points out of the Basic Multilingual Plane are looked up in the Unicode database.
+
+    Returns:
+        The index of the first character which is not half-width, or -1 if there is no such character.
+    """
+    size = len(strings)
+    if not size:
+        return np.zeros(strings.shape, dtype=np.int64)
+    code_points = (
+        np.ascontiguousarray(strings).view(np.uint32).reshape(size, strings.dtype.itemsize // CODE_POINT_SIZE)
+    )
+    first_not_half_width = np.full(size, -1, dtype=np.int64)
+    table = NOT_HALF_WIDTH_TABLES[unicodedata.unidata_version]
+    # Strings whose characters are all less than the first one which is not half-width,
+    # for example, ASCII codes and names, are skipped in a cheap pass.
+    # NUL which NumPy pads string with is half-width.
+    candidates = np.flatnonzero(code_points.max(axis=1) >= table.argmax())
+    if not candidates.size:
+        return first_not_half_width
+    code_points = code_points[candidates]
+    # Code points out of the Basic Multilingual Plane are clipped to the last entry of table.
+    not_half_width = table.take(code_points, mode="clip")
+    is_out_of_bmp = code_points > MAX_BMP
+    if is_out_of_bmp.any():
+        out_of_bmp = code_points[is_out_of_bmp]
+        wide = [
+            code_point
+            for code_point in np.unique(out_of_bmp).tolist()
+            if unicodedata.east_asian_width(chr(code_point)) in NOT_HALF_WIDTH
+        ]
+        not_half_width[is_out_of_bmp] = np.isin(out_of_bmp, wide)
+    first = not_half_width.argmax(axis=1)
+    found = not_half_width[np.arange(len(candidates)), first]
+    first_not_half_width[candidates[found]] = first[found]
+    return first_not_half_width
+
+
+# Reason: The argument of NumPy array
+def check_half_width(array: Any) -> HalfWidthMask:  # noqa: ANN401
+    """Check array of strings in bulk with the rules of `HalfWidthString`.
+
+    Args:
+        array: The one-dimensional NumPy string or object array, or sequence.
+
+    Returns:
+        The mask of valid elements and the index of the first character which is not half-width in each element.
+    """
+    # Trailing NUL which unicode array drops is half-width and doesn't move the index of other characters.
+    strings, is_str, _, _ = _split_strings(array)
+    first_not_half_width = _find_not_half_width(strings)
+    first_not_half_width[~is_str] = -1
+    valid = is_str & (first_not_half_width == -1)
+    return HalfWidthMask(valid, np.zeros(valid.shape, dtype=np.bool_), first_not_half_width)
+
+
+# Reason: The argument of NumPy array
+def check_optional_half_width(array: Any) -> HalfWidthMask:  # noqa: ANN401
+    """Check array of strings in bulk with the rules of `OptionalHalfWidthString`.
+
+    Args:
+        array: The one-dimensional NumPy string or object array, or sequence.
+
+    Returns:
+        The mask of valid elements, the mask of None or empty string
+        and the index of the first character which is not half-width in each element.
+    """
+    strings = _split_strings(array)
+    null = strings.is_none | strings.is_empty
+    first_not_half_width = _find_not_half_width(strings.strings)
+    first_not_half_width[~strings.is_str] = -1
+    valid = strings.is_str & ~null & (first_not_half_width == -1)
+    return HalfWidthMask(valid, null, first_not_half_width)
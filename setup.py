@@ -0,0 +1,18 @@
+"""Build the optional extension which accelerates hot functions.
+
+Metadata is in pyproject.toml.
+The extension is built only when environment variable PYDANTICTYPES_BUILD_EXTENSION=1 is set,
+since the wheel which includes it is tagged by the platform of the build machine, which PyPI rejects for Linux.
+Releases publish the source distribution and the pure Python wheel until wheels are built for each platform.
+The extension is optional, so that the package is installed with pure Python implementations
+when the extension can't be built, for example, without C compiler.
+"""
+
+import os
+
+from setuptools import Extension
+from setuptools import setup
+
+EXTENSIONS = [Extension("pydantictypes._speedups", ["pydantictypes/_speedups.c"], optional=True)]
+
+setup(ext_modules=EXTENSIONS if os.environ.get("PYDANTICTYPES_BUILD_EXTENSION") == "1" else [])
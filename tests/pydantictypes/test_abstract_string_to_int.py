@@ -10,11 +10,9 @@ from typing import cast
 from unittest.mock import Mock
 
 import pytest
-from pydantic.v1.errors import NumberNotGeError
-from pydantic.v1.errors import NumberNotGtError
-from pydantic.v1.errors import NumberNotLeError
-from pydantic.v1.errors import NumberNotLtError
-from pydantic.v1.errors import NumberNotMultipleError
+from pydantic import TypeAdapter
+from pydantic import ValidationError
+from pydantic_core import PydanticCustomError
 
 from pydantictypes.abstract_string_to_int import ConstrainedInt
 from pydantictypes.abstract_string_to_int import ConstrainedStringToInt
@@ -68,12 +66,12 @@ class TestIntegerMustBeFromStr:
         ],
     )
     # Reason: Need Any to test various non-string types pylint: disable-next=line-too-long
-    def test_validate_with_non_string_raises_type_error(self, non_string_value: Any, expected_type_name: str) -> None:  # noqa: ANN401
-        """Test that validate raises TypeError for non-string input."""
+    def test_validate_with_non_string_raises_error(self, non_string_value: Any, expected_type_name: str) -> None:  # noqa: ANN401
+        """Test that validate raises PydanticCustomError for non-string input."""
         mock_converter = Mock()
         validator = IntegerMustBeFromStr(mock_converter)
 
-        with pytest.raises(TypeError) as exc_info:
+        with pytest.raises(PydanticCustomError) as exc_info:
             validator.validate(non_string_value)
 
         error_message = str(exc_info.value)
@@ -98,7 +96,7 @@ class TestIntegerMustBeFromStr:
         mock_converter = Mock()
         validator = IntegerMustBeFromStr(mock_converter)
 
-        with pytest.raises(TypeError) as exc_info:
+        with pytest.raises(PydanticCustomError) as exc_info:
             validator.raise_if_not_str(non_string_value)
 
         error_message = str(exc_info.value)
@@ -142,7 +140,7 @@ class TestConstrainedInt:
         [
             (5, 5),
             ("10", 10),
-            (5.7, 5),
+            (5.0, 5),
             (True, 1),
             (False, 0),
         ],
@@ -159,6 +157,17 @@ class TestConstrainedInt:
         result = test_constrained_int.validate(value)
         assert result == expected
 
+    def test_validate_with_non_strict_mode_rejects_fraction(self) -> None:
+        """Test validate method in non-strict mode doesn't truncate fraction."""
+        test_constrained_int = cast(
+            "Type[ConstrainedInt]",
+            type("TestConstrainedInt", (ConstrainedInt,), {"strict": False}),
+        )
+
+        with pytest.raises(ValidationError) as exc_info:
+            test_constrained_int.validate(5.7)
+        assert exc_info.value.errors()[0]["type"] == "int_from_float"
+
     @pytest.mark.parametrize(
         "value",
         [
@@ -196,157 +205,102 @@ class TestConstrainedInt:
             type("StrictConstrainedInt", (ConstrainedInt,), {"strict": True}),
         )
 
-        # Should raise some validation error from pydantic v1
-        with pytest.raises((ValueError, TypeError)):  # Could be various pydantic v1 errors
+        with pytest.raises(ValidationError) as exc_info:
             strict_constrained_int.validate(invalid_value)
+        assert exc_info.value.errors()[0]["type"] == "int_type"
 
-    def test_number_size_validator_no_constraints(self) -> None:
-        """Test number_size_validator with no constraints returns value unchanged."""
+    def test_validate_no_constraints(self) -> None:
+        """Test validate with no constraints returns value unchanged."""
         # Create a class with no size constraints
         expected_value = 42
         no_constraints_int = cast("Type[ConstrainedInt]", type("NoConstraintsInt", (ConstrainedInt,), {}))
 
-        result = no_constraints_int.number_size_validator(expected_value)
+        result = no_constraints_int.validate(expected_value)
         assert result == expected_value
 
     @pytest.mark.parametrize(
-        ("gt_value", "test_value", "should_pass"),
+        ("constraint", "limit", "test_value", "error_type"),
         [
-            (5, 6, True),
-            (5, 10, True),
-            (5, 5, False),
-            (5, 4, False),
+            ("gt", 5, 6, None),
+            ("gt", 5, 10, None),
+            ("gt", 5, 5, "greater_than"),
+            ("gt", 5, 4, "greater_than"),
+            ("ge", 5, 6, None),
+            ("ge", 5, 5, None),
+            ("ge", 5, 4, "greater_than_equal"),
+            ("lt", 5, 4, None),
+            ("lt", 5, 1, None),
+            ("lt", 5, 5, "less_than"),
+            ("lt", 5, 6, "less_than"),
+            ("le", 5, 4, None),
+            ("le", 5, 5, None),
+            ("le", 5, 6, "less_than_equal"),
+            ("multiple_of", 5, 10, None),
+            ("multiple_of", 5, 15, None),
+            ("multiple_of", 5, 0, None),
+            ("multiple_of", 3, 9, None),
+            ("multiple_of", 5, 7, "multiple_of"),
+            ("multiple_of", 3, 8, "multiple_of"),
         ],
     )
-    # pylint: disable-next=line-too-long
-    def test_number_size_validator_greater_gt(self, gt_value: int, test_value: int, should_pass: bool) -> None:  # noqa: FBT001
-        """Test number_size_validator with gt constraint."""
-        gt_constrained_int = cast(
-            "Type[ConstrainedInt]",
-            type("GtConstrainedInt", (ConstrainedInt,), {"gt": gt_value}),
-        )
-
-        if should_pass:
-            result = gt_constrained_int.number_size_validator(test_value)
-            assert result == test_value
-        else:
-            with pytest.raises(NumberNotGtError):
-                gt_constrained_int.number_size_validator(test_value)
-
-    @pytest.mark.parametrize(
-        ("ge_value", "test_value", "should_pass"),
-        [
-            (5, 6, True),
-            (5, 5, True),
-            (5, 4, False),
-        ],
-    )
-    # pylint: disable-next=line-too-long
-    def test_number_size_validator_greater_ge(self, ge_value: int, test_value: int, should_pass: bool) -> None:  # noqa: FBT001
-        """Test number_size_validator with ge constraint."""
-        ge_constrained_int = cast(
-            "Type[ConstrainedInt]",
-            type("GeConstrainedInt", (ConstrainedInt,), {"ge": ge_value}),
-        )
-
-        if should_pass:
-            result = ge_constrained_int.number_size_validator(test_value)
-            assert result == test_value
-        else:
-            with pytest.raises(NumberNotGeError):
-                ge_constrained_int.number_size_validator(test_value)
-
-    @pytest.mark.parametrize(
-        ("lt_value", "test_value", "should_pass"),
-        [
-            (5, 4, True),
-            (5, 1, True),
-            (5, 5, False),
-            (5, 6, False),
-        ],
-    )
-    # pylint: disable-next=line-too-long
-    def test_number_size_validator_less_lt(self, lt_value: int, test_value: int, should_pass: bool) -> None:  # noqa: FBT001
-        """Test number_size_validator with lt constraint."""
-        lt_constrained_int = cast(
-            "Type[ConstrainedInt]",
-            type("LtConstrainedInt", (ConstrainedInt,), {"lt": lt_value}),
-        )
-
-        if should_pass:
-            result = lt_constrained_int.number_size_validator(test_value)
-            assert result == test_value
-        else:
-            with pytest.raises(NumberNotLtError):
-                lt_constrained_int.number_size_validator(test_value)
-
-    @pytest.mark.parametrize(
-        ("le_value", "test_value", "should_pass"),
-        [
-            (5, 4, True),
-            (5, 5, True),
-            (5, 6, False),
-        ],
-    )
-    # pylint: disable-next=line-too-long
-    def test_number_size_validator_less_le(self, le_value: int, test_value: int, should_pass: bool) -> None:  # noqa: FBT001
-        """Test number_size_validator with le constraint."""
-        le_constrained_int = cast(
+    def test_validate_with_constraint(
+        self,
+        constraint: str,
+        limit: int,
+        test_value: int,
+        error_type: str | None,
+    ) -> None:
+        """Test validate with each constraint."""
+        constrained_int = cast(
             "Type[ConstrainedInt]",
-            type("LeConstrainedInt", (ConstrainedInt,), {"le": le_value}),
+            type("SingleConstrainedInt", (ConstrainedInt,), {constraint: limit}),
         )
 
-        if should_pass:
-            result = le_constrained_int.number_size_validator(test_value)
-            assert result == test_value
+        if error_type is None:
+            assert constrained_int.validate(test_value) == test_value
         else:
-            with pytest.raises(NumberNotLeError):
-                le_constrained_int.number_size_validator(test_value)
-
-    def test_number_multiple_validator_no_constraint(self) -> None:
-        """Test number_multiple_validator with no multiple_of constraint."""
-        expected_value = 42
-        no_multiple_int = cast("Type[ConstrainedInt]", type("NoMultipleInt", (ConstrainedInt,), {"multiple_of": None}))
-
-        result = no_multiple_int.number_multiple_validator(expected_value)
-        assert result == expected_value
+            with pytest.raises(ValidationError) as exc_info:
+                constrained_int.validate(test_value)
+            assert exc_info.value.errors()[0]["type"] == error_type
 
     @pytest.mark.parametrize(
         ("multiple_of_value", "test_value", "should_pass"),
         [
-            (5, 10, True),
-            (5, 15, True),
-            (5, 0, True),
-            (3, 9, True),
-            (5, 7, False),
-            (3, 8, False),
+            # Float division judges 2 ** 60 + 1 as multiple of 2.
+            (2, 2**60 + 1, False),
+            (2, 2**60, True),
+            (3, 10**30 + 2, True),
+            (3, 10**30 + 1, False),
         ],
     )
-    def test_number_multiple_validator_with_constraint(
+    def test_validate_multiple_of_with_large_integer(
         self,
         multiple_of_value: int,
         test_value: int,
         should_pass: bool,  # noqa: FBT001
     ) -> None:
-        """Test number_multiple_validator with multiple_of constraint."""
+        """Test multiple_of constraint is checked by exact integer arithmetic."""
         multiple_constrained_int = cast(
             "Type[ConstrainedInt]",
-            type(
-                "MultipleConstrainedInt",
-                (ConstrainedInt,),
-                {"multiple_of": multiple_of_value},
-            ),
+            type("MultipleConstrainedInt", (ConstrainedInt,), {"multiple_of": multiple_of_value}),
         )
 
         if should_pass:
-            result = multiple_constrained_int.number_multiple_validator(test_value)
-            assert result == test_value
+            assert multiple_constrained_int.validate(test_value) == test_value
         else:
-            with pytest.raises(NumberNotMultipleError):
-                multiple_constrained_int.number_multiple_validator(test_value)
+            with pytest.raises(ValidationError, match="type=multiple_of,"):
+                multiple_constrained_int.validate(test_value)
 
-    def test_get_pydantic_json_schema_with_constraints(self) -> None:
-        """Test __get_pydantic_json_schema__ updates schema with constraints."""
+    def test_schema_validator_is_built_once_for_each_class(self) -> None:
+        """Test schema validator is cached for each class."""
+        gt_constrained_int = cast("Type[ConstrainedInt]", type("GtConstrainedInt", (ConstrainedInt,), {"gt": 0}))
+        lt_constrained_int = cast("Type[ConstrainedInt]", type("LtConstrainedInt", (ConstrainedInt,), {"lt": 0}))
+
+        assert gt_constrained_int.schema_validator() is gt_constrained_int.schema_validator()
+        assert gt_constrained_int.schema_validator() is not lt_constrained_int.schema_validator()
+
+    def test_json_schema_with_constraints(self) -> None:
+        """Test JSON schema includes constraints."""
         expected_min = 0
         expected_max = 99
         expected_multiple = 5
@@ -359,41 +313,19 @@ class TestConstrainedInt:
             ),
         )
 
-        field_schema: dict[str, Any] = {}
-        full_constrained_int.__get_pydantic_json_schema__(field_schema)
+        field_schema = TypeAdapter(full_constrained_int).json_schema()
 
         assert field_schema["exclusiveMinimum"] == expected_min
         assert field_schema["maximum"] == expected_max
         assert field_schema["multipleOf"] == expected_multiple
 
-    def test_get_pydantic_json_schema_with_none_values(self) -> None:
-        """Test __get_pydantic_json_schema__ with None constraint values."""
+    def test_json_schema_with_none_values(self) -> None:
+        """Test JSON schema with None constraint values."""
         no_constraints_int = cast("Type[ConstrainedInt]", type("NoConstraintsInt", (ConstrainedInt,), {}))
 
-        field_schema: dict[str, Any] = {}
-        no_constraints_int.__get_pydantic_json_schema__(field_schema)
-
-        self._assert_schema_has_no_constraints(field_schema)
-
-    def _assert_schema_has_no_constraints(self, field_schema: dict[str, Any]) -> None:
-        """Assert field schema has no constraint values."""
-        self._assert_minimum_constraints_absent(field_schema)
-        self._assert_maximum_constraints_absent(field_schema)
-        self._assert_multiple_constraint_absent(field_schema)
-
-    def _assert_minimum_constraints_absent(self, field_schema: dict[str, Any]) -> None:
-        """Assert minimum constraint fields are absent from schema."""
-        assert "exclusiveMinimum" not in field_schema
-        assert "minimum" not in field_schema
-
-    def _assert_maximum_constraints_absent(self, field_schema: dict[str, Any]) -> None:
-        """Assert maximum constraint fields are absent from schema."""
-        assert "exclusiveMaximum" not in field_schema
-        assert "maximum" not in field_schema
+        field_schema = TypeAdapter(no_constraints_int).json_schema()
 
-    def _assert_multiple_constraint_absent(self, field_schema: dict[str, Any]) -> None:
-        """Assert multipleOf constraint field is absent from schema."""
-        assert "multipleOf" not in field_schema
+        assert field_schema == {"type": "integer"}
 
 
 class TestConstrainedStringToInt:
@@ -482,13 +414,13 @@ class TestConstrainedStringToInt:
         assert result == expected_result
 
         # Test constraint violations
-        with pytest.raises(NumberNotGtError):
+        with pytest.raises(ValidationError, match="type=greater_than,"):
             ConstrainedTestInt.validate("0")
 
-        with pytest.raises(NumberNotLtError):
+        with pytest.raises(ValidationError, match="type=less_than,"):
             ConstrainedTestInt.validate("100")
 
-        with pytest.raises(NumberNotMultipleError):
+        with pytest.raises(ValidationError, match="type=multiple_of,"):
             ConstrainedTestInt.validate("7")
 
 
@@ -574,13 +506,13 @@ class TestConstringtointFunction:
         assert result == expected_value_2
 
         # Test constraint validation
-        with pytest.raises(NumberNotGtError):
+        with pytest.raises(ValidationError, match="type=greater_than,"):
             cast("Type[ConstrainedStringToInt]", comma_string_to_int).validate("0")  # pylint: disable=no-member
 
-        with pytest.raises(NumberNotLtError):
+        with pytest.raises(ValidationError, match="type=less_than,"):
             cast("Type[ConstrainedStringToInt]", comma_string_to_int).validate("1000")  # pylint: disable=no-member
 
-        with pytest.raises(NumberNotMultipleError):
+        with pytest.raises(ValidationError, match="type=multiple_of,"):
             cast("Type[ConstrainedStringToInt]", comma_string_to_int).validate("7")  # pylint: disable=no-member
 
 
@@ -602,7 +534,7 @@ class TestModuleIntegration:
         assert result == expected_result
 
         # Test error handling
-        with pytest.raises(TypeError):
+        with pytest.raises(PydanticCustomError):
             validator.validate(123)
 
     def test_full_workflow_with_constringtoint(self) -> None:
@@ -626,19 +558,19 @@ class TestModuleIntegration:
             multiple_of=4,
         )
 
-        # Test valid conversion (5 * 2 = 10, but 10 is not > 10)
-        with pytest.raises(NumberNotGtError):
-            cast("Type[ConstrainedStringToInt]", double_string_to_int).validate("5")  # pylint: disable=no-member
+        # Test valid conversion (4 * 2 = 8, which is multiple of 4, but 8 is not > 10)
+        with pytest.raises(ValidationError, match="type=greater_than,"):
+            cast("Type[ConstrainedStringToInt]", double_string_to_int).validate("4")  # pylint: disable=no-member
 
         # Test valid conversion (6 * 2 = 12, which is > 10, <= 200, and multiple of 4)
         result = cast("Type[ConstrainedStringToInt]", double_string_to_int).validate("6")  # pylint: disable=no-member
         assert result == expected_result
 
         # Test constraint violations
-        with pytest.raises(NumberNotLeError):
-            cast("Type[ConstrainedStringToInt]", double_string_to_int).validate("101")  # pylint: disable=no-member
+        with pytest.raises(ValidationError, match="type=less_than_equal,"):
+            cast("Type[ConstrainedStringToInt]", double_string_to_int).validate("102")  # pylint: disable=no-member
 
-        with pytest.raises(NumberNotMultipleError):
+        with pytest.raises(ValidationError, match="type=multiple_of,"):
             cast("Type[ConstrainedStringToInt]", double_string_to_int).validate(  # pylint: disable=no-member
                 "7",
             )  # 7 * 2 = 14, which is not multiple of 4
@@ -4,13 +4,16 @@
 
 from __future__ import annotations
 
+import pickle
 from typing import Any
 from unittest.mock import Mock
 
 import annotated_types
 import pytest
+from pydantic_core import PydanticCustomError
 
 from pydantictypes.abstract_string_to_optional_int import OptionalIntegerMustBeFromStr
+from pydantictypes.abstract_string_to_optional_int import _compile_numeric_constraints
 from pydantictypes.abstract_string_to_optional_int import abstract_constringtooptionalint
 from tests.testlibraries.type_validation import OptionalIntConstraintListAsserter
 from tests.testlibraries.type_validation import OptionalIntConstraintListParams
@@ -96,6 +99,17 @@ class TestOptionalIntegerMustBeFromStr:
         assert f"Type is <class '{expected_type_name}'>" in error_message
         mock_converter.assert_not_called()
 
+    def test_validate_with_non_string_keeps_value_in_context(self) -> None:
+        """Non-string value should be kept in the context so that it is formatted only when rendered."""
+        validator = OptionalIntegerMustBeFromStr(Mock())
+        value = list(range(1000))
+
+        with pytest.raises(PydanticCustomError) as exc_info:
+            validator.validate(value)
+
+        assert exc_info.value.type == "string_required"
+        assert exc_info.value.context == {"value": value, "type": list}
+
     def test_validate_with_none_returns_none(self) -> None:
         """Test that validate returns None for None input (optional type)."""
         mock_converter = Mock()
@@ -157,6 +171,66 @@ class TestOptionalIntegerMustBeFromStr:
         assert result == expected_result
         assert isinstance(result, int)
 
+    def test_pickle(self) -> None:
+        """Validator should be sent into other processes with its constraints."""
+        validator = pickle.loads(pickle.dumps(OptionalIntegerMustBeFromStr(int, ge=0, multiple_of=2)))  # noqa: S301
+        assert validator.validate("2") == 2  # noqa: PLR2004
+        with pytest.raises(ValueError, match="greater than or equal to 0"):
+            validator.validate("-2")
+        with pytest.raises(ValueError, match="multiple of 2"):
+            validator.validate("1")
+
+
+class TestCompileNumericConstraints:
+    """Tests for _compile_numeric_constraints function."""
+
+    def test_no_constraint_compiles_to_none(self) -> None:
+        """Test that no checker is compiled when there is no constraint."""
+        assert _compile_numeric_constraints() is None
+        assert OptionalIntegerMustBeFromStr(int).check_numeric_constraints is None
+
+    @pytest.mark.parametrize(
+        ("constraints", "value"),
+        [
+            ({"gt": 0}, 1),
+            ({"ge": 0}, 0),
+            ({"lt": 0}, -1),
+            ({"le": 0}, 0),
+            ({"multiple_of": 5}, -10),
+            ({"gt": 0, "ge": 1, "lt": 10, "le": 9, "multiple_of": 3}, 9),
+            ({"multiple_of": 2}, 2**70),
+        ],
+    )
+    def test_valid_value(self, constraints: dict[str, int], value: int) -> None:
+        """Test that checker accepts value which meets all constraints."""
+        check = _compile_numeric_constraints(**constraints)
+        assert check is not None
+        check(value)
+
+    @pytest.mark.parametrize(
+        ("constraints", "value", "expected_message"),
+        [
+            ({"gt": 0}, 0, "Input should be greater than 0"),
+            ({"ge": 0}, -1, "Input should be greater than or equal to 0"),
+            ({"lt": 0}, 0, "Input should be less than 0"),
+            ({"le": 0}, 1, "Input should be less than or equal to 0"),
+            ({"multiple_of": 5}, 7, "Input should be a multiple of 5"),
+            ({"multiple_of": 2}, 2**70 + 1, "Input should be a multiple of 2"),
+            # The first violated constraint in the order of gt, ge, lt, le and multiple_of is reported.
+            ({"gt": 0, "ge": 1, "lt": 10, "le": 9, "multiple_of": 3}, 0, "Input should be greater than 0"),
+            ({"gt": 0, "ge": 2, "lt": 10, "le": 9, "multiple_of": 3}, 1, "Input should be greater than or equal to 2"),
+            ({"gt": 0, "ge": 1, "lt": 10, "le": 9, "multiple_of": 3}, 10, "Input should be less than 10"),
+            ({"gt": 0, "ge": 1, "lt": 11, "le": 9, "multiple_of": 5}, 10, "Input should be less than or equal to 9"),
+            ({"gt": 0, "ge": 1, "lt": 10, "le": 9, "multiple_of": 3}, 8, "Input should be a multiple of 3"),
+        ],
+    )
+    def test_invalid_value(self, constraints: dict[str, int], value: int, expected_message: str) -> None:
+        """Test that checker reports the first violated constraint."""
+        check = _compile_numeric_constraints(**constraints)
+        assert check is not None
+        with pytest.raises(ValueError, match=f"^{expected_message}$"):
+            check(value)
+
 
 class TestAbstractConstringtooptionalint:
     """Tests for abstract_constringtooptionalint function.
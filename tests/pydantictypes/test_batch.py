@@ -0,0 +1,104 @@
+"""Tests for batch.py ."""
+
+from __future__ import annotations
+
+import datetime
+from typing import Any
+
+import pytest
+from pydantic import TypeAdapter
+from pydantic import ValidationError
+
+from pydantictypes._batch_core import TYPE_ADAPTER_CACHE_SIZE
+from pydantictypes._batch_core import list_type_adapter
+from pydantictypes._batch_core import type_adapter
+from pydantictypes.batch import validate_many
+from pydantictypes.empty_string_to_none import EmptyStringToNone
+from pydantictypes.half_width_string import HalfWidthString
+from pydantictypes.kanji_yen_string_to_int import StrictKanjiYenStringToInt
+from pydantictypes.string_to_datetime import StringSlashToDateTime
+from pydantictypes.string_to_optional_bool import StringToOptionalBool
+from pydantictypes.string_to_optional_int import constringtooptionalint
+from pydantictypes.string_to_optional_str import constringtooptionalstr
+from pydantictypes.string_with_comma_to_optional_int import StrictStringWithCommaToOptionalInt
+from pydantictypes.string_with_length_constraint import constrained_string
+
+
+class TestValidateMany:
+    """Tests for validate_many."""
+
+    @pytest.mark.parametrize(
+        ("type_", "values", "expected"),
+        [
+            (StrictKanjiYenStringToInt, ["1円", "1,000円"], [1, 1000]),
+            (StrictStringWithCommaToOptionalInt, ["1,000", "", None], [1000, None, None]),
+            (StringSlashToDateTime, ["2020/01/01"], [datetime.datetime(2020, 1, 1)]),  # noqa: DTZ001
+            (HalfWidthString, iter(["abc", ""]), ["abc", ""]),
+            (StrictKanjiYenStringToInt, [], []),
+        ],
+    )
+    # Reason: The argument of pydantic type
+    def test(self, type_: Any, values: Any, expected: list[Any]) -> None:  # noqa: ANN401
+        """Values should be converted and no error should be reported."""
+        result = validate_many(type_, values)
+        assert result.values == expected
+        assert result.errors == {}
+        assert result.is_valid
+
+    @pytest.mark.parametrize(
+        ("type_", "values", "expected_values", "expected_error_indexes"),
+        [
+            (StrictKanjiYenStringToInt, ["1円", "1.0円", "2円", "$1"], [1, None, 2, None], [1, 3]),
+            # Non-string value shouldn't stop validation of the rest
+            (StrictKanjiYenStringToInt, ["1円", None, "2円", 1], [1, None, 2, None], [1, 3]),
+            (StrictStringWithCommaToOptionalInt, ["1,000", "a", None], [1000, None, None], [1]),
+            (HalfWidthString, ["abc", "ＡＢＣ"], ["abc", None], [1]),  # noqa: RUF001
+        ],
+    )
+    # Reason: The argument of pydantic type
+    def test_error(
+        self,
+        type_: Any,  # noqa: ANN401
+        values: list[Any],
+        expected_values: list[Any],
+        expected_error_indexes: list[int],
+    ) -> None:
+        """Invalid values should be reported by index without raising."""
+        result = validate_many(type_, values)
+        assert result.values == expected_values
+        assert sorted(result.errors) == expected_error_indexes
+        assert all(isinstance(message, str) and message for message in result.errors.values())
+        assert not result.is_valid
+
+    def test_error_message(self) -> None:
+        """Error message should be the message of validator."""
+        result = validate_many(StrictKanjiYenStringToInt, ["1.0円"])
+        assert result.errors == {0: "Decimal is unsupported. Yen string = 1.0円"}
+
+    @pytest.mark.parametrize(
+        "type_",
+        [
+            StrictKanjiYenStringToInt,
+            HalfWidthString,
+            StringToOptionalBool,
+            EmptyStringToNone,
+            constrained_string(max_length=3),
+            constringtooptionalstr(),
+        ],
+    )
+    # Reason: The argument of pydantic type
+    def test_string_required(self, type_: Any) -> None:  # noqa: ANN401
+        """Non-string value should raise ValidationError of type string_required instead of TypeError."""
+        with pytest.raises(ValidationError) as exc_info:
+            TypeAdapter(type_).validate_python(123)
+        assert exc_info.value.errors()[0]["type"] == "string_required"
+        result = validate_many(type_, [123])
+        assert result.errors == {0: "String required. Value is 123. Type is <class 'int'>."}
+
+
+def test_type_adapter_cache_is_bounded() -> None:
+    """TypeAdapters of types which are no longer used should be released."""
+    for minimum in range(TYPE_ADAPTER_CACHE_SIZE + 1):
+        validate_many(constringtooptionalint(ge=minimum), ["1"])
+    assert type_adapter.cache_info().currsize == TYPE_ADAPTER_CACHE_SIZE
+    assert list_type_adapter.cache_info().currsize == TYPE_ADAPTER_CACHE_SIZE
@@ -0,0 +1,92 @@
+"""Tests for _cached_schema.py ."""
+
+from __future__ import annotations
+
+import gc
+import weakref
+from typing import Any
+from typing import Optional
+
+import pytest
+from pydantic import BaseModel
+from pydantic import BeforeValidator
+from pydantic import ConfigDict
+from pydantic import Field
+from pydantic import TypeAdapter
+from pydantic_core import SchemaValidator
+from pydantic_core import core_schema
+
+from pydantictypes._cached_schema import CachedBeforeValidator
+from pydantictypes.string_to_datetime import StringSlashToDateTime
+from pydantictypes.string_to_optional_bool import StringToBoolean
+from pydantictypes.string_to_optional_bool import StringToOptionalBool
+from pydantictypes.string_to_optional_str import StringToOptionalStr
+from pydantictypes.string_with_comma_to_int import NativeStrictStringWithCommaToInt
+from pydantictypes.string_with_length_constraint import native_constrained_string
+from pydantictypes.symbol_yen_string_to_int import SymbolYenStringToInt
+
+try:
+    from typing import Annotated
+except ImportError:
+    from typing_extensions import Annotated
+
+
+def to_int(value: str) -> int:
+    return int(value)
+
+
+class TestCachedBeforeValidator:
+    """Tests for CachedBeforeValidator."""
+
+    def test_same_as_before_validator(self) -> None:
+        """Core schema should be the same as BeforeValidator for each source type, also when it is reused."""
+        validator = CachedBeforeValidator(to_int)
+        source_types: list[Any] = [Optional[int], int, Optional[int]]
+        for source_type in source_types:
+            expected: Any = Annotated[source_type, BeforeValidator(to_int)]
+            cached: Any = Annotated[source_type, validator]
+            assert TypeAdapter(cached).core_schema == TypeAdapter(expected).core_schema
+        assert isinstance(validator, BeforeValidator)
+
+    def test_config_of_model(self) -> None:
+        """Schema of source type should follow the config of each model, also after the other model."""
+
+        class EnumValues(BaseModel):
+            model_config = ConfigDict(use_enum_values=True)
+            value: StringToOptionalBool
+
+        class Plain(BaseModel):
+            value: StringToOptionalBool
+
+        value: Any = EnumValues(value="1").value
+        assert value is True
+        assert Plain(value="1").value is StringToBoolean.TRUE
+
+    def test_release(self) -> None:
+        """Cached schema should not keep the validator which is no longer used."""
+        validator = CachedBeforeValidator(to_int)
+        # Without Annotated, whose types are kept by the cache of typing module.
+        schema = validator.__get_pydantic_core_schema__(int, lambda _source_type: core_schema.int_schema())  # type: ignore[arg-type]
+        assert SchemaValidator(schema).validate_python("1") == 1
+        reference = weakref.ref(validator)
+        del validator
+        gc.collect()
+        assert reference() is None
+
+
+@pytest.mark.parametrize(
+    "type_",
+    [
+        StringToOptionalStr,
+        NativeStrictStringWithCommaToInt,
+        native_constrained_string(max_length=4),
+        StringSlashToDateTime,
+        SymbolYenStringToInt,
+    ],
+)
+# Reason: The argument of pydantic type
+def test_field_doesnt_leak(type_: Any) -> None:  # noqa: ANN401
+    """Description of field should not change the shared schema of other fields."""
+    described = TypeAdapter(Annotated[type_, Field(description="Described")]).json_schema()
+    assert described["description"] == "Described"
+    assert "description" not in TypeAdapter(type_).json_schema()
@@ -0,0 +1,135 @@
+"""Tests for _canonical.py ."""
+
+from __future__ import annotations
+
+import gc
+import weakref
+from typing import Any
+from typing import Callable
+
+import pytest
+from pydantic import BaseModel
+from pydantic import TypeAdapter
+
+from pydantictypes import kanji_yen_string_to_int
+from pydantictypes import string_with_comma_to_int
+from pydantictypes import symbol_yen_string_to_int
+from pydantictypes._canonical import canonical
+from pydantictypes.abstract_string_to_int import constringtoint
+from pydantictypes.string_to_optional_int import constringtooptionalint
+from pydantictypes.string_to_optional_str import constringtooptionalstr
+from pydantictypes.string_with_comma_to_optional_int import constringwithcommatooptionalint
+from pydantictypes.string_with_length_constraint import constrained_optional_string
+from pydantictypes.string_with_length_constraint import constrained_string
+from pydantictypes.string_with_length_constraint import native_constrained_string
+from pydantictypes.symbol_yen_string_to_int import SymbolYenStringToInt
+
+
+class Value:
+    """Value which can be referenced weakly as types."""
+
+    def __init__(self, name: str = "") -> None:
+        self.name = name
+
+
+class TestCanonical:
+    """Tests for canonical."""
+
+    def test(self) -> None:
+        """Calls which differ only in order of keywords or in omitted defaults should return the identical value."""
+        calls: list[dict[str, Any]] = []
+
+        @canonical
+        def factory(*, a: int = 0, b: int | None = None) -> Value:
+            calls.append({"a": a, "b": b})
+            return Value()
+
+        assert factory(a=1, b=2) is factory(b=2, a=1)
+        assert factory() is factory(a=0, b=None)
+        assert factory(a=1) is not factory(a=2)
+        assert calls == [{"a": 1, "b": 2}, {"a": 0, "b": None}, {"a": 1, "b": None}, {"a": 2, "b": None}]
+
+    def test_type_of_argument(self) -> None:
+        """Arguments which are equal but of different types should not share the value."""
+
+        @canonical
+        def factory(value: float) -> Value:
+            return Value(repr(value))
+
+        assert [factory(1).name, factory(1.0).name, factory(True).name] == ["1", "1.0", "True"]  # noqa: FBT003
+
+    def test_unhashable(self) -> None:
+        """Calls with unhashable arguments should not be memoized."""
+
+        @canonical
+        def factory(values: list[int]) -> list[int]:
+            return list(values)
+
+        assert factory([1]) == [1]
+        assert factory([1]) is not factory([1])
+
+    def test_release(self) -> None:
+        """Values which are no longer referenced should be released and created again on next call."""
+        calls: list[int] = []
+
+        @canonical
+        def factory(value: int) -> Value:
+            calls.append(value)
+            return Value()
+
+        reference = weakref.ref(factory(1))
+        gc.collect()
+        assert reference() is None
+        factory(1)
+        assert calls == [1, 1]
+
+    def test_wrapped(self) -> None:
+        """Unmemoized factory should be available."""
+
+        def factory() -> object:
+            return object()
+
+        memoized = canonical(factory)
+        assert memoized.__wrapped__ is factory  # type: ignore[attr-defined]
+        assert memoized.__name__ == "factory"
+
+
+@pytest.mark.parametrize(
+    ("factory", "constraints"),
+    [
+        (constringtooptionalint, {"ge": 0, "le": 10}),
+        (constringwithcommatooptionalint, {"gt": 0}),
+        (constringtooptionalstr, {"strip_whitespace": True, "max_length": 5, "regex": r"^\w+$"}),
+        (constrained_string, {"equal_to": 5}),
+        (constrained_optional_string, {"min_length": 1}),
+        (native_constrained_string, {"max_length": 5}),
+        (kanji_yen_string_to_int.constringtoint, {"ge": 0}),
+        (string_with_comma_to_int.constringtoint, {"multiple_of": 10}),
+        (symbol_yen_string_to_int.constringtoint, {"lt": 100}),
+        (constringtoint, {"type_name": "Price", "type_class": SymbolYenStringToInt, "le": 100}),
+    ],
+)
+# Reason: The factory of pydantic type
+def test_factories(factory: Callable[..., Any], constraints: dict[str, Any]) -> None:
+    """Constraint factories should return the identical type for the same constraints, usable in models."""
+    type_ = factory(**constraints)
+    assert factory(**dict(reversed(constraints.items()))) is type_
+    assert factory.__wrapped__(**constraints) is not type_  # type: ignore[attr-defined]
+
+    class Model(BaseModel):
+        value: type_  # type: ignore[valid-type]
+
+    assert Model.model_fields["value"].annotation is not None
+
+
+def use_type_of_tenant() -> weakref.ref[type[int]]:
+    type_ = constringtoint(type_name="Price", type_class=SymbolYenStringToInt, ge=7)
+    assert TypeAdapter(type_).validate_python("\\10") == 10  # noqa: PLR2004
+    return weakref.ref(type_)
+
+
+def test_type_of_tenant_is_released() -> None:
+    """Constrained class which is no longer used should be released with its core schema."""
+    reference = use_type_of_tenant()
+    gc.collect()
+    assert reference() is None
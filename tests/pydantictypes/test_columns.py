@@ -0,0 +1,193 @@
+"""Tests for columns.py ."""
+
+from __future__ import annotations
+
+import ast
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from pydantictypes.batch import validate_many
+from pydantictypes.empty_string_to_none import EmptyStringToNone
+from pydantictypes.half_width_string import OptionalHalfWidthString
+from pydantictypes.kanji_yen_string_to_int import StrictKanjiYenStringToInt
+from pydantictypes.string_to_datetime import StringSlashToDateTime
+from pydantictypes.string_to_optional_bool import StringToBoolean
+from pydantictypes.string_to_optional_bool import StringToOptionalBool
+from pydantictypes.string_to_optional_int import constringtooptionalint
+from pydantictypes.string_with_comma_to_int import StrictStringWithCommaToInt
+from pydantictypes.string_with_comma_to_optional_int import StrictStringWithCommaToOptionalInt
+from pydantictypes.symbol_yen_string_to_int import StrictSymbolYenStringToInt
+
+pa = pytest.importorskip("pyarrow")
+pd = pytest.importorskip("pandas")
+
+# Reason: To skip tests when pyarrow is not installed. pylint: disable-next=wrong-import-position
+from pydantictypes import columns  # noqa: E402
+from pydantictypes.columns import arrow_type_of  # noqa: E402
+from pydantictypes.columns import convert_arrow_array  # noqa: E402
+from pydantictypes.columns import convert_series  # noqa: E402
+
+VALUES: list[Any] = [
+    "1",
+    "1,000",
+    "1,000円",
+    "\\1,000",
+    "1,000",
+    "",
+    None,
+    "0",
+    "2020/01/02",
+    "2020/02/30",
+    "ｱｲｳ",
+    "あいう",
+    "abc",
+    "99,999,999,999,999,999,999",
+    "99,999,999,999,999,999,999円",
+]
+TYPES = [
+    StrictKanjiYenStringToInt,
+    StrictSymbolYenStringToInt,
+    StrictStringWithCommaToInt,
+    StrictStringWithCommaToOptionalInt,
+    constringtooptionalint(ge=1),
+    StringSlashToDateTime,
+    StringToOptionalBool,
+    OptionalHalfWidthString,
+    EmptyStringToNone,
+]
+
+
+def expected_of(type_: Any, values: list[Any]) -> tuple[list[Any], list[int]]:  # noqa: ANN401
+    """Return the values which validate_many() returns as Arrow values, and the indexes of invalid values."""
+    result = validate_many(type_, values)
+    expected: list[Any] = []
+    invalid = sorted(result.errors)
+    for index, value in enumerate(result.values):
+        if isinstance(value, int) and not -(2**63) <= value < 2**63:
+            invalid.append(index)
+            expected.append(None)
+            continue
+        expected.append(bool(value) if isinstance(value, StringToBoolean) else value)
+    return expected, sorted(invalid)
+
+
+@pytest.mark.parametrize(
+    ("type_", "expected"),
+    [
+        (StrictKanjiYenStringToInt, "int64"),
+        (StrictStringWithCommaToOptionalInt, "int64"),
+        (constringtooptionalint(ge=1), "int64"),
+        (StringSlashToDateTime, "timestamp[us]"),
+        (StringToOptionalBool, "bool"),
+        (OptionalHalfWidthString, "string"),
+        (EmptyStringToNone, "null"),
+        (Any, None),
+    ],
+)
+def test_arrow_type_of(type_: Any, expected: str | None) -> None:  # noqa: ANN401
+    arrow_type = arrow_type_of(type_)
+    assert (None if arrow_type is None else str(arrow_type)) == expected
+
+
+class TestConvertArrowArray:
+    """Tests for convert_arrow_array."""
+
+    @pytest.mark.parametrize("type_", TYPES)
+    def test_same_as_validate_many(self, type_: Any) -> None:  # noqa: ANN401
+        """Values and errors should be the same as validate_many() except integers which don't fit into int64."""
+        result = convert_arrow_array(type_, pa.array(VALUES))
+        expected, invalid = expected_of(type_, VALUES)
+        assert result.values.to_pylist() == expected
+        assert result.errors.column("index").to_pylist() == invalid
+        assert result.errors.column("value").to_pylist() == [VALUES[index] for index in invalid]
+        assert result.invalid.to_pylist() == [index in invalid for index in range(len(VALUES))]
+        assert result.null.to_pylist() == [
+            value is None and index not in invalid for index, value in enumerate(expected)
+        ]
+
+    def test_errors(self) -> None:
+        """Errors should have the same messages as validate_many()."""
+        values = ["1,000", "x", "x", None]
+        type_: Any = StrictStringWithCommaToOptionalInt
+        result = convert_arrow_array(type_, pa.chunked_array([values[:2], values[2:]]))
+        messages = validate_many(type_, values).errors
+        assert result.errors.to_pylist() == [
+            {"index": 1, "value": "x", "error": messages[1]},
+            {"index": 2, "value": "x", "error": messages[2]},
+        ]
+        assert result.values.to_pylist() == [1000, None, None, None]
+        assert result.null.to_pylist() == [False, False, False, True]
+
+    def test_overflow(self) -> None:
+        """Integers which don't fit into int64 should be invalid."""
+        result = convert_arrow_array(StrictStringWithCommaToInt, ["9,223,372,036,854,775,807", "9223372036854775808"])
+        assert result.values.to_pylist() == [2**63 - 1, None]
+        assert result.errors.column("error").to_pylist() == [
+            "Value doesn't fit into int64. Value = 9223372036854775808",
+        ]
+
+    def test_empty(self) -> None:
+        result = convert_arrow_array(StrictKanjiYenStringToInt, pa.array([], type=pa.string()))
+        assert len(result.values) == 0
+        assert result.errors.num_rows == 0
+
+
+class TestConvertSeries:
+    """Tests for convert_series."""
+
+    @pytest.mark.parametrize("type_", TYPES)
+    def test_same_as_validate_many(self, type_: Any) -> None:  # noqa: ANN401
+        """Values and errors should be the same as validate_many() except integers which don't fit into int64."""
+        index = [f"row{number}" for number in range(len(VALUES))]
+        result = convert_series(type_, pd.Series(VALUES, index=index, dtype=object))
+        expected, invalid = expected_of(type_, VALUES)
+        assert result.values.index.tolist() == index
+        assert [None if pd.isna(value) else value for value in result.values] == expected
+        assert result.errors.index.tolist() == [index[row] for row in invalid]
+        assert result.invalid.tolist() == [row in invalid for row in range(len(VALUES))]
+
+    @pytest.mark.parametrize(
+        ("type_", "values", "dtype"),
+        [
+            (StrictStringWithCommaToOptionalInt, ["1,000", "", "x"], "Int64"),
+            (StringToOptionalBool, ["1", "0", ""], "boolean"),
+            (OptionalHalfWidthString, ["ｱ", "", "あ"], "string"),
+            (StringSlashToDateTime, ["2020/01/02", "2020/02/30"], "datetime64"),
+        ],
+    )
+    def test_dtype(self, type_: Any, values: list[str], dtype: str) -> None:  # noqa: ANN401
+        """Values should be of nullable dtype."""
+        result = convert_series(type_, pd.Series(values, name="column"))
+        assert str(result.values.dtype).startswith(dtype)
+        assert result.values.name == "column"
+
+    def test_missing(self) -> None:
+        """Missing values should be validated as None."""
+        result = convert_series(StrictStringWithCommaToOptionalInt, pd.Series(["1,000", None, float("nan"), ""]))
+        assert result.values.tolist() == [1000, pd.NA, pd.NA, pd.NA]
+        assert result.null.tolist() == [False, True, True, True]
+        assert result.errors.empty
+
+    def test_errors(self) -> None:
+        result = convert_series(StringSlashToDateTime, pd.Series(["2020/01/02", "2020/02/30"], index=[10, 20]))
+        assert result.values[10] == datetime(2020, 1, 2)  # noqa: DTZ001
+        assert result.errors.to_dict("index") == {
+            20: {"value": "2020/02/30", "error": "Value error, day is out of range for month"},
+        }
+
+
+def test_extras_install_imports() -> None:
+    """Extras which provide this module should install every library which it imports."""
+    tomllib = pytest.importorskip("tomllib")
+    pyproject = tomllib.loads((Path(__file__).parents[2] / "pyproject.toml").read_text(encoding="utf-8"))
+    extras = pyproject["project"]["optional-dependencies"]
+    tree = ast.parse(Path(columns.__file__).read_text(encoding="utf-8"))
+    imported = {alias.name.split(".")[0] for node in tree.body if isinstance(node, ast.Import) for alias in node.names}
+    libraries = imported - set(sys.stdlib_module_names)
+    assert libraries == {"numpy", "pyarrow"}
+    assert libraries <= set(extras["arrow"])
+    assert libraries | {"pandas"} <= set(extras["pandas"])
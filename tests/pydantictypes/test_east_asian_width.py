@@ -0,0 +1,63 @@
+"""Tests for _east_asian_width.py."""
+
+from __future__ import annotations
+
+import sys
+import unicodedata
+
+import pytest
+
+from pydantictypes._east_asian_width import NOT_HALF_WIDTH
+from pydantictypes._east_asian_width import find_not_half_width
+from pydantictypes._east_asian_width import to_ranges
+
+
+class TestFindNotHalfWidth:
+    """Tests for find_not_half_width."""
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ("", -1),
+            ("abc", -1),
+            ("ｱｲｳ", -1),
+            ("a¡", 1),
+            ("aあ", 1),
+            ("abＡ", 2),  # noqa: RUF001
+            ("①", 0),
+            ("a\U0001f600", 1),
+            # Private use areas are Ambiguous.
+            ("\ue000", 0),
+            ("\U000f0000", 0),
+            # Characters out of the Basic Multilingual Plane which are half-width are skipped.
+            ("\U00010000\U00010001あ", 2),
+            ("\U00010000\U00010001", -1),
+        ],
+    )
+    def test(self, value: str, expected: int) -> None:
+        """Index of the first character which is Wide, Fullwidth or Ambiguous should be returned."""
+        assert find_not_half_width(value) == expected
+
+    @pytest.mark.slow
+    def test_parity_with_unicodedata(self) -> None:
+        """Result should agree with unicodedata for every code point."""
+        mismatches = [
+            code_point
+            for code_point in range(sys.maxunicode + 1)
+            if (find_not_half_width(chr(code_point)) == 0)
+            is not (unicodedata.east_asian_width(chr(code_point)) in NOT_HALF_WIDTH)
+        ]
+        assert not mismatches
+
+
+@pytest.mark.parametrize(
+    ("code_points", "expected"),
+    [
+        ([], []),
+        ([1], [(1, 1)]),
+        ([1, 2, 3, 5, 7, 8], [(1, 3), (5, 5), (7, 8)]),
+    ],
+)
+def test_to_ranges(code_points: list[int], expected: list[tuple[int, int]]) -> None:
+    """Consecutive code points should be merged into range."""
+    assert to_ranges(code_points) == expected
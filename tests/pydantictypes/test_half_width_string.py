@@ -85,9 +85,29 @@ class TestHalfWidthString:
         ],
     )
     def test_type_error(self, value: str) -> None:
-        """Non-string values should raise TypeError."""
-        with pytest.raises((ValidationError, TypeError)):
+        """Non-string values should raise ValidationError."""
+        with pytest.raises(ValidationError):
+            create(StubHalfWidth, [value])
+
+    @pytest.mark.parametrize(
+        ("value", "expected_index", "expected_character"),
+        [
+            ("あいうえお", 0, "あ"),
+            ("abc１２３", 3, "１"),  # noqa: RUF001
+            ("ｱｲｳ①", 3, "①"),
+            ("ab\U0001f600", 2, "\U0001f600"),
+        ],
+    )
+    def test_error_context(self, value: str, expected_index: int, expected_character: str) -> None:
+        """Error should report the index and the character of the first full-width character."""
+        with pytest.raises(ValidationError) as exc_info:
             create(StubHalfWidth, [value])
+        error = exc_info.value.errors()[0]
+        assert error["type"] == "half_width_characters"
+        assert error["ctx"] == {"index": expected_index, "character": expected_character}
+        assert error["msg"] == (
+            f"Must contain only half-width characters. Index = {expected_index}, character = {expected_character}"
+        )
 
 
 class TestOptionalHalfWidthString:
@@ -141,8 +161,8 @@ class TestOptionalHalfWidthString:
         ],
     )
     def test_type_error(self, value: str) -> None:
-        """Non-string values should raise TypeError."""
-        with pytest.raises((ValidationError, TypeError)):
+        """Non-string values should raise ValidationError."""
+        with pytest.raises(ValidationError):
             create(StubOptionalHalfWidth, [value])
 
     def test_none_value(self) -> None:
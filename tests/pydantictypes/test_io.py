@@ -0,0 +1,204 @@
+"""Tests for io.py ."""
+
+from __future__ import annotations
+
+import datetime
+import io
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import TYPE_CHECKING
+from typing import Any
+
+import pytest
+from pydantic import BaseModel
+from pydantic import Field
+
+import pydantictypes.io
+from pydantictypes._batch_core import list_type_adapter
+from pydantictypes.io import CsvBatch
+from pydantictypes.io import read_csv
+from pydantictypes.io import read_csv_batches
+from pydantictypes.io import read_csv_parallel
+from pydantictypes.kanji_yen_string_to_int import StrictKanjiYenStringToInt
+from pydantictypes.string_to_datetime import StringSlashToDateTime
+from pydantictypes.string_to_optional_str import StringToOptionalStr
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+STATEMENT = '利用日,利用店名,利用金額\r\n2020/01/02,コンビニ①,"1,000円"\r\n2020/01/03,,2円\r\n'
+COLUMNS = {"利用日": StringSlashToDateTime, "利用店名": StringToOptionalStr, "利用金額": StrictKanjiYenStringToInt}
+EXPECTED = [
+    {"利用日": datetime.datetime(2020, 1, 2), "利用店名": "コンビニ①", "利用金額": 1000},  # noqa: DTZ001
+    {"利用日": datetime.datetime(2020, 1, 3), "利用店名": None, "利用金額": 2},  # noqa: DTZ001
+]
+
+
+class Statement(BaseModel):
+    date: StringSlashToDateTime = Field(alias="利用日")
+    amount: StrictKanjiYenStringToInt = Field(alias="利用金額")
+
+
+class CountingStream(io.BytesIO):
+    """Binary stream which records the number of bytes read."""
+
+    def __init__(self, data: bytes) -> None:
+        super().__init__(data)
+        self.bytes_read = 0
+
+    def read1(self, size: int | None = -1) -> bytes:
+        data = super().read1(size)
+        self.bytes_read += len(data)
+        return data
+
+
+class TestReadCsv:
+    """Tests for read_csv."""
+
+    @pytest.mark.parametrize("encoding", ["cp932", "utf-8", "utf-8-sig"])
+    def test_path(self, tmp_path: Path, encoding: str) -> None:
+        """File of each encoding should be read and validated by mapping of column to type."""
+        path = tmp_path / "statement.csv"
+        path.write_bytes(STATEMENT.encode(encoding))
+        assert list(read_csv(path, COLUMNS, encoding=encoding)) == EXPECTED
+        assert list(read_csv(str(path), COLUMNS, encoding=encoding)) == EXPECTED
+
+    def test_byte_order_mark(self) -> None:
+        """Byte order mark of UTF-8 should be skipped by default."""
+        stream = io.BytesIO(STATEMENT.encode("utf-8-sig"))
+        assert list(read_csv(stream, COLUMNS)) == EXPECTED
+
+    def test_model(self) -> None:
+        """Rows should be validated as model, and columns which are not in the model should be ignored."""
+        stream = io.BytesIO(STATEMENT.encode("cp932"))
+        assert [row.amount for row in read_csv(stream, Statement, encoding="cp932")] == [1000, 2]
+
+    @pytest.mark.parametrize(
+        ("schema", "expected"),
+        [
+            (Statement, [Statement(利用日="2020/01/02", 利用金額="1,000円")]),
+            (
+                {"利用日": StringSlashToDateTime, "利用金額": StrictKanjiYenStringToInt},
+                [{"利用日": datetime.datetime(2020, 1, 2), "利用金額": 1000}],  # noqa: DTZ001
+            ),
+        ],
+    )
+    # Reason: The argument of pydantic type
+    def test_without_header(self, schema: Any, expected: list[Any]) -> None:  # noqa: ANN401
+        """Columns should follow the order of schema if the file has no header."""
+        stream = io.BytesIO('口座番号 1234567\r\n2020/01/02,"1,000円"\r\n'.encode("cp932"))
+        assert list(read_csv(stream, schema, encoding="cp932", header=False, skip_rows=1)) == expected
+
+    def test_skip_rows(self) -> None:
+        """Rows before header should be skipped."""
+        stream = io.BytesIO(("口座番号,1234567\r\n\r\n" + STATEMENT).encode("cp932"))
+        assert list(read_csv(stream, COLUMNS, encoding="cp932", skip_rows=2)) == EXPECTED
+
+    def test_invalid_row(self) -> None:
+        """Invalid row should raise error with line number after valid rows are yielded."""
+        stream = io.BytesIO((STATEMENT + '2020/01/04,"multi\r\nline",1.0円\r\n').encode("utf-8"))
+        rows = read_csv(stream, COLUMNS)
+        assert [next(rows), next(rows)] == EXPECTED
+        with pytest.raises(ValueError, match=r"Line number = 5\. Decimal is unsupported"):
+            next(rows)
+
+    def test_stream_is_not_closed(self) -> None:
+        """Binary stream of caller should be left open."""
+        stream = io.BytesIO(STATEMENT.encode("utf-8"))
+        assert len(list(read_csv(stream, COLUMNS))) == len(EXPECTED)
+        assert not stream.closed
+
+    def test_streaming(self) -> None:
+        """Rows should be read lazily instead of reading whole file."""
+        stream = CountingStream((STATEMENT + "2020/01/03,,2円\r\n" * 100_000).encode("utf-8"))
+        rows = read_csv(stream, COLUMNS)
+        assert next(rows) == EXPECTED[0]
+        assert stream.bytes_read < len(stream.getvalue()) / 100
+
+
+class TestReadCsvBatches:
+    """Tests for read_csv_batches."""
+
+    def test(self) -> None:
+        """Rows should be split into batches and invalid rows should be reported by line number."""
+        stream = io.BytesIO((STATEMENT + "2020/01/04,,1.0円\r\n2020/01/05,,5円\r\n").encode("cp932"))
+        batches = list(read_csv_batches(stream, COLUMNS, batch_size=3, encoding="cp932"))
+        assert batches == [
+            CsvBatch(
+                [2, 3, 4],
+                [*EXPECTED, None],
+                {4: "Decimal is unsupported. Yen string = 1.0円"},
+            ),
+            CsvBatch(
+                [5],
+                [{"利用日": datetime.datetime(2020, 1, 5), "利用店名": None, "利用金額": 5}],  # noqa: DTZ001
+            ),
+        ]
+        assert [batch.is_valid for batch in batches] == [False, True]
+
+    def test_model(self) -> None:
+        """Rows should be validated as model."""
+        stream = io.BytesIO(STATEMENT.encode("utf-8"))
+        (batch,) = read_csv_batches(stream, Statement)
+        assert [row.amount for row in batch.values if row is not None] == [1000, 2]
+
+    def test_empty(self) -> None:
+        """File which has only header should yield no batch."""
+        assert list(read_csv_batches(io.BytesIO(b"a,b\r\n"), COLUMNS)) == []
+
+    def test_streaming(self) -> None:
+        """Batches should be read lazily instead of reading whole file."""
+        stream = CountingStream((STATEMENT + "2020/01/03,,2円\r\n" * 100_000).encode("utf-8"))
+        batches = read_csv_batches(stream, COLUMNS, batch_size=100)
+        assert len(next(batches).values) == 100  # noqa: PLR2004
+        assert stream.bytes_read < len(stream.getvalue()) / 100
+
+    def test_adapter_is_cached(self) -> None:
+        """Equal mappings should reuse the TypeAdapters cached for validate_many()."""
+        list(read_csv_batches(io.BytesIO(STATEMENT.encode("utf-8")), COLUMNS))
+        hits = list_type_adapter.cache_info().hits
+        list(read_csv_batches(io.BytesIO(STATEMENT.encode("utf-8")), dict(COLUMNS)))
+        assert list_type_adapter.cache_info().hits == hits + 1
+
+
+class TestReadCsvParallel:
+    """Tests for read_csv_parallel."""
+
+    @pytest.mark.parametrize("encoding", ["cp932", "utf-8-sig"])
+    def test_same_as_serial(self, tmp_path: Path, encoding: str) -> None:
+        """Rows and errors should be the same as serial reading, in order of the file."""
+        path = tmp_path / "statement.csv"
+        invalid = "2020/01/04,,1.0円\r\n"
+        rows = (invalid + "2020/01/05,ｺﾝﾋﾞﾆ,5円\r\n") * 50
+        path.write_bytes(("口座番号,1234567\r\n" + STATEMENT + rows).encode(encoding))
+        expected = next(read_csv_batches(path, COLUMNS, encoding=encoding, skip_rows=1))
+        batches = list(read_csv_parallel(path, COLUMNS, max_workers=2, shard_size=64, encoding=encoding, skip_rows=1))
+        assert len(batches) > 2  # noqa: PLR2004
+        assert [line_number for batch in batches for line_number in batch.line_numbers] == expected.line_numbers
+        assert [value for batch in batches for value in batch.values] == expected.values
+        assert {line: message for batch in batches for line, message in batch.errors.items()} == expected.errors
+        assert list(expected.errors)[:2] == [5, 7]
+
+    def test_model_without_header(self, tmp_path: Path) -> None:
+        """Rows should be validated as model in the order of its fields."""
+        path = tmp_path / "statement.csv"
+        path.write_bytes('2020/01/02,"1,000円"\n2020/01/03,2円'.encode("cp932"))
+        batches = list(read_csv_parallel(path, Statement, max_workers=1, shard_size=1, encoding="cp932", header=False))
+        assert [batch.line_numbers for batch in batches] == [[1], [2]]
+        assert [row.amount for batch in batches for row in batch.values if row is not None] == [1000, 2]
+
+    def test_spawn(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Schema should be sent into worker processes which are spawned, as on macOS and Windows."""
+        context = multiprocessing.get_context("spawn")
+        monkeypatch.setattr(pydantictypes.io, "ProcessPoolExecutor", partial(ProcessPoolExecutor, mp_context=context))
+        path = tmp_path / "statement.csv"
+        path.write_bytes(STATEMENT.encode("utf-8"))
+        batches = list(read_csv_parallel(path, COLUMNS, max_workers=1))
+        assert [value for batch in batches for value in batch.values] == EXPECTED
+
+    def test_empty(self, tmp_path: Path) -> None:
+        """File which has only header should yield no batch."""
+        path = tmp_path / "statement.csv"
+        path.write_bytes(b"a,b\r\n")
+        assert list(read_csv_parallel(path, COLUMNS, max_workers=1)) == []
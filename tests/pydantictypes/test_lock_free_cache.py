@@ -0,0 +1,42 @@
+"""Tests for _lock_free_cache.py ."""
+
+from __future__ import annotations
+
+import threading
+
+from pydantictypes._lock_free_cache import LockFreeCache
+
+
+class TestLockFreeCache:
+    """Tests for LockFreeCache."""
+
+    def test(self) -> None:
+        """Value should be computed once for each key."""
+        calls: list[str] = []
+
+        def function(key: str) -> str:
+            calls.append(key)
+            return key * 2
+
+        cache = LockFreeCache(function)
+        assert cache["a"] == "aa"
+        assert cache["a"] == "aa"
+        assert cache["b"] == "bb"
+        assert calls == ["a", "b"]
+
+    def test_threads(self) -> None:
+        """Concurrent first lookups should get the same value."""
+        cache: LockFreeCache[str, object] = LockFreeCache(lambda _key: object())
+        barrier = threading.Barrier(8)
+        values: list[object] = []
+
+        def run() -> None:
+            barrier.wait()
+            values.append(cache["key"])
+
+        threads = [threading.Thread(target=run) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert all(value is cache["key"] for value in values)
@@ -0,0 +1,182 @@
+"""Tests for memoized.py ."""
+
+from __future__ import annotations
+
+import gc
+import threading
+import weakref
+from typing import Any
+
+import pytest
+from pydantic import TypeAdapter
+from pydantic import ValidationError
+
+from pydantictypes.half_width_string import HalfWidthString
+from pydantictypes.kanji_yen_string_to_int import StrictKanjiYenStringToInt
+from pydantictypes.kanji_yen_string_to_int import constringtoint
+from pydantictypes.memoized import CacheStatistics
+from pydantictypes.memoized import MemoizedStringToInt
+from pydantictypes.memoized import cache_statistics
+from pydantictypes.memoized import memoize
+from pydantictypes.string_with_comma_to_int import StrictStringWithCommaToInt
+from pydantictypes.symbol_yen_string_to_int import StrictSymbolYenStringToInt
+from pydantictypes.utility import Utility
+
+
+class Buffer:
+    """Local object of conversion."""
+
+
+class TestMemoizedStringToInt:
+    """Tests for MemoizedStringToInt."""
+
+    def test_hit(self) -> None:
+        """Repeated string should be converted only once."""
+        memoized = MemoizedStringToInt(Utility.convert_string_with_comma_to_int, 2)
+        assert memoized("1,000") == 1000  # noqa: PLR2004
+        assert memoized("1,000") == 1000  # noqa: PLR2004
+        assert memoized("0") == 0
+        assert memoized("0") == 0
+        assert memoized.statistics() == CacheStatistics(hits=2, misses=2, maxsize=2, currsize=2)
+
+    def test_negative_cache(self) -> None:
+        """Repeated invalid string should raise the same error without conversion."""
+        calls: list[str] = []
+
+        def string_to_int(value: str) -> int:
+            calls.append(value)
+            return Utility.convert_string_with_comma_to_int(value)
+
+        memoized = MemoizedStringToInt(string_to_int, 2)
+        messages = []
+        for _ in range(2):
+            with pytest.raises(ValueError, match=r"1\.0") as excinfo:
+                memoized("1.0")
+            messages.append(str(excinfo.value))
+        assert messages[0] == messages[1]
+        assert calls == ["1.0"]
+        assert memoized.statistics() == CacheStatistics(hits=1, misses=1, maxsize=2, currsize=1)
+
+    def test_failure_doesnt_keep_frames(self) -> None:
+        """Cached failure should not keep the frames and locals of conversion by traceback."""
+        references: list[weakref.ref[Buffer]] = []
+
+        def string_to_int(value: str) -> int:
+            buffer = Buffer()
+            references.append(weakref.ref(buffer))
+            msg = f"Invalid. Value = {value}"
+            raise ValueError(msg)
+
+        memoized = MemoizedStringToInt(string_to_int, 2)
+        with pytest.raises(ValueError, match="Invalid"):
+            memoized("a")
+        gc.collect()
+        assert references[0]() is None
+        with pytest.raises(ValueError, match="Invalid"):
+            memoized("a")
+
+    def test_least_recently_used_is_evicted(self) -> None:
+        """The least recently used string should be discarded when the cache is full."""
+        memoized = MemoizedStringToInt(Utility.convert_string_with_comma_to_int, 2)
+        memoized("1")
+        memoized("2")
+        memoized("1")
+        memoized("3")
+        memoized("3")
+        memoized("1")
+        assert memoized.statistics() == CacheStatistics(hits=3, misses=3, maxsize=2, currsize=2)
+        memoized("2")
+        assert memoized.statistics() == CacheStatistics(hits=3, misses=4, maxsize=2, currsize=2)
+
+    def test_clear(self) -> None:
+        """Clear should discard entries and statistics."""
+        memoized = MemoizedStringToInt(Utility.convert_string_with_comma_to_int, 2)
+        memoized("1")
+        memoized("1")
+        memoized.clear()
+        assert memoized.statistics() == CacheStatistics(hits=0, misses=0, maxsize=2, currsize=0)
+
+    def test_threads(self) -> None:
+        """Concurrent calls should return correct values and keep the cache bounded."""
+        memoized = MemoizedStringToInt(Utility.convert_string_with_comma_to_int, 16)
+        values = [f"{number:,}" for number in range(0, 64_000, 1000)]
+        results: list[list[int]] = []
+
+        def run() -> None:
+            results.append([memoized(value) for _ in range(50) for value in values])
+
+        threads = [threading.Thread(target=run) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        expected = [number * 1000 for _ in range(50) for number in range(len(values))]
+        assert results == [expected] * 8
+        statistics = memoized.statistics()
+        assert statistics.hits + statistics.misses == 8 * 50 * len(values)
+        assert statistics.currsize <= 16  # noqa: PLR2004
+
+
+class TestMemoize:
+    """Tests for memoize."""
+
+    @pytest.mark.parametrize(
+        ("type_", "value", "expected"),
+        [
+            (StrictKanjiYenStringToInt, "1,000円", 1000),
+            (StrictSymbolYenStringToInt, "\\1,000", 1000),
+            (StrictStringWithCommaToInt, "1,000", 1000),
+        ],
+    )
+    # Reason: The argument of pydantic type
+    def test(self, type_: Any, value: str, expected: int) -> None:  # noqa: ANN401
+        """Memoized type should convert as the original type and count hits."""
+        memoized = memoize(type_)
+        adapter = TypeAdapter(memoized)
+        assert adapter.validate_python(value) == expected
+        assert adapter.validate_python(value) == expected
+        assert cache_statistics(memoized) == CacheStatistics(hits=1, misses=1, maxsize=4096, currsize=1)
+
+    @pytest.mark.parametrize("value", ["1.0円", "1,000"])
+    def test_error(self, value: str) -> None:
+        """Memoized type should raise the same error as the original type."""
+        expected = TypeAdapter(StrictKanjiYenStringToInt)
+        adapter = TypeAdapter(memoize(StrictKanjiYenStringToInt))
+        for _ in range(2):
+            with pytest.raises(ValidationError) as excinfo_expected:
+                expected.validate_python(value)
+            with pytest.raises(ValidationError) as excinfo:
+                adapter.validate_python(value)
+            assert excinfo.value.errors() == excinfo_expected.value.errors()
+
+    def test_constraints(self) -> None:
+        """Constraints should be validated even if the conversion is cached."""
+        memoized = memoize(constringtoint(gt=5), maxsize=8)
+        adapter = TypeAdapter(memoized)
+        assert adapter.validate_python("6円") == 6  # noqa: PLR2004
+        for _ in range(2):
+            with pytest.raises(ValidationError, match="type=greater_than,"):
+                adapter.validate_python("5円")
+        assert cache_statistics(memoized) == CacheStatistics(hits=1, misses=2, maxsize=8, currsize=2)
+
+    def test_independent_cache(self) -> None:
+        """Each memoized type should have its own cache and leave the original type intact."""
+        first = memoize(StrictKanjiYenStringToInt)
+        second = memoize(StrictKanjiYenStringToInt)
+        TypeAdapter(first).validate_python("1円")
+        assert cache_statistics(second).misses == 0
+        assert TypeAdapter(StrictKanjiYenStringToInt).validate_python("1円") == 1
+        assert cache_statistics(first).misses == 1
+
+    @pytest.mark.parametrize("type_", [int, HalfWidthString])
+    # Reason: The argument of pydantic type
+    def test_unsupported_type(self, type_: Any) -> None:  # noqa: ANN401
+        """Type which doesn't convert string to int by IntegerMustBeFromStr should be rejected."""
+        with pytest.raises(TypeError, match="IntegerMustBeFromStr"):
+            memoize(type_)
+
+
+def test_cache_statistics_of_not_memoized_type() -> None:
+    """Statistics of type which is not created by memoize() should be rejected."""
+    with pytest.raises(TypeError, match="memoize"):
+        cache_statistics(StrictKanjiYenStringToInt)
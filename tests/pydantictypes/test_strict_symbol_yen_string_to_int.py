@@ -70,7 +70,7 @@ class TestStrictSymbolYenStringToInt:
     # Reason: Need Any to test various invalid types in parametrized test
     def test_invalid_conversion(self, value: Any) -> None:  # noqa: ANN401
         """Pydantic should raise ValidationError for invalid values."""
-        with pytest.raises((ValidationError, TypeError)):
+        with pytest.raises(ValidationError):
             create(Stub, [value])
 
     @pytest.mark.parametrize(
@@ -1,15 +1,22 @@
 """Tests for string_to_datetime.py ."""
 
+from __future__ import annotations
+
 import datetime
 from typing import Any
+from typing import Iterator
+from typing import cast
 
 import pytest
+from pydantic import TypeAdapter
 from pydantic import ValidationError
 from pydantic.dataclasses import dataclass
 
 from pydantictypes.string_to_datetime import StringNumberOnlyToDateTime
 from pydantictypes.string_to_datetime import StringSlashMonthDayOnlyToDatetime
 from pydantictypes.string_to_datetime import StringSlashToDateTime
+from pydantictypes.string_to_datetime import StringToDateTime
+from pydantictypes.string_to_datetime import compile_fixed_format
 from tests.pydantictypes import create
 
 
@@ -200,3 +207,172 @@ class TestStringSlashMonthDayOnlyToDatetime:
         """Test direct call to parse_date with non-string."""
         with pytest.raises(TypeError, match="string required"):
             StringSlashMonthDayOnlyToDatetime.parse_date(value)
+
+
+class TestCache:
+    """Tests for the cache of parsed datetime."""
+
+    def test_disabled_by_default(self) -> None:
+        """Cache should be disabled unless it is enabled."""
+        assert StringSlashToDateTime.cache_info() is None
+        assert StringNumberOnlyToDateTime.cache_info() is None
+        assert StringSlashMonthDayOnlyToDatetime.cache_info() is None
+
+    @pytest.mark.parametrize(
+        ("type_", "value", "expected"),
+        [
+            (StringSlashToDateTime, "2020/01/02", datetime.datetime(2020, 1, 2)),  # noqa: DTZ001
+            (StringNumberOnlyToDateTime, "20200102", datetime.datetime(2020, 1, 2)),  # noqa: DTZ001
+            (StringSlashMonthDayOnlyToDatetime, "01/02", datetime.datetime(1904, 1, 2)),  # noqa: DTZ001
+        ],
+    )
+    def test_hit_and_miss(self, type_: type[StringToDateTime], value: str, expected: datetime.datetime) -> None:
+        """Repeated value should be returned from the cache."""
+        cached_type = cast("type[StringToDateTime]", type("Cached", (type_,), {}))
+        cached_type.enable_cache(maxsize=2)
+        adapter = TypeAdapter(cached_type)
+        dates = [adapter.validate_python(value), adapter.validate_python(value)]
+        assert dates == [expected, expected]
+        assert dates[0] is dates[1]
+        cache_info = cached_type.cache_info()
+        assert cache_info is not None
+        assert (cache_info.hits, cache_info.misses, cache_info.maxsize, cache_info.currsize) == (1, 1, 2, 1)
+
+    def test_bounded(self) -> None:
+        """Least recently used entry should be discarded when the cache is full."""
+        cached_type = cast("type[StringToDateTime]", type("Cached", (StringSlashToDateTime,), {}))
+        cached_type.enable_cache(maxsize=2)
+        for value in ["2020/01/01", "2020/01/02", "2020/01/01", "2020/01/03", "2020/01/02"]:
+            cached_type.validate_with_cache(value)
+        cache_info = cached_type.cache_info()
+        assert cache_info is not None
+        assert (cache_info.hits, cache_info.misses, cache_info.currsize) == (1, 4, 2)
+
+    def test_per_class(self) -> None:
+        """Cache should belong to the class which enabled it and should be disabled again."""
+        cached_type = cast("type[StringToDateTime]", type("Cached", (StringSlashToDateTime,), {}))
+        cached_type.enable_cache()
+        sub_type = cast("type[StringToDateTime]", type("Sub", (cached_type,), {}))
+        sub_type.validate_with_cache("2020/01/01")
+        assert sub_type.cache_info() is None
+        assert StringSlashToDateTime.cache_info() is None
+        cache_info = cached_type.cache_info()
+        assert cache_info is not None
+        assert cache_info.currsize == 0
+        cached_type.disable_cache()
+        assert cached_type.cache_info() is None
+
+    def test_error_is_not_cached(self) -> None:
+        """Invalid value should raise error every time."""
+        cached_type = cast("type[StringToDateTime]", type("Cached", (StringSlashToDateTime,), {}))
+        cached_type.enable_cache()
+        for _ in range(2):
+            with pytest.raises(ValueError, match="does not match format"):
+                cached_type.validate_with_cache("2020-01-01")
+        cache_info = cached_type.cache_info()
+        assert cache_info is not None
+        assert cache_info.currsize == 0
+
+
+def every_date(start: datetime.date, end: datetime.date, step: int = 1) -> Iterator[datetime.date]:
+    """Yield dates from start to end, both inclusive, by step of days."""
+    date = start
+    while date <= end:
+        yield date
+        if end - date < datetime.timedelta(days=step):
+            return
+        date += datetime.timedelta(days=step)
+
+
+def format_date(format_: str, date: datetime.date) -> str:
+    """Format date with zero-padded year, which strftime doesn't guarantee for years before 1000."""
+    return format_.replace("%Y", f"{date.year:04}").replace("%m", f"{date.month:02}").replace("%d", f"{date.day:02}")
+
+
+def parse_or_error(format_: str, value: str) -> datetime.datetime | str:
+    """Parse value by fixed format parser and strptime as StringToDateTime does, or return the error message."""
+    parser = compile_fixed_format(format_)
+    assert parser is not None
+    parsed = parser.parse(value)
+    return strptime_or_error(format_, value) if parsed is None else parsed
+
+
+def strptime_or_error(format_: str, value: str) -> datetime.datetime | str:
+    """Parse value by strptime, or return the error message."""
+    try:
+        # Reason: Time is not used in this process.
+        return datetime.datetime.strptime(value, format_)  # noqa: DTZ007
+    except ValueError as error:
+        return str(error)
+
+
+class TestFixedFormatParser:
+    """Tests for fixed format parser compared with strptime."""
+
+    @pytest.mark.parametrize("format_", ["%Y/%m/%d", "%Y%m%d", "%d-%m-%Y", "%Y年%m月%d日"])
+    @pytest.mark.parametrize(
+        ("start", "end", "step"),
+        [
+            # Sampled dates across the full range of datetime.
+            (datetime.date.min, datetime.date.max, 97),
+            # Every date around the boundaries and recent years including leap years.
+            (datetime.date(1, 1, 1), datetime.date(1, 12, 31), 1),
+            (datetime.date(1899, 1, 1), datetime.date(1904, 12, 31), 1),
+            (datetime.date(1999, 1, 1), datetime.date(2001, 12, 31), 1),
+            (datetime.date(2024, 1, 1), datetime.date(2028, 12, 31), 1),
+            (datetime.date(9999, 1, 1), datetime.date(9999, 12, 31), 1),
+        ],
+    )
+    def test_same_as_strptime_for_valid_dates(
+        self,
+        format_: str,
+        start: datetime.date,
+        end: datetime.date,
+        step: int,
+    ) -> None:
+        """Every date should be parsed by slicing into the same datetime as strptime."""
+        parser = compile_fixed_format(format_)
+        assert parser is not None
+        for date in every_date(start, end, step):
+            value = format_date(format_, date)
+            parsed = parser.parse(value)
+            assert parsed is not None, value
+            assert parsed == strptime_or_error(format_, value), value
+
+    @pytest.mark.parametrize(
+        ("format_", "value"),
+        [
+            # Invalid dates raise the same error as strptime.
+            ("%Y/%m/%d", "0000/01/01"),
+            ("%Y/%m/%d", "2020/00/01"),
+            ("%Y/%m/%d", "2020/13/01"),
+            ("%Y/%m/%d", "2020/01/00"),
+            ("%Y/%m/%d", "2020/01/32"),
+            ("%Y/%m/%d", "2021/02/29"),
+            ("%Y/%m/%d", "2020/04/31"),
+            ("%Y%m%d", "20201301"),
+            ("%Y%m%d", "20210229"),
+            # Non-conforming strings are parsed by strptime.
+            ("%Y/%m/%d", "2020/1/1"),
+            ("%Y/%m/%d", "2020/01/ 1"),
+            ("%Y/%m/%d", "2020-01-01"),
+            ("%Y/%m/%d", "２０２０/０１/０１"),  # noqa: RUF001
+            ("%Y/%m/%d", "2020/01/01 "),
+            ("%Y/%m/%d", "+020/01/01"),
+            ("%Y/%m/%d", "2020/+1/01"),
+            ("%Y/%m/%d", "2020/01/01/01"),
+            ("%Y%m%d", "2020011"),
+            ("%Y%m%d", "202001011"),
+            ("%Y%m%d", "2020 101"),
+            ("%Y年%m月%d日", "2020年01月01日"),
+            ("%Y年%m月%d日", "2020年1月1日"),
+        ],
+    )
+    def test_same_as_strptime(self, format_: str, value: str) -> None:
+        """Result or error message should be the same as strptime."""
+        assert parse_or_error(format_, value) == strptime_or_error(format_, value)
+
+    @pytest.mark.parametrize("format_", ["%Y/%m", "%Y/%m/%d %H", "%y/%m/%d", "%Y/%m/%d/%d", "%Y1%m%d", "%Y/%m/%d%%"])
+    def test_unsupported_format(self, format_: str) -> None:
+        """Format which includes other than %Y, %m and %d once for each should not be compiled."""
+        assert compile_fixed_format(format_) is None
@@ -87,7 +87,7 @@ class Test:
     # Reason: Need Any to test various invalid types in parametrized test
     def test_error(self, value: Any) -> None:  # noqa: ANN401
         """Only '1', '0', or '' should be accepted."""
-        with pytest.raises((ValidationError, TypeError, ValueError)):
+        with pytest.raises(ValidationError):
             create(Stub, [value])
 
 
@@ -3,15 +3,19 @@
 from __future__ import annotations
 
 import datetime
+import pickle
+import sys
 from typing import TYPE_CHECKING
 from typing import Any
 
 import pytest
 from pydantic.dataclasses import dataclass
+from pydantic_core import PydanticCustomError
 from pydantic_core import ValidationError
 
-from pydantictypes.string_to_optional_str import StringToOptionalStr  # noqa: TC001
-from pydantictypes.string_to_optional_str import constringtooptionalstr  # noqa: TC001
+from pydantictypes.string_to_optional_str import StringToOptionalStr
+from pydantictypes.string_to_optional_str import StringToOptionalStrValidator
+from pydantictypes.string_to_optional_str import constringtooptionalstr
 from tests.pydantictypes import BaseTestImportFallback
 from tests.pydantictypes import create
 
@@ -55,7 +59,7 @@ class Test:
     # Reason: Need Any to test various invalid types in parametrized test
     def test_error(self, value: Any) -> None:  # noqa: ANN401
         """Only string should be accepted."""
-        with pytest.raises((ValidationError, TypeError)):
+        with pytest.raises(ValidationError):
             create(Stub, [value])
 
 
@@ -118,6 +122,16 @@ class TestConstraints:
         stub = create(StubCurtail, ["hello world"])
         assert stub.value == "hello"
 
+    def test_negative_curtail_length_with_to_lower(self) -> None:
+        """Negative curtail_length should cut characters from the end of lowered string."""
+
+        @dataclass
+        class StubCurtail:
+            value: constringtooptionalstr(to_lower=True, curtail_length=-2)  # type: ignore[valid-type]
+
+        stub = create(StubCurtail, ["ABCDEF"])
+        assert stub.value == "abcd"
+
     def test_regex(self) -> None:
         """Test regex constraint."""
 
@@ -163,6 +177,68 @@ class TestConstraints:
         assert stub.value is None
 
 
+def transform(value: str, *, strip_whitespace: bool, to_lower: bool, curtail_length: int | None) -> str:
+    """Transform string in the order of strip, lower and curtail as reference implementation."""
+    if strip_whitespace:
+        value = value.strip()
+    if to_lower:
+        value = value.lower()
+    if curtail_length is not None:
+        value = value[:curtail_length]
+    return value
+
+
+class TestStringToOptionalStrValidator:
+    """Tests for StringToOptionalStrValidator."""
+
+    @pytest.mark.parametrize("strip_whitespace", [False, True])
+    @pytest.mark.parametrize("to_lower", [False, True])
+    @pytest.mark.parametrize("curtail_length", [None, 0, 2, 10, -2])
+    @pytest.mark.parametrize("value", ["abc", " AbC ", "ABCDEF", "İstanbul", "ǅemal", " ＡＢＣ ", "ß"])  # noqa: RUF001
+    def test_same_as_transformations_in_order(
+        self,
+        *,
+        strip_whitespace: bool,
+        to_lower: bool,
+        curtail_length: int | None,
+        value: str,
+    ) -> None:
+        """Compiled steps should return the same string as transformations in order."""
+        validator = StringToOptionalStrValidator(
+            strip_whitespace=strip_whitespace,
+            to_lower=to_lower,
+            curtail_length=curtail_length,
+        )
+        expected = transform(
+            value,
+            strip_whitespace=strip_whitespace,
+            to_lower=to_lower,
+            curtail_length=curtail_length,
+        )
+        assert validator.validate(value) == expected
+
+    def test_no_copy(self) -> None:
+        """String which steps don't change should be returned as is."""
+        value = "abcdef"
+        validator = StringToOptionalStrValidator(strip_whitespace=True, to_lower=True, curtail_length=10)
+        assert validator.validate(value) is value
+
+    def test_lowercase_string_is_lower(self) -> None:
+        """Lowering should be skipped for lowercase string since lower() doesn't change it."""
+        characters = [chr(code_point) + "a" for code_point in range(sys.maxunicode + 1)]
+        assert [value for value in characters if value.islower() and value.lower() != value] == []
+
+    def test_pickle(self) -> None:
+        """Validator should be sent into other processes with its transformations and constraints."""
+        validator = StringToOptionalStrValidator(to_lower=True, max_length=3, regex=r"^[a-z]+$")
+        validator = pickle.loads(pickle.dumps(validator))  # noqa: S301
+        assert validator.validate("ABC") == "abc"
+        with pytest.raises(PydanticCustomError, match="at most 3"):
+            validator.validate("abcd")
+        with pytest.raises(PydanticCustomError, match="does not match pattern"):
+            validator.validate("1")
+
+
 class TestImportFallback(BaseTestImportFallback):
     """Tests for import fallback scenarios."""
 
@@ -11,6 +11,7 @@ import pytest
 from pydantic.dataclasses import dataclass
 from pydantic_core import ValidationError
 
+from pydantictypes.string_with_comma_to_int import NativeStrictStringWithCommaToInt
 from pydantictypes.string_with_comma_to_int import StrictStringWithCommaToInt
 from pydantictypes.string_with_comma_to_int import constringtoint
 from tests.pydantictypes import BaseTestConstraintFunction
@@ -70,10 +71,70 @@ class Test:  # pylint: disable=duplicate-code
     # Reason: Need Any to test various invalid types in parametrized test
     def test_error(self, value: Any) -> None:  # noqa: ANN401
         """Pydantic should raise ValidationError."""
-        with pytest.raises((ValidationError, TypeError)):
+        with pytest.raises(ValidationError):
             create(Stub, [value])
 
 
+@dataclass
+class StubNative:
+    int_: NativeStrictStringWithCommaToInt
+
+
+class TestNative:
+    """Tests for NativeStrictStringWithCommaToInt."""
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ("1", 1),
+            ("-1", -1),
+            ("007", 7),
+            ("1,000", 1000),
+            ("1,000,000", 1000000),
+            ("-1,000", -1000),
+            ("99999999999999999999", 99999999999999999999),
+        ],
+    )
+    def test(self, value: str, expected: int) -> None:
+        """Property should be converted to int."""
+        stub = create(StubNative, [value])
+        assert isinstance(stub.int_, int)
+        assert stub.int_ == expected
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "1.0",
+            "1,000.0",
+            "1,000,000 1,000,000",
+            "1,000,000円",
+            "1円",
+            "¥1",
+            "$1",
+            "",
+            None,
+            datetime.date(2020, 1, 1),
+            1,
+        ],
+    )
+    # Reason: Need Any to test various invalid types in parametrized test
+    def test_error(self, value: Any) -> None:  # noqa: ANN401
+        """Pydantic should raise ValidationError even if value is not string."""
+        with pytest.raises(ValidationError):
+            create(StubNative, [value])
+
+    @pytest.mark.parametrize("value", ["1", " 1", "1 ", "+1", "1_000", "1,000", ",1,", "１,０００", "1.0", "1e3"])  # noqa: RUF001
+    def test_same_as_callback(self, value: str) -> None:
+        """Native schema should accept and reject the same strings as StrictStringWithCommaToInt."""
+        try:
+            expected = create(Stub, [value]).int_
+        except ValidationError:
+            with pytest.raises(ValidationError):
+                create(StubNative, [value])
+        else:
+            assert create(StubNative, [value]).int_ == expected
+
+
 class TestConstraintFunction(BaseTestConstraintFunction):
     def get_constraint_function(self) -> Callable[..., Any]:
         return constringtoint
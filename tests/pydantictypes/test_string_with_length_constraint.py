@@ -2,17 +2,25 @@
 
 from __future__ import annotations
 
+import pickle
 from typing import TYPE_CHECKING
+from typing import Any
 
 import pytest
+from pydantic import BaseModel
+from pydantic import ConfigDict
+from pydantic import TypeAdapter
 from pydantic.dataclasses import dataclass
+from pydantic_core import PydanticCustomError
 from pydantic_core import ValidationError
 
-# Reason: These are used in dataclass field annotations which require runtime availability
-from pydantictypes.string_with_length_constraint import ConstrainedOptionalStringWithLength  # noqa: TC001
-from pydantictypes.string_with_length_constraint import ConstrainedStringWithLength  # noqa: TC001
-from pydantictypes.string_with_length_constraint import constrained_optional_string  # noqa: TC001
-from pydantictypes.string_with_length_constraint import constrained_string  # noqa: TC001
+from pydantictypes.string_with_length_constraint import ConstrainedOptionalStringWithLength
+from pydantictypes.string_with_length_constraint import ConstrainedStringWithLength
+from pydantictypes.string_with_length_constraint import OptionalStringLengthValidator
+from pydantictypes.string_with_length_constraint import StringLengthValidator
+from pydantictypes.string_with_length_constraint import constrained_optional_string
+from pydantictypes.string_with_length_constraint import constrained_string
+from pydantictypes.string_with_length_constraint import native_constrained_string
 from tests.pydantictypes import BaseTestImportFallback
 from tests.pydantictypes import create
 
@@ -30,6 +38,15 @@ class StubOptionalString:
     value: ConstrainedOptionalStringWithLength
 
 
+# Reason: The argument of pydantic type
+def validate(adapter: TypeAdapter[Any], value: str) -> Any:  # noqa: ANN401
+    """Return the validated value or the errors."""
+    try:
+        return adapter.validate_python(value)
+    except ValidationError as error:
+        return error.errors()
+
+
 class TestConstrainedStringWithLength:
     """Tests for ConstrainedStringWithLength."""
 
@@ -60,8 +77,8 @@ class TestConstrainedStringWithLength:
         ],
     )
     def test_type_error(self, value: str) -> None:
-        """Non-string values should raise TypeError."""
-        with pytest.raises((ValidationError, TypeError)):
+        """Non-string values should raise ValidationError."""
+        with pytest.raises(ValidationError):
             create(StubString, [value])
 
 
@@ -92,8 +109,8 @@ class TestConstrainedOptionalStringWithLength:
         ],
     )
     def test_type_error(self, value: str) -> None:
-        """Non-string values should raise TypeError."""
-        with pytest.raises((ValidationError, TypeError)):
+        """Non-string values should raise ValidationError."""
+        with pytest.raises(ValidationError):
             create(StubOptionalString, [value])
 
     def test_none_value(self) -> None:
@@ -175,6 +192,21 @@ class TestConstrainedStringFunction:
         with pytest.raises(ValidationError):
             create(Stub, ["abcdef"])
 
+    @pytest.mark.parametrize(
+        ("constraints", "value", "expected_type", "expected_message"),
+        [
+            ({"equal_to": 4}, "abc", "string_length_equal_to", "String length must be equal to 4"),
+            ({"min_length": 2}, "a", "string_length_too_short", "String length must be at least 2"),
+            ({"max_length": 5}, "abcdef", "string_length_too_long", "String length must be at most 5"),
+        ],
+    )
+    def test_error(self, constraints: dict[str, int], value: str, expected_type: str, expected_message: str) -> None:
+        """Error should have the type, the message and the context of the violated constraint."""
+        with pytest.raises(ValidationError) as exc_info:
+            TypeAdapter(constrained_string(**constraints)).validate_python(value)
+        (error,) = exc_info.value.errors()
+        assert (error["type"], error["msg"], error.get("ctx")) == (expected_type, expected_message, constraints)
+
 
 class TestConstrainedOptionalStringFunction:
     """Tests for constrained_optional_string function."""
@@ -247,6 +279,82 @@ class TestConstrainedOptionalStringFunction:
             create(Stub, ["abcdef"])
 
 
+class TestStringLengthValidator:
+    """Tests for StringLengthValidator."""
+
+    def test_no_constraint_compiles_to_none(self) -> None:
+        """No checker should be compiled when there is no constraint."""
+        assert StringLengthValidator().check_length is None
+
+    @pytest.mark.parametrize(
+        ("constraints", "value", "expected_type"),
+        [
+            ({"min_length": 3, "max_length": 6, "equal_to": 5}, "ab", "string_length_equal_to"),
+            ({"min_length": 3, "max_length": 6}, "ab", "string_length_too_short"),
+            ({"min_length": 3, "max_length": 6}, "abcdefg", "string_length_too_long"),
+            ({"min_length": 6, "max_length": 3}, "abcd", "string_length_too_short"),
+        ],
+    )
+    def test_first_violation_is_reported(self, constraints: dict[str, int], value: str, expected_type: str) -> None:
+        """Constraints should be reported in the order of equal_to, min_length and max_length."""
+        with pytest.raises(PydanticCustomError) as exc_info:
+            StringLengthValidator(**constraints).validate(value)
+        assert exc_info.value.type == expected_type
+
+    def test_pickle(self) -> None:
+        """Validator should be sent into other processes with its constraints."""
+        validator = pickle.loads(pickle.dumps(OptionalStringLengthValidator(min_length=2, max_length=3)))  # noqa: S301
+        assert validator.validate("abc") == "abc"
+        assert validator.validate("") is None
+        with pytest.raises(PydanticCustomError, match="at most 3"):
+            validator.validate("abcd")
+
+
+class TestNativeConstrainedString:
+    """Tests for native_constrained_string function."""
+
+    @pytest.mark.parametrize(
+        "constraints",
+        [
+            {},
+            {"min_length": 2},
+            {"max_length": 3},
+            {"equal_to": 2},
+            {"min_length": 1, "max_length": 3},
+            {"min_length": 3, "max_length": 1},
+            {"min_length": 1, "max_length": 3, "equal_to": 2},
+        ],
+    )
+    @pytest.mark.parametrize("value", ["", "a", "ab", "abc", "abcd", " ab ", "ｱｲ", "あいう"])
+    def test_same_as_constrained_string(self, constraints: dict[str, int], value: str) -> None:
+        """Valid strings and errors should be the same as constrained_string."""
+        expected = validate(TypeAdapter(constrained_string(**constraints)), value)
+        assert validate(TypeAdapter(native_constrained_string(**constraints)), value) == expected
+
+    @pytest.mark.parametrize("value", [None, 1, b"ab", ["ab"]])
+    # Reason: Need Any to test various non-string types
+    def test_non_string(self, value: Any) -> None:  # noqa: ANN401
+        """Non-string value should raise ValidationError whose message doesn't include the value."""
+        with pytest.raises(ValidationError) as exc_info:
+            TypeAdapter(native_constrained_string(max_length=3)).validate_python(value)
+        (error,) = exc_info.value.errors()
+        assert (error["type"], error["msg"], error["input"]) == ("string_required", "String required", value)
+
+    def test_model_config(self) -> None:
+        """String settings of the model config should be applied after the constraints."""
+
+        class Model(BaseModel):
+            model_config = ConfigDict(str_strip_whitespace=True, str_to_upper=True, str_max_length=3)
+            value: native_constrained_string(max_length=4)  # type: ignore[valid-type]
+            expected: constrained_string(max_length=4)  # type: ignore[valid-type]
+
+        model = Model(value=" ab ", expected=" ab ")
+        assert model.value == model.expected == "AB"
+        with pytest.raises(ValidationError) as exc_info:
+            Model(value="abcd", expected="abcd")
+        assert [error["type"] for error in exc_info.value.errors()] == ["string_too_long", "string_too_long"]
+
+
 class TestImportFallback(BaseTestImportFallback):
     """Tests for import fallback scenarios."""
 
@@ -0,0 +1,219 @@
+"""Tests for vectorized.py ."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from pydantic import TypeAdapter
+from pydantic import ValidationError
+
+from pydantictypes.half_width_string import HalfWidthString
+from pydantictypes.half_width_string import OptionalHalfWidthString
+from pydantictypes.string_with_comma_to_int import StrictStringWithCommaToInt
+from pydantictypes.string_with_comma_to_optional_int import StrictStringWithCommaToOptionalInt
+
+np = pytest.importorskip("numpy")
+
+# Reason: To skip tests when NumPy is not installed. pylint: disable-next=wrong-import-position
+from pydantictypes.vectorized import check_half_width  # noqa: E402
+from pydantictypes.vectorized import check_optional_half_width  # noqa: E402
+from pydantictypes.vectorized import convert_string_with_comma_to_int64  # noqa: E402
+from pydantictypes.vectorized import convert_string_with_comma_to_optional_int64  # noqa: E402
+
+VALUES = [
+    "1",
+    "1,000",
+    "1,000,000",
+    "-1,000",
+    "+1",
+    " 1 ",
+    "007",
+    "1_000",
+    "１,０００",  # noqa: RUF001
+    "999,999,999,999,999,999",
+    "9,223,372,036,854,775,807",
+    "9,223,372,036,854,775,808",
+    "-9,223,372,036,854,775,808",
+    "1.0",
+    "1,000円",
+    "--1",
+    "+-1",
+    "- 1",
+    "²",
+    "$1",
+    "1\x002",
+    "12\x00",
+    "1,000\x00\x00",
+    "\x00",
+    "",
+]
+
+HALF_WIDTH_VALUES = [
+    "abc",
+    "SKU-0001",
+    "ｱｲｳ",
+    "ﾃｽﾄ ｺｰﾄﾞ",
+    "Ａbc",  # noqa: RUF001
+    "abＡ",  # noqa: RUF001
+    "あいう",
+    "ab漢字",
+    "¡",
+    "\xa0",
+    "Ω",
+    "a\x00あ",
+    "a\x00",
+    "\x00",
+    "a\u3000b",
+    "\U0001d400",
+    "a\U00020bb7",
+    "\U0001d400\U0001f600",
+    "",
+]
+
+
+# Reason: The argument of pydantic type
+def first_not_half_width(type_: Any, value: Any) -> tuple[bool, int]:  # noqa: ANN401
+    """Return whether type accepts value, and the index in the context of error."""
+    try:
+        TypeAdapter(type_).validate_python(value)
+    except ValidationError as error:
+        return False, error.errors()[0].get("ctx", {}).get("index", -1)
+    except TypeError:
+        return False, -1
+    return True, -1
+
+
+# Reason: The argument of pydantic type
+def validate(type_: Any, value: Any) -> tuple[bool, Any]:  # noqa: ANN401
+    try:
+        return True, TypeAdapter(type_).validate_python(value)
+    except (ValidationError, TypeError):
+        return False, None
+
+
+class TestConvertStringWithCommaToInt64:
+    """Tests for convert_string_with_comma_to_int64."""
+
+    @pytest.mark.parametrize("dtype", [str, object])
+    def test_same_as_type(self, dtype: type) -> None:
+        """Valid elements and values should be the same as StrictStringWithCommaToInt within int64."""
+        # Unicode array drops trailing NUL, so that elements of object array are compared as they are.
+        array = np.array(VALUES, dtype=dtype)
+        result = convert_string_with_comma_to_int64(array)
+        assert result.values.dtype == np.int64
+        for index, value in enumerate(array.tolist()):
+            is_valid, expected = validate(StrictStringWithCommaToInt, value)
+            is_valid = is_valid and np.iinfo(np.int64).min <= expected <= np.iinfo(np.int64).max
+            assert result.valid[index] == is_valid, value
+            assert result.values[index] == (expected if is_valid else 0), value
+        assert not result.null.any()
+
+    def test_non_string(self) -> None:
+        """Non-string elements should be invalid."""
+        result = convert_string_with_comma_to_int64(["1", None, 1, 1.0])
+        assert result.valid.tolist() == [True, False, False, False]
+        assert result.invalid.tolist() == [False, True, True, True]
+
+    def test_non_contiguous(self) -> None:
+        """Strided view should be converted."""
+        result = convert_string_with_comma_to_int64(np.array(["1,000", "x", "-2", "y"])[::2])
+        assert result.values.tolist() == [1000, -2]
+        assert result.valid.tolist() == [True, True]
+
+    def test_empty(self) -> None:
+        """Empty array should be converted into empty array."""
+        result = convert_string_with_comma_to_int64([])
+        assert result.values.shape == (0,)
+
+
+class TestConvertStringWithCommaToOptionalInt64:
+    """Tests for convert_string_with_comma_to_optional_int64."""
+
+    def test_same_as_type(self) -> None:
+        """Valid elements and values should be the same as StrictStringWithCommaToOptionalInt within int64."""
+        values = [*VALUES, None]
+        result = convert_string_with_comma_to_optional_int64(np.array(values, dtype=object))
+        for index, value in enumerate(values):
+            is_valid, expected = validate(StrictStringWithCommaToOptionalInt, value)
+            if expected is None:
+                assert result.null[index] == is_valid, value
+                assert not result.valid[index], value
+                continue
+            is_valid = is_valid and np.iinfo(np.int64).min <= expected <= np.iinfo(np.int64).max
+            assert result.valid[index] == is_valid, value
+            assert result.values[index] == (expected if is_valid else 0), value
+
+    def test_null(self) -> None:
+        """None and empty string should be masked as null and should not be invalid."""
+        result = convert_string_with_comma_to_optional_int64(["1,000", "", None, "a"])
+        assert result.values.tolist() == [1000, 0, 0, 0]
+        assert result.valid.tolist() == [True, False, False, False]
+        assert result.null.tolist() == [False, True, True, False]
+        assert result.invalid.tolist() == [False, False, False, True]
+
+    def test_trailing_nul(self) -> None:
+        """String which ends with NUL should be rejected as same as int(), not be masked as null."""
+        result = convert_string_with_comma_to_optional_int64(["12\x00", "\x00", "12"])
+        assert result.valid.tolist() == [False, False, True]
+        assert result.null.tolist() == [False, False, False]
+        assert result.invalid.tolist() == [True, True, False]
+
+
+class TestCheckHalfWidth:
+    """Tests for check_half_width."""
+
+    @pytest.mark.parametrize("dtype", [str, object])
+    def test_same_as_type(self, dtype: type) -> None:
+        """Valid elements and the first index should be the same as HalfWidthString."""
+        array = np.array(HALF_WIDTH_VALUES, dtype=dtype)
+        result = check_half_width(array)
+        assert result.first_not_half_width.dtype == np.int64
+        for index, value in enumerate(array.tolist()):
+            assert (result.valid[index], result.first_not_half_width[index]) == first_not_half_width(
+                HalfWidthString,
+                value,
+            ), value
+        assert not result.null.any()
+
+    def test_non_string(self) -> None:
+        """Non-string elements should be invalid without index."""
+        result = check_half_width(["a", None, 1, b"a", "あ"])
+        assert result.valid.tolist() == [True, False, False, False, False]
+        assert result.invalid.tolist() == [False, True, True, True, True]
+        assert result.first_not_half_width.tolist() == [-1, -1, -1, -1, 0]
+
+    def test_ascii(self) -> None:
+        """Array of only ASCII strings should be valid."""
+        result = check_half_width(np.array(["abc", "", "SKU-0001"])[::2])
+        assert result.valid.tolist() == [True, True]
+        assert result.first_not_half_width.tolist() == [-1, -1]
+
+    def test_empty(self) -> None:
+        """Empty array should be checked into empty array."""
+        result = check_half_width([])
+        assert result.valid.shape == (0,)
+        assert result.first_not_half_width.shape == (0,)
+
+
+class TestCheckOptionalHalfWidth:
+    """Tests for check_optional_half_width."""
+
+    def test_same_as_type(self) -> None:
+        """Valid elements, null elements and the first index should be the same as OptionalHalfWidthString."""
+        values = [*HALF_WIDTH_VALUES, None, 1]
+        result = check_optional_half_width(np.array(values, dtype=object))
+        for index, value in enumerate(values):
+            is_valid, first = first_not_half_width(OptionalHalfWidthString, value)
+            is_null = is_valid and TypeAdapter(OptionalHalfWidthString).validate_python(value) is None
+            assert result.null[index] == is_null, value
+            assert result.valid[index] == (is_valid and not is_null), value
+            assert result.first_not_half_width[index] == first, value
+
+    def test_null(self) -> None:
+        """None and empty string should be masked as null and should not be invalid."""
+        result = check_optional_half_width(["ab", "", None, "ａ"])  # noqa: RUF001
+        assert result.valid.tolist() == [True, False, False, False]
+        assert result.null.tolist() == [False, True, True, False]
+        assert result.invalid.tolist() == [False, False, False, True]
+        assert result.first_not_half_width.tolist() == [-1, -1, -1, 0]
@@ -0,0 +1,78 @@
+"""Tests for _yen_parser.py ."""
+
+from __future__ import annotations
+
+import re
+
+import pytest
+from pydantic_core import PydanticCustomError
+
+from pydantictypes._yen_parser import KANJI_YEN_PARSER
+from pydantictypes._yen_parser import SYMBOL_YEN_PARSER
+from pydantictypes._yen_parser import YenParser
+
+
+def search(pattern: str, yen_string: str) -> int:
+    """Convert yen string by `re.search()` as reference implementation."""
+    if "." in yen_string:
+        msg = f"Decimal is unsupported. Yen string = {yen_string}"
+        raise ValueError(msg)
+    matches = re.search(pattern, yen_string)
+    if matches is None:
+        msg = f"Invalid yen string. Yen string = {yen_string}"
+        raise ValueError(msg)
+    return int(matches.group(1).replace(",", ""))
+
+
+class TestYenParser:
+    """Tests for YenParser."""
+
+    @pytest.mark.parametrize(
+        ("parser", "pattern"),
+        [(KANJI_YEN_PARSER, r"([\d,]+)\s*円"), (SYMBOL_YEN_PARSER, r"\\([\d,]+)")],
+    )
+    @pytest.mark.parametrize(
+        "yen_string",
+        [
+            "1円",
+            "1,000円",
+            "1,000 円",
+            "1,000\n円",
+            "１,０００円",  # noqa: RUF001
+            "お引出し 3,000円 残高 10,000円",
+            "1 2円",
+            "1円.",
+            ".1円",
+            "1.0円",
+            ",円",
+            "円",
+            "",
+            "\\1",
+            "\\1,000",
+            "\\ 1",
+            "\\1\\2",
+            "a\\1,000,000b",
+            "\\1.0",
+            "\\,",
+        ],
+    )
+    def test_same_as_search(self, parser: YenParser, pattern: str, yen_string: str) -> None:
+        """Parser should return same value or raise same error as `re.search()`."""
+        try:
+            expected = search(pattern, yen_string)
+        except ValueError as error:
+            with pytest.raises(ValueError, match=re.escape(str(error))):
+                parser.parse(yen_string)
+        else:
+            assert parser.parse(yen_string) == expected
+
+    @pytest.mark.parametrize(
+        ("yen_string", "expected_type"),
+        [("1.0円", "yen_string_decimal"), ("円", "yen_string")],
+    )
+    def test_error(self, yen_string: str, expected_type: str) -> None:
+        """Error should have the type and the context to format the message."""
+        with pytest.raises(PydanticCustomError) as exc_info:
+            KANJI_YEN_PARSER.parse(yen_string)
+        assert exc_info.value.type == expected_type
+        assert exc_info.value.context == {"yen_string": yen_string}
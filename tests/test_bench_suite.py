@@ -0,0 +1,47 @@
+"""Tests for benchmark suite."""
+
+from __future__ import annotations
+
+import pydantictypes
+from benchmarks.bench_suite import CASES
+from benchmarks.bench_suite import NOT_MEASURED
+from benchmarks.bench_suite import Measurement
+from benchmarks.bench_suite import Sample
+from benchmarks.bench_suite import check_coverage
+from benchmarks.bench_suite import compare
+from benchmarks.bench_suite import measure_case
+from benchmarks.bench_suite import summarize
+
+
+def test_every_exported_name_is_covered() -> None:
+    """Every name in `__all__` should be measured or listed with the reason why it isn't."""
+    check_coverage()
+    assert set(CASES) | set(NOT_MEASURED) == set(pydantictypes.__all__)
+
+
+def test_measure_case() -> None:
+    """Each path should be measured via TypeAdapter and BaseModel."""
+    results = measure_case("StrictStringWithCommaToOptionalInt", CASES["StrictStringWithCommaToOptionalInt"], 1)
+    assert sorted(results) == sorted(
+        f"StrictStringWithCommaToOptionalInt / {path} / {via}"
+        for path in ("success", "failure", "empty")
+        for via in ("TypeAdapter", "BaseModel")
+    )
+
+
+def test_summarize() -> None:
+    """Measurement should be the median of runs with the range of relative costs divided by the median."""
+    measurement = summarize([Sample(100.0, 1.0), Sample(300.0, 3.0), Sample(200.0, 2.0)])
+    assert measurement == Measurement(200.0, 2.0, 1.0)
+
+
+def test_compare() -> None:
+    """Result slower than baseline beyond threshold and noise should be reported as regression."""
+    results = {
+        "a": Measurement(100.0, 1.0, 0.1),
+        "b": Measurement(100.0, 2.0, 0.1),
+        "c": Measurement(100.0, 1.0, 0.1),
+        "d": Measurement(100.0, 2.0, 0.6),
+    }
+    baseline = {key: {"relative": 1.0, "spread": 0.5} for key in ("a", "b", "d")}
+    assert compare(results, baseline) == ["b"]
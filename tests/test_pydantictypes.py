@@ -2,11 +2,108 @@
 
 from __future__ import annotations
 
+import importlib
+import pickle
+import subprocess
+import sys
+from dataclasses import dataclass
 from typing import Any
 
+import pytest
+
+import pydantictypes
+
 
 def test_content(response: dict[Any, Any] | None) -> None:
     """Sample pytest test function with the pytest fixture as an argument."""
     # from bs4 import BeautifulSoup  # noqa: ERA001
     # assert 'GitHub' in BeautifulSoup(response.content).title.string  # noqa: ERA001
     del response
+
+
+@dataclass
+class ImportTime:
+    """Modules imported by statement and cumulative import time reported by `-X importtime`."""
+
+    modules: set[str]
+    cumulative_microseconds: dict[str, int]
+
+
+def import_time(statement: str) -> ImportTime:
+    """Run statement in new interpreter with `-X importtime`."""
+    completed = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", f"{statement}; import sys; print(*sys.modules)"],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    cumulative_microseconds = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line[len("import time:") :].split("|")
+        cumulative_microseconds[module.strip()] = int(cumulative)
+    return ImportTime(set(completed.stdout.split()), cumulative_microseconds)
+
+
+class TestLazyImport:
+    """Tests for lazy import of the package."""
+
+    def test_all(self) -> None:
+        """Package should export the names exported by each module."""
+        expected = set()
+        for module_name in set(pydantictypes._MODULE_BY_NAME.values()):  # noqa: SLF001
+            expected |= set(importlib.import_module(f"pydantictypes.{module_name}").__all__)
+        assert set(pydantictypes.__all__) == expected
+        assert all(getattr(pydantictypes, name) is not None for name in pydantictypes.__all__)
+
+    @pytest.mark.parametrize("name", pydantictypes.__all__)
+    def test_pickle(self, name: str) -> None:
+        """Exported names should be picklable to send schemas into worker processes, also when compiled."""
+        # Other tests reimport modules, which leaves the previous objects cached in the package.
+        module = importlib.import_module(f"pydantictypes.{pydantictypes._MODULE_BY_NAME[name]}")  # noqa: SLF001
+        value = getattr(module, name)
+        assert type(pickle.loads(pickle.dumps(value))) is type(value)  # noqa: S301
+
+    def test_dir(self) -> None:
+        """Names should be listed before access."""
+        assert set(pydantictypes.__all__) <= set(dir(pydantictypes))
+
+    def test_attribute_error(self) -> None:
+        """Unknown name should raise AttributeError."""
+        with pytest.raises(AttributeError, match="has no attribute 'Unknown'"):
+            _ = pydantictypes.Unknown
+
+    @pytest.mark.slow
+    def test_submodule(self) -> None:
+        """Submodule should be accessible as attribute of the package without importing it."""
+        modules = import_time(
+            "import pydantictypes; pydantictypes.string_to_datetime.StringSlashToDateTime; pydantictypes.utility.Utility",
+        ).modules
+        assert {"pydantictypes.string_to_datetime", "pydantictypes.utility"} <= modules
+
+    @pytest.mark.slow
+    def test_import_package(self) -> None:
+        """Importing package should import neither pydantic nor any type module."""
+        result = import_time("import pydantictypes")
+        assert "pydantictypes" in result.cumulative_microseconds
+        assert "pydantic" not in result.modules
+        assert not [module for module in result.modules if module.startswith(("pydantic.", "pydantictypes."))]
+
+    @pytest.mark.slow
+    @pytest.mark.parametrize(
+        "name",
+        [
+            "HalfWidthString",
+            "StrictKanjiYenStringToInt",
+            "StrictStringWithCommaToInt",
+            "StrictSymbolYenStringToInt",
+            "StringSlashToDateTime",
+        ],
+    )
+    def test_import_type_without_pydantic_v1(self, name: str) -> None:
+        """Accessing type should import only its module and should not import pydantic.v1."""
+        modules = import_time(f"from pydantictypes import {name}").modules
+        type_modules = {f"pydantictypes.{module}" for module in pydantictypes._MODULE_BY_NAME.values()}  # noqa: SLF001
+        assert type_modules.intersection(modules) == {f"pydantictypes.{pydantictypes._MODULE_BY_NAME[name]}"}  # noqa: SLF001
+        assert "pydantic.v1" not in modules
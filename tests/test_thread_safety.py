@@ -0,0 +1,74 @@
+"""Tests for validation of shared types from many threads at once."""
+
+from __future__ import annotations
+
+import threading
+from typing import Any
+
+from pydantic import BaseModel
+from pydantic import ValidationError
+
+from pydantictypes import HalfWidthString
+from pydantictypes import StrictKanjiYenStringToInt
+from pydantictypes import StrictStringWithCommaToOptionalInt
+from pydantictypes import StringSlashToDateTime
+from pydantictypes import StringToOptionalStr
+from pydantictypes import constrained_string
+from pydantictypes import constringwithcommatooptionalint
+from pydantictypes import memoize
+
+NUMBER_OF_THREADS = 8
+
+
+class Statement(BaseModel):
+    date: StringSlashToDateTime
+    shop: HalfWidthString
+    memo: StringToOptionalStr
+    code: constrained_string(max_length=4)  # type: ignore[valid-type]
+    amount: StrictKanjiYenStringToInt
+    memoized_amount: memoize(StrictKanjiYenStringToInt, maxsize=8)  # type: ignore[valid-type]
+    balance: StrictStringWithCommaToOptionalInt
+    points: constringwithcommatooptionalint(ge=0, multiple_of=10)  # type: ignore[valid-type]
+
+
+def row(index: int) -> dict[str, str]:
+    return {
+        "date": f"2020/01/{index % 40 + 1:02}",
+        "shop": "ｺﾝﾋﾞﾆ" if index % 7 else "コンビニ",
+        "memo": "" if index % 2 else "memo",
+        "code": "A" * (index % 6),
+        "amount": f"{index * 1000:,}円" if index % 11 else "1.0円",
+        "memoized_amount": f"{index % 16:,}円" if index % 13 else "1.0円",
+        "balance": f"{index:,}",
+        "points": f"{index * 10 % 70 - 20}",
+    }
+
+
+ROWS = [row(index) for index in range(200)]
+
+
+def validate(row: dict[str, str]) -> Any:  # noqa: ANN401
+    try:
+        return Statement.model_validate(row)
+    except ValidationError as error:
+        return error.errors(include_url=False, include_context=False)
+
+
+def test_validate_from_threads() -> None:
+    """Shared validators should return the same results from concurrent threads as from one thread."""
+    expected = [validate(row) for row in ROWS]
+    assert any(isinstance(result, Statement) for result in expected)
+    assert any(isinstance(result, list) for result in expected)
+    barrier = threading.Barrier(NUMBER_OF_THREADS)
+    results: list[list[Any]] = []
+
+    def run() -> None:
+        barrier.wait()
+        results.append([validate(row) for _ in range(10) for row in ROWS])
+
+    threads = [threading.Thread(target=run) for _ in range(NUMBER_OF_THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == [expected * 10] * NUMBER_OF_THREADS